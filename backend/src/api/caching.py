@@ -0,0 +1,109 @@
+import hashlib
+import logging
+from typing import Any
+
+from fastapi import Request, Response, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.serialization import dumps_json
+from src.services.orders import get_orders_data_version
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_KEY_PREFIX = "orders:response"
+RESPONSE_CACHE_TTL_SECONDS = 300
+RESPONSE_CACHE_CONTROL = "private, no-cache"
+RESPONSE_MEDIA_TYPE = "application/json"
+
+
+class CachedResponse:
+    def __init__(
+        self,
+        request: Request,
+        redis_client: Redis | None,
+        cache_key: str | None,
+        etag: str | None,
+    ) -> None:
+        self._request = request
+        self._redis_client = redis_client
+        self._cache_key = cache_key
+        self._etag = etag
+        self.hit: Response | None = None
+
+    async def respond(self, payload: Any) -> Response:
+        body = dumps_json(payload)
+        etag = self._etag or _quote_etag(hashlib.sha1(body).hexdigest())
+        if self._cache_key is not None:
+            try:
+                await self._redis_client.set(
+                    self._cache_key,
+                    body.decode("utf-8"),
+                    ex=RESPONSE_CACHE_TTL_SECONDS,
+                )
+            except RedisError:
+                logger.warning("Failed to store response in cache")
+        if _etag_matches(self._request, etag):
+            return _not_modified(etag)
+        return _json_response(body, etag)
+
+
+async def lookup_cached_response(
+    request: Request,
+    redis_client: Redis | None,
+    namespace: str,
+) -> CachedResponse:
+    version = await get_orders_data_version(redis_client)
+    if version is None:
+        return CachedResponse(request, redis_client, cache_key=None, etag=None)
+
+    params = sorted((key, value) for key, value in request.query_params.multi_items() if value)
+    raw = dumps_json([namespace, version, params])
+    digest = hashlib.sha1(raw).hexdigest()
+    etag = _quote_etag(digest)
+    cache_key = f"{RESPONSE_CACHE_KEY_PREFIX}:{namespace}:{digest}"
+    cached = CachedResponse(request, redis_client, cache_key=cache_key, etag=etag)
+
+    if _etag_matches(request, etag):
+        cached.hit = _not_modified(etag)
+        return cached
+    try:
+        body = await redis_client.get(cache_key)
+    except RedisError:
+        logger.warning("Response cache lookup failed")
+        body = None
+    if body is not None:
+        cached.hit = _json_response(body.encode("utf-8"), etag)
+    return cached
+
+
+async def content_etag_response(request: Request, payload: Any) -> Response:
+    cached = CachedResponse(request, redis_client=None, cache_key=None, etag=None)
+    return await cached.respond(payload)
+
+
+def _quote_etag(value: str) -> str:
+    return f'"{value}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL},
+    )
+
+
+def _json_response(body: bytes, etag: str) -> Response:
+    return Response(
+        content=body,
+        media_type=RESPONSE_MEDIA_TYPE,
+        headers={"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL},
+    )
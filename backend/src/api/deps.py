@@ -1,11 +1,13 @@
 from typing import Callable
 
 from fastapi import Depends, HTTPException, Request, WebSocket, WebSocketException, status
+from redis.asyncio import Redis
 
 from src.core.config import settings
 from src.core.sessions import SessionManager
 from src.core.storage import MinioStorage
 from src.models.user import User
+from src.services.orders import ImportScheduler
 from src.services.tax import TaxRateByReportingCodeService, ReportingCodeByCoordinatesService
 
 
@@ -25,6 +27,14 @@ def get_storage(request: Request) -> MinioStorage:
     return request.app.state.storage
 
 
+def get_import_scheduler(request: Request) -> ImportScheduler:
+    return request.app.state.import_scheduler
+
+
+def get_redis_client(request: Request) -> Redis:
+    return request.app.state.redis_client
+
+
 async def get_current_user(
     request: Request,
     session_manager: SessionManager = Depends(get_session_manager),
@@ -3,17 +3,18 @@ import json
 import logging
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import AsyncIterator, Literal
+from typing import Literal
 from uuid import uuid4
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
+    Header,
     HTTPException,
     Query,
     Request,
+    Response,
     UploadFile,
     WebSocket,
     WebSocketDisconnect,
@@ -22,9 +23,13 @@ from fastapi import (
 )
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from redis.asyncio import Redis
 from tortoise.functions import Count, Sum
 
+from src.api.caching import content_etag_response, lookup_cached_response
 from src.api.deps import (
+    get_import_scheduler,
+    get_redis_client,
     get_reporting_code_service,
     get_storage,
     get_tax_rate_service,
@@ -34,6 +39,7 @@ from src.api.deps import (
 from src.core.authorities import EDIT_ORDERS, READ_ORDERS
 from src.core.date_rules import ensure_min_supported_date, ensure_min_supported_datetime
 from src.core.reporting_code import normalize_reporting_code
+from src.core.serialization import send_websocket_json
 from src.core.storage import MinioStorage
 from src.models.file_task import FileTask
 from src.models.order import Order
@@ -42,22 +48,58 @@ from src.schemas.order import (
     FileTaskRead,
     OrderCreateRequest,
     OrderImportTaskCreateResponse,
+    OrderImportTaskRerunResponse,
+    OrderImportTaskRollbackResponse,
+    OrderImportUploadCreateRequest,
+    OrderImportUploadRegisterRequest,
+    OrderImportUploadResponse,
     OrdersListResponse,
     OrdersStatsResponse,
     OrdersStatsSummaryResponse,
+    OrdersTileResponse,
     OrderTaxCalculationResponse,
 )
 from src.services.orders import (
-    FILE_TASK_STATUS_IN_PROGRESS,
+    FILE_TASK_STATUS_QUEUED,
+    IMPORT_ARCHIVE_CONTENT_TYPE,
+    IMPORT_COMPRESSION_CONTENT_TYPES,
+    ImportScheduler,
+    ImportTaskBusyError,
+    ImportTaskNotFoundError,
+    ImportUploadNotFoundError,
+    OrderFingerprintFilter,
+    OrdersCountMode,
+    OrdersCursorError,
+    OrdersExportCompression,
+    OrdersExportFormat,
+    OrdersQueryFilters,
+    OrdersTileError,
+    apply_orders_cursor,
     build_datetime_range,
     build_orders_stats_response,
+    build_orders_tile,
+    bump_orders_data_version,
     compute_order_values,
-    count_csv_rows,
+    count_orders,
+    create_import_upload_target,
+    encode_orders_cursor,
+    find_identical_import_task,
+    inspect_import_upload,
+    negotiate_coordinates_media_type,
+    ORDER_LIST_FIELDS,
+    order_fingerprint,
+    order_list_columns,
+    orders_cursor_columns,
+    orders_export_filename,
+    orders_export_media_type,
     parse_stats_date_param,
-    process_import_task,
-    resume_in_progress_import_tasks,
+    register_import_upload,
+    rerun_import_task,
+    rollback_import_task,
+    stream_order_coordinates,
+    stream_orders_export,
     to_file_task_read,
-    to_order_read,
+    to_order_list_payload,
     to_order_tax_calculation_response,
     to_order_tax_preview_response,
 )
@@ -66,6 +108,8 @@ from src.services.tax import ReportingCodeByCoordinatesService, TaxRateByReporti
 router = APIRouter(prefix="/orders", tags=["orders"])
 logger = logging.getLogger(__name__)
 
+ImportOutputFormat = Literal["csv", "parquet"]
+
 OrdersSortType = Literal[
     "newest",
     "oldest",
@@ -84,7 +128,6 @@ ORDERS_SORT_MAPPING: dict[OrdersSortType, tuple[str, ...]] = {
     "tax_desc": ("-tax_amount", "-id"),
 }
 IMPORT_TASKS_WS_INTERVAL_SECONDS = 0.3
-ORDERS_STREAM_CHUNK_SIZE = 1000
 
 
 def _apply_orders_query_filters(
@@ -140,26 +183,6 @@ def _apply_orders_query_filters(
     return query
 
 
-async def _stream_order_coordinates_ndjson(query) -> AsyncIterator[str]:
-    last_id = 0
-    while True:
-        rows = await query.filter(id__gt=last_id).order_by("id").limit(
-            ORDERS_STREAM_CHUNK_SIZE
-        ).values("id", "latitude", "longitude")
-        if not rows:
-            return
-
-        for row in rows:
-            last_id = int(row["id"])
-            yield json.dumps(
-                {
-                    "lat": float(row["latitude"]),
-                    "lon": float(row["longitude"]),
-                },
-                separators=(",", ":"),
-            ) + "\n"
-
-
 @router.post("", response_model=OrderTaxCalculationResponse)
 async def calculate_order_tax(
     payload: OrderCreateRequest,
@@ -168,6 +191,7 @@ async def calculate_order_tax(
         get_reporting_code_service
     ),
     tax_rate_service: TaxRateByReportingCodeService = Depends(get_tax_rate_service),
+    redis_client: Redis = Depends(get_redis_client),
 ) -> OrderTaxCalculationResponse:
     try:
         computed = compute_order_values(
@@ -190,6 +214,10 @@ async def calculate_order_tax(
         ) from exc
 
     order = await Order.create(user=current_user, **computed)
+    await OrderFingerprintFilter(redis_client=redis_client, user_id=current_user.id).add_many(
+        [order_fingerprint(order.latitude, order.longitude, order.timestamp, order.subtotal)]
+    )
+    await bump_orders_data_version(redis_client)
     return to_order_tax_calculation_response(
         order=order,
         author_login=current_user.login,
@@ -199,63 +227,154 @@ async def calculate_order_tax(
 
 @router.post("/import", response_model=OrderImportTaskCreateResponse)
 async def import_orders_csv(
-    request: Request,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    force: bool = Query(default=False),
+    skip_duplicates: bool = Query(default=False),
+    output: ImportOutputFormat | None = Query(default=None),
     current_user: User = Depends(require_authority(EDIT_ORDERS)),
     storage: MinioStorage = Depends(get_storage),
-    reporting_code_service: ReportingCodeByCoordinatesService = Depends(
-        get_reporting_code_service
-    ),
-    tax_rate_service: TaxRateByReportingCodeService = Depends(get_tax_rate_service),
+    scheduler: ImportScheduler = Depends(get_import_scheduler),
 ) -> OrderImportTaskCreateResponse:
     filename = file.filename or "orders.csv"
     object_name = f"imports/{datetime.utcnow().strftime('%Y%m%d')}/{uuid4().hex}_{filename}"
-    content = await file.read()
-    total_rows = count_csv_rows(content)
+    digest = await asyncio.to_thread(inspect_import_upload, file.file)
+    total_rows = digest.total_rows
+
+    if not force:
+        existing_task = await find_identical_import_task(
+            user_id=current_user.id,
+            content_hash=digest.content_hash,
+        )
+        if existing_task is not None:
+            return OrderImportTaskCreateResponse(
+                task=to_file_task_read(
+                    existing_task,
+                    queue_position=scheduler.queue_positions().get(existing_task.id),
+                ),
+                deduplicated=True,
+            )
 
     await asyncio.to_thread(
-        storage.upload_bytes,
+        storage.upload_stream,
         object_name,
-        content,
-        file.content_type or "text/csv",
+        file.file,
+        digest.size,
+        IMPORT_ARCHIVE_CONTENT_TYPE
+        if digest.is_archive
+        else IMPORT_COMPRESSION_CONTENT_TYPES.get(
+            digest.compression,
+            file.content_type or "text/csv",
+        ),
     )
 
     task = await FileTask.create(
         user=current_user,
         file_path=storage.object_url(object_name),
+        content_hash=digest.content_hash,
+        is_archive=digest.is_archive,
         total_rows=total_rows,
         successful_rows=0,
         failed_rows=0,
-        status=FILE_TASK_STATUS_IN_PROGRESS,
+        skip_duplicates=skip_duplicates,
+        output_format=output,
+        status=FILE_TASK_STATUS_QUEUED,
+    )
+
+    scheduler.submit(task_id=task.id, user_id=current_user.id, total_rows=total_rows)
+    return OrderImportTaskCreateResponse(
+        task=to_file_task_read(task, queue_position=scheduler.queue_positions().get(task.id)),
     )
 
-    background_tasks.add_task(
-        process_import_task,
-        task.id,
+
+@router.post("/import/uploads", response_model=OrderImportUploadResponse)
+async def create_import_upload(
+    payload: OrderImportUploadCreateRequest,
+    current_user: User = Depends(require_authority(EDIT_ORDERS)),
+    storage: MinioStorage = Depends(get_storage),
+) -> OrderImportUploadResponse:
+    target = await asyncio.to_thread(
+        create_import_upload_target,
         storage,
-        reporting_code_service,
-        tax_rate_service,
-        None,
-        request.app.state.redis_client,
+        current_user.id,
+        payload.filename,
+    )
+    return OrderImportUploadResponse(
+        object_name=target.object_name,
+        upload_url=target.upload_url,
+        expires_at=target.expires_at,
+    )
+
+
+@router.post("/import/uploads/register", response_model=OrderImportTaskCreateResponse)
+async def register_import_upload_file(
+    payload: OrderImportUploadRegisterRequest,
+    current_user: User = Depends(require_authority(EDIT_ORDERS)),
+    storage: MinioStorage = Depends(get_storage),
+    scheduler: ImportScheduler = Depends(get_import_scheduler),
+) -> OrderImportTaskCreateResponse:
+    try:
+        task, created = await register_import_upload(
+            storage=storage,
+            scheduler=scheduler,
+            user_id=current_user.id,
+            object_name=payload.object_name,
+            skip_duplicates=payload.skip_duplicates,
+            output_format=payload.output,
+            force=payload.force,
+        )
+    except ImportUploadNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    return OrderImportTaskCreateResponse(
+        task=to_file_task_read(task, queue_position=scheduler.queue_positions().get(task.id)),
+        deduplicated=not created,
     )
-    return OrderImportTaskCreateResponse(task=to_file_task_read(task))
+
+
+def _parse_order_list_fields(fields: str | None) -> tuple[str, ...]:
+    if fields is None:
+        return ORDER_LIST_FIELDS
+    requested = tuple(dict.fromkeys(item.strip() for item in fields.split(",") if item.strip()))
+    unknown = [item for item in requested if item not in ORDER_LIST_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"fields must be a comma-separated subset of: {', '.join(ORDER_LIST_FIELDS)}",
+        )
+    return requested
 
 
 @router.get("", response_model=OrdersListResponse)
 async def list_orders(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1, max_length=512),
     reporting_code: str | None = Query(default=None, min_length=1, max_length=32),
     timestamp_from: datetime | None = Query(default=None),
     timestamp_to: datetime | None = Query(default=None),
     subtotal_min: Decimal | None = Query(default=None, ge=Decimal("0.00")),
     subtotal_max: Decimal | None = Query(default=None, ge=Decimal("0.00")),
     sort: OrdersSortType = Query(default="newest"),
+    count: OrdersCountMode = Query(default="exact"),
+    fields: str | None = Query(default=None, max_length=512),
     _: User = Depends(require_authority(READ_ORDERS)),
-) -> OrdersListResponse:
+    redis_client: Redis = Depends(get_redis_client),
+) -> Response:
+    cached = await lookup_cached_response(request, redis_client, "orders:list")
+    if cached.hit is not None:
+        return cached.hit
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="cursor and offset cannot be combined.",
+        )
+    selected_fields = _parse_order_list_fields(fields)
+
     query = _apply_orders_query_filters(
-        query=Order.all().prefetch_related("user"),
+        query=Order.all(),
         reporting_code=reporting_code,
         timestamp_from=timestamp_from,
         timestamp_to=timestamp_to,
@@ -263,25 +382,60 @@ async def list_orders(
         subtotal_max=subtotal_max,
     )
 
-    total = await query.count()
+    total = await count_orders(
+        query=query,
+        filters=OrdersQueryFilters(
+            reporting_code=reporting_code,
+            timestamp_from=timestamp_from,
+            timestamp_to=timestamp_to,
+            subtotal_min=subtotal_min,
+            subtotal_max=subtotal_max,
+        ),
+        mode=count,
+        redis_client=redis_client,
+    )
     sort_fields = ORDERS_SORT_MAPPING[sort]
-    orders = await query.order_by(*sort_fields).offset(offset).limit(limit)
-
-    return OrdersListResponse(
-        total=total,
-        limit=limit,
-        offset=offset,
-        items=[to_order_read(order) for order in orders],
+    page_query = query
+    if cursor is not None:
+        try:
+            page_query = apply_orders_cursor(query, sort_fields, cursor)
+        except OrdersCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(exc),
+            ) from exc
+    rows = await (
+        page_query.order_by(*sort_fields)
+        .offset(offset)
+        .limit(limit + 1)
+        .values(*order_list_columns(selected_fields, orders_cursor_columns(sort_fields)))
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_orders_cursor(sort_fields, rows[-1])
+
+    return await cached.respond(
+        {
+            "total": total,
+            "total_estimated": count == "estimate",
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "items": [to_order_list_payload(row, selected_fields) for row in rows],
+        }
     )
 
 
 @router.get("/stream/coordinates")
-async def stream_order_coordinates(
+async def get_order_coordinates_stream(
+    request: Request,
     reporting_code: str | None = Query(default=None, min_length=1, max_length=32),
     timestamp_from: datetime | None = Query(default=None),
     timestamp_to: datetime | None = Query(default=None),
     subtotal_min: Decimal | None = Query(default=None, ge=Decimal("0.00")),
     subtotal_max: Decimal | None = Query(default=None, ge=Decimal("0.00")),
+    accept: str | None = Header(default=None),
     _: User = Depends(require_authority(READ_ORDERS)),
 ) -> StreamingResponse:
     query = _apply_orders_query_filters(
@@ -292,14 +446,98 @@ async def stream_order_coordinates(
         subtotal_min=subtotal_min,
         subtotal_max=subtotal_max,
     )
+    media_type = negotiate_coordinates_media_type(accept)
     return StreamingResponse(
-        _stream_order_coordinates_ndjson(query),
-        media_type="application/x-ndjson",
+        stream_order_coordinates(query, media_type, is_disconnected=request.is_disconnected),
+        media_type=media_type,
+        headers={"Vary": "Accept"},
     )
 
 
+@router.get("/export")
+async def export_orders(
+    request: Request,
+    export_format: OrdersExportFormat = Query(default="csv", alias="format"),
+    compression: OrdersExportCompression = Query(default="none"),
+    reporting_code: str | None = Query(default=None, min_length=1, max_length=32),
+    timestamp_from: datetime | None = Query(default=None),
+    timestamp_to: datetime | None = Query(default=None),
+    subtotal_min: Decimal | None = Query(default=None, ge=Decimal("0.00")),
+    subtotal_max: Decimal | None = Query(default=None, ge=Decimal("0.00")),
+    _: User = Depends(require_authority(READ_ORDERS)),
+) -> StreamingResponse:
+    if export_format == "parquet" and compression != "none":
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Parquet exports are already compressed; use compression=none.",
+        )
+    query = _apply_orders_query_filters(
+        query=Order.all(),
+        reporting_code=reporting_code,
+        timestamp_from=timestamp_from,
+        timestamp_to=timestamp_to,
+        subtotal_min=subtotal_min,
+        subtotal_max=subtotal_max,
+    )
+    filename = orders_export_filename(export_format, compression)
+    return StreamingResponse(
+        stream_orders_export(
+            query,
+            export_format=export_format,
+            compression=compression,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type=orders_export_media_type(export_format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/tiles/{z}/{x}/{y}", response_model=OrdersTileResponse)
+async def orders_tile(
+    z: int,
+    x: int,
+    y: int,
+    reporting_code: str | None = Query(default=None, min_length=1, max_length=32),
+    timestamp_from: datetime | None = Query(default=None),
+    timestamp_to: datetime | None = Query(default=None),
+    subtotal_min: Decimal | None = Query(default=None, ge=Decimal("0.00")),
+    subtotal_max: Decimal | None = Query(default=None, ge=Decimal("0.00")),
+    _: User = Depends(require_authority(READ_ORDERS)),
+    redis_client: Redis = Depends(get_redis_client),
+) -> OrdersTileResponse:
+    query = _apply_orders_query_filters(
+        query=Order.all(),
+        reporting_code=reporting_code,
+        timestamp_from=timestamp_from,
+        timestamp_to=timestamp_to,
+        subtotal_min=subtotal_min,
+        subtotal_max=subtotal_max,
+    )
+    try:
+        return await build_orders_tile(
+            query=query,
+            filters=OrdersQueryFilters(
+                reporting_code=reporting_code,
+                timestamp_from=timestamp_from,
+                timestamp_to=timestamp_to,
+                subtotal_min=subtotal_min,
+                subtotal_max=subtotal_max,
+            ),
+            z=z,
+            x=x,
+            y=y,
+            redis_client=redis_client,
+        )
+    except OrdersTileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
+
 @router.get("/stats", response_model=OrdersStatsSummaryResponse)
 async def orders_stats(
+    request: Request,
     from_: date | None = Query(default=None, alias="from"),
     to_: date | None = Query(default=None, alias="to"),
     from_date: str | None = Query(
@@ -311,7 +549,11 @@ async def orders_stats(
         description="Deprecated. Format: YYYY.MM.DD",
     ),
     _: User = Depends(require_authority(READ_ORDERS)),
-) -> OrdersStatsSummaryResponse:
+    redis_client: Redis = Depends(get_redis_client),
+) -> Response:
+    cached = await lookup_cached_response(request, redis_client, "orders:stats")
+    if cached.hit is not None:
+        return cached.hit
     try:
         start_date = from_
         end_date = to_
@@ -358,24 +600,31 @@ async def orders_stats(
     if total_revenue > 0:
         average_tax_percent = (total_tax / total_revenue) * Decimal("100")
 
-    return OrdersStatsSummaryResponse(
-        total_orders=total_orders,
-        total_revenue=float(
-            total_revenue.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        ),
-        total_tax=float(total_tax.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)),
-        average_tax_percent=float(
-            average_tax_percent.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        ),
+    return await cached.respond(
+        OrdersStatsSummaryResponse(
+            total_orders=total_orders,
+            total_revenue=float(
+                total_revenue.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            ),
+            total_tax=float(total_tax.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)),
+            average_tax_percent=float(
+                average_tax_percent.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            ),
+        )
     )
 
 
 @router.get("/stats/daily", response_model=OrdersStatsResponse)
 async def orders_stats_daily(
+    request: Request,
     from_date: str = Query(..., description="Format: YYYY.MM.DD"),
     to_date: str = Query(..., description="Format: YYYY.MM.DD"),
     _: User = Depends(require_authority(READ_ORDERS)),
-) -> OrdersStatsResponse:
+    redis_client: Redis = Depends(get_redis_client),
+) -> Response:
+    cached = await lookup_cached_response(request, redis_client, "orders:stats:daily")
+    if cached.hit is not None:
+        return cached.hit
     try:
         start_date = parse_stats_date_param(name="from_date", value=from_date)
         end_date = parse_stats_date_param(name="to_date", value=to_date)
@@ -393,15 +642,77 @@ async def orders_stats_daily(
 
     start_dt, end_dt_exclusive = build_datetime_range(start_date, end_date)
     orders = await Order.filter(timestamp__gte=start_dt, timestamp__lt=end_dt_exclusive).all()
-    return build_orders_stats_response(start_date=start_date, end_date=end_date, orders=orders)
+    return await cached.respond(
+        build_orders_stats_response(start_date=start_date, end_date=end_date, orders=orders)
+    )
 
 
 @router.get("/import/tasks", response_model=list[FileTaskRead])
 async def list_import_tasks(
+    request: Request,
     _: User = Depends(require_authority(READ_ORDERS)),
-) -> list[FileTaskRead]:
+    scheduler: ImportScheduler = Depends(get_import_scheduler),
+) -> Response:
     tasks = await FileTask.all().order_by("-id")
-    return [to_file_task_read(task) for task in tasks]
+    queue_positions = scheduler.queue_positions()
+    return await content_etag_response(
+        request,
+        [to_file_task_read(task, queue_position=queue_positions.get(task.id)) for task in tasks],
+    )
+
+
+@router.delete(
+    "/import/tasks/{task_id}/orders",
+    response_model=OrderImportTaskRollbackResponse,
+)
+async def rollback_import_task_orders(
+    task_id: int,
+    _: User = Depends(require_authority(EDIT_ORDERS)),
+    redis_client: Redis = Depends(get_redis_client),
+) -> OrderImportTaskRollbackResponse:
+    try:
+        task, deleted_orders = await rollback_import_task(task_id)
+    except ImportTaskNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except ImportTaskBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
+    await bump_orders_data_version(redis_client)
+    return OrderImportTaskRollbackResponse(
+        task=to_file_task_read(task),
+        deleted_orders=deleted_orders,
+    )
+
+
+@router.post("/import/tasks/{task_id}/rerun", response_model=OrderImportTaskRerunResponse)
+async def rerun_import_task_file(
+    task_id: int,
+    _: User = Depends(require_authority(EDIT_ORDERS)),
+    scheduler: ImportScheduler = Depends(get_import_scheduler),
+    redis_client: Redis = Depends(get_redis_client),
+) -> OrderImportTaskRerunResponse:
+    try:
+        task, deleted_orders = await rerun_import_task(task_id, scheduler=scheduler)
+    except ImportTaskNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except ImportTaskBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
+    await bump_orders_data_version(redis_client)
+    return OrderImportTaskRerunResponse(
+        task=to_file_task_read(task, queue_position=scheduler.queue_positions().get(task.id)),
+        deleted_orders=deleted_orders,
+    )
 
 
 @router.websocket("/import/tasks/ws")
@@ -409,10 +720,15 @@ async def import_tasks_websocket(websocket: WebSocket) -> None:
     await websocket.accept()
     try:
         await require_websocket_authority(websocket, READ_ORDERS)
+        scheduler: ImportScheduler = websocket.app.state.import_scheduler
         while True:
             tasks = await FileTask.all().order_by("-id")
-            payload = [to_file_task_read(task).model_dump(mode="json") for task in tasks]
-            await websocket.send_json({"tasks": payload})
+            queue_positions = scheduler.queue_positions()
+            payload = [
+                to_file_task_read(task, queue_position=queue_positions.get(task.id))
+                for task in tasks
+            ]
+            await send_websocket_json(websocket, {"tasks": payload})
             await asyncio.sleep(IMPORT_TASKS_WS_INTERVAL_SECONDS)
     except WebSocketDisconnect:
         return
@@ -431,21 +747,23 @@ async def tax_preview_websocket(websocket: WebSocket) -> None:
             try:
                 payload_raw = await websocket.receive_json()
             except ValueError:
-                await websocket.send_json(
+                await send_websocket_json(
+                    websocket,
                     {
                         "ok": False,
                         "error": {
                             "code": "invalid_json",
                             "detail": "Payload must be valid JSON object.",
                         },
-                    }
+                    },
                 )
                 continue
 
             try:
                 payload = OrderCreateRequest.model_validate(payload_raw)
             except ValidationError as exc:
-                await websocket.send_json(
+                await send_websocket_json(
+                    websocket,
                     {
                         "ok": False,
                         "error": {
@@ -453,7 +771,7 @@ async def tax_preview_websocket(websocket: WebSocket) -> None:
                             "detail": "Payload validation failed.",
                             "fields": json.loads(exc.json()),
                         },
-                    }
+                    },
                 )
                 continue
 
@@ -467,45 +785,49 @@ async def tax_preview_websocket(websocket: WebSocket) -> None:
                     tax_rate_service=tax_rate_service,
                 )
             except ValueError as exc:
-                await websocket.send_json(
+                await send_websocket_json(
+                    websocket,
                     {
                         "ok": False,
                         "error": {
                             "code": "outside_coverage",
                             "detail": str(exc),
                         },
-                    }
+                    },
                 )
                 continue
             except LookupError as exc:
-                await websocket.send_json(
+                await send_websocket_json(
+                    websocket,
                     {
                         "ok": False,
                         "error": {
                             "code": "tax_rate_not_found",
                             "detail": str(exc),
                         },
-                    }
+                    },
                 )
                 continue
             except Exception:
                 logger.exception("Tax preview websocket unexpected error")
-                await websocket.send_json(
+                await send_websocket_json(
+                    websocket,
                     {
                         "ok": False,
                         "error": {
                             "code": "internal_error",
                             "detail": "Unexpected server error.",
                         },
-                    }
+                    },
                 )
                 continue
 
-            await websocket.send_json(
+            await send_websocket_json(
+                websocket,
                 {
                     "ok": True,
-                    "result": to_order_tax_preview_response(computed).model_dump(mode="json"),
-                }
+                    "result": to_order_tax_preview_response(computed),
+                },
             )
     except WebSocketDisconnect:
         return
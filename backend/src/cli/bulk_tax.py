@@ -0,0 +1,178 @@
+import argparse
+import csv
+import io
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.services.orders.compression import detect_import_compression, open_decompressed_stream
+from src.services.orders.importer import ImportRowOutcome, compute_import_row_outcomes
+from src.services.orders.outputs import (
+    IMPORT_OUTPUT_FORMAT_CSV,
+    IMPORT_OUTPUT_FORMAT_PARQUET,
+    IMPORT_OUTPUT_FORMATS,
+    IMPORT_OUTPUT_STATUS_IMPORTED,
+    ImportOutputWriter,
+)
+from src.services.orders.parsing import (
+    ImportColumns,
+    ImportTimestampParser,
+    resolve_import_columns,
+)
+from src.services.tax import build_tax_services_from_static
+from src.services.tax.bootstrap import STATIC_DIR
+
+logger = logging.getLogger("bulk_tax")
+
+BULK_TAX_DEFAULT_CHUNK_ROWS = 20000
+BULK_TAX_PENDING_CHUNKS_PER_WORKER = 2
+BULK_TAX_OUTPUT_KEYS = ("reporting_code", "composite_tax_rate", "tax_amount", "total_amount")
+
+_worker_state: dict[str, Any] = {}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli.bulk_tax",
+        description="Compute NY sales tax for a CSV of orders without the database.",
+    )
+    parser.add_argument("input", type=Path, help="CSV file (.csv, .csv.gz or .csv.zst)")
+    parser.add_argument("output", type=Path, help="Enriched output file")
+    parser.add_argument("--format", choices=IMPORT_OUTPUT_FORMATS, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-rows", type=int, default=BULK_TAX_DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--static-dir", type=Path, default=STATIC_DIR)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    output_format = args.format or (
+        IMPORT_OUTPUT_FORMAT_PARQUET
+        if args.output.suffix == ".parquet"
+        else IMPORT_OUTPUT_FORMAT_CSV
+    )
+    workers = max(1, args.workers)
+    chunk_rows = max(1, args.chunk_rows)
+
+    with args.input.open("rb") as raw_stream:
+        compression = detect_import_compression(raw_stream)
+        text_stream = io.TextIOWrapper(
+            open_decompressed_stream(raw_stream, compression),
+            encoding="utf-8-sig",
+            newline="",
+        )
+        reader = csv.reader(text_stream)
+        fieldnames = next(reader, None)
+        columns = resolve_import_columns(fieldnames)
+        writer = ImportOutputWriter(
+            task_id=None,
+            output_format=output_format,
+            file_path=str(args.output),
+        )
+        writer.set_fieldnames(fieldnames or [])
+        try:
+            status_counts = _run(
+                reader=reader,
+                writer=writer,
+                columns=columns,
+                static_dir=args.static_dir,
+                workers=workers,
+                chunk_rows=chunk_rows,
+            )
+        finally:
+            writer.close()
+
+    logger.info("Wrote %s rows to %s: %s", writer.rows_written, args.output, status_counts)
+    return 0
+
+
+def _run(
+    reader: Iterator[list[str]],
+    writer: ImportOutputWriter,
+    columns: ImportColumns,
+    static_dir: Path,
+    workers: int,
+    chunk_rows: int,
+) -> dict[str, int]:
+    status_counts: dict[str, int] = {}
+    started_at = time.perf_counter()
+    pending: deque[tuple[list[tuple[int, list[str]]], Future]] = deque()
+    max_pending = workers * BULK_TAX_PENDING_CHUNKS_PER_WORKER
+
+    def drain(limit: int) -> None:
+        while len(pending) > limit:
+            chunk, future = pending.popleft()
+            outcomes = future.result()
+            writer.add_batch(chunk, outcomes)
+            for _, computed, failure in outcomes:
+                status = IMPORT_OUTPUT_STATUS_IMPORTED if computed is not None else failure[0]
+                status_counts[status] = status_counts.get(status, 0) + 1
+            elapsed = time.perf_counter() - started_at
+            logger.info(
+                "Processed %s rows (%.0f rows/s)",
+                writer.rows_written,
+                writer.rows_written / elapsed if elapsed > 0 else 0.0,
+            )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(static_dir, columns),
+    ) as executor:
+        for chunk in _iter_chunks(reader, chunk_rows):
+            pending.append((chunk, executor.submit(_compute_chunk, chunk)))
+            drain(max_pending)
+        drain(0)
+    return status_counts
+
+
+def _iter_chunks(
+    reader: Iterator[list[str]],
+    chunk_rows: int,
+) -> Iterator[list[tuple[int, list[str]]]]:
+    chunk: list[tuple[int, list[str]]] = []
+    row_number = 0
+    for row in reader:
+        if not row:
+            continue
+        row_number += 1
+        chunk.append((row_number, row))
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_worker(static_dir: Path, columns: ImportColumns) -> None:
+    reporting_code_service, tax_rate_service = build_tax_services_from_static(static_dir)
+    _worker_state["reporting_code_service"] = reporting_code_service
+    _worker_state["tax_rate_service"] = tax_rate_service
+    _worker_state["columns"] = columns
+    _worker_state["timestamp_parser"] = ImportTimestampParser()
+
+
+def _compute_chunk(indexed_rows: list[tuple[int, list[str]]]) -> list[ImportRowOutcome]:
+    outcomes = compute_import_row_outcomes(
+        indexed_rows,
+        _worker_state["columns"],
+        _worker_state["timestamp_parser"],
+        _worker_state["reporting_code_service"],
+        _worker_state["tax_rate_service"],
+    )
+    return [
+        (
+            row_number,
+            {key: computed[key] for key in BULK_TAX_OUTPUT_KEYS} if computed is not None else None,
+            (failure[0], str(failure[1]), []) if failure is not None else None,
+        )
+        for row_number, computed, failure in outcomes
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterator
+
+from tortoise import Tortoise
+
+from src.api.routes.orders import ORDERS_SORT_MAPPING, _apply_orders_query_filters
+from src.core.database import close_db, init_db
+from src.models.order import Order
+from src.services.orders import (
+    ORDER_LIST_FIELDS,
+    apply_orders_cursor,
+    encode_orders_cursor,
+    order_list_columns,
+    orders_cursor_columns,
+)
+from src.services.orders.tiles import orders_tile_bounds
+
+logger = logging.getLogger("orders_indexes")
+
+ORDERS_BENCHMARK_DEFAULT_ROWS = 1_000_000
+ORDERS_BENCHMARK_REPORTING_CODE_PREFIX = "BENCH"
+ORDERS_BENCHMARK_REPORTING_CODES = 200
+ORDERS_BENCHMARK_PAGE_SIZE = 50
+ORDERS_BENCHMARK_CURSOR_OFFSET = 1000
+ORDERS_BENCHMARK_INDEX_NODES = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+ORDERS_BENCHMARK_TILE = (12, 1206, 1539)
+ORDERS_BENCHMARK_FILTERS: dict[str, dict[str, Any]] = {
+    "none": {},
+    "reporting_code": {"reporting_code": f"{ORDERS_BENCHMARK_REPORTING_CODE_PREFIX}0007"},
+    "timestamp_range": {
+        "timestamp_from": datetime(2025, 3, 1),
+        "timestamp_to": datetime(2025, 3, 8),
+    },
+    "subtotal_range": {"subtotal_min": Decimal("100.00"), "subtotal_max": Decimal("101.00")},
+    "reporting_code_timestamp": {
+        "reporting_code": f"{ORDERS_BENCHMARK_REPORTING_CODE_PREFIX}0007",
+        "timestamp_from": datetime(2025, 3, 1),
+        "timestamp_to": datetime(2025, 6, 1),
+    },
+    "all": {
+        "reporting_code": f"{ORDERS_BENCHMARK_REPORTING_CODE_PREFIX}0007",
+        "timestamp_from": datetime(2025, 3, 1),
+        "timestamp_to": datetime(2025, 6, 1),
+        "subtotal_min": Decimal("50.00"),
+        "subtotal_max": Decimal("250.00"),
+    },
+}
+
+ORDERS_BENCHMARK_SEED_SQL = """
+INSERT INTO "orders" (
+    "latitude", "longitude", "subtotal", "timestamp", "reporting_code", "jurisdictions",
+    "composite_tax_rate", "tax_amount", "total_amount",
+    "state_rate", "county_rate", "city_rate", "special_rates", "created_at"
+)
+SELECT
+    40.5 + random() * 4.5,
+    -79.7 + random() * 7.8,
+    seed.subtotal,
+    TIMESTAMPTZ '2025-01-01' + (seed.g::double precision / {rows}) * INTERVAL '365 days',
+    '{prefix}' || lpad((seed.g % {codes})::text, 4, '0'),
+    '{{}}'::jsonb,
+    seed.rate,
+    round(seed.subtotal * seed.rate, 2),
+    seed.subtotal + round(seed.subtotal * seed.rate, 2),
+    0.04,
+    seed.rate - 0.04,
+    0,
+    0,
+    now()
+FROM (
+    SELECT
+        g,
+        round((1 + random() * 499)::numeric, 2) AS subtotal,
+        (0.04 + (g % 50) / 1000.0)::numeric(7, 5) AS rate
+    FROM generate_series(1, {rows}) AS g
+) AS seed
+"""
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli.orders_indexes",
+        description=(
+            "Seed the orders table and check via EXPLAIN that every list page query "
+            "variant is served by an index. Point POSTGRES_DB at a disposable database."
+        ),
+    )
+    parser.add_argument("--rows", type=int, default=ORDERS_BENCHMARK_DEFAULT_ROWS)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse previously seeded rows")
+    parser.add_argument("--keep", action="store_true", help="Keep seeded rows after the run")
+    parser.add_argument("--analyze", action="store_true", help="Use EXPLAIN ANALYZE")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    return asyncio.run(
+        _run(rows=args.rows, seed=not args.skip_seed, keep=args.keep, analyze=args.analyze)
+    )
+
+
+async def _run(rows: int, seed: bool, keep: bool, analyze: bool) -> int:
+    await init_db()
+    connection = Tortoise.get_connection("default")
+    seeded_after_id: int | None = None
+    try:
+        if seed:
+            seeded_after_id = await _max_order_id(connection)
+            started_at = time.perf_counter()
+            await connection.execute_script(
+                ORDERS_BENCHMARK_SEED_SQL.format(
+                    rows=max(1, rows),
+                    prefix=ORDERS_BENCHMARK_REPORTING_CODE_PREFIX,
+                    codes=ORDERS_BENCHMARK_REPORTING_CODES,
+                )
+            )
+            logger.info("Seeded %s orders in %.1fs", rows, time.perf_counter() - started_at)
+        await connection.execute_script('ANALYZE "orders"')
+
+        queries = await _benchmark_queries()
+        failures = 0
+        used_indexes: set[str] = set()
+        for name, query in queries:
+            plan = await _explain(connection, query, analyze)
+            node_types = [node["Node Type"] for node in _iter_plan_nodes(plan)]
+            seq_scan = any(
+                node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "orders"
+                for node in _iter_plan_nodes(plan)
+            )
+            indexes = sorted(
+                {
+                    node["Index Name"]
+                    for node in _iter_plan_nodes(plan)
+                    if node["Node Type"] in ORDERS_BENCHMARK_INDEX_NODES
+                }
+            )
+            ok = bool(indexes) and not seq_scan
+            failures += not ok
+            used_indexes.update(indexes)
+            logger.info(
+                "%s %-48s cost=%-10s %s%s",
+                "OK  " if ok else "FAIL",
+                name,
+                plan["Total Cost"],
+                ",".join(indexes) or "-",
+                f" time={plan['Actual Total Time']}ms" if analyze else "",
+            )
+            if not ok:
+                logger.info("     plan nodes: %s", " > ".join(node_types))
+
+        logger.info("%s query variants checked, %s without an index", len(queries), failures)
+        unused_indexes = sorted(set(await _orders_indexes(connection)) - used_indexes)
+        logger.info("Indexes not used by any variant: %s", ", ".join(unused_indexes) or "-")
+        return 1 if failures else 0
+    finally:
+        if seeded_after_id is not None and not keep:
+            await connection.execute_query(
+                'DELETE FROM "orders" WHERE "id" > $1 AND "reporting_code" LIKE $2',
+                [seeded_after_id, f"{ORDERS_BENCHMARK_REPORTING_CODE_PREFIX}%"],
+            )
+        await close_db()
+
+
+async def _max_order_id(connection) -> int:
+    rows = await connection.execute_query_dict(
+        'SELECT COALESCE(MAX("id"), 0) AS id FROM "orders"'
+    )
+    return int(rows[0]["id"])
+
+
+async def _orders_indexes(connection) -> list[str]:
+    rows = await connection.execute_query_dict(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'orders'"
+    )
+    return [row["indexname"] for row in rows]
+
+
+async def _benchmark_queries() -> list[tuple[str, Any]]:
+    queries: list[tuple[str, Any]] = []
+    for filter_name, filters in ORDERS_BENCHMARK_FILTERS.items():
+        query = _apply_orders_query_filters(
+            query=Order.all(),
+            reporting_code=filters.get("reporting_code"),
+            timestamp_from=filters.get("timestamp_from"),
+            timestamp_to=filters.get("timestamp_to"),
+            subtotal_min=filters.get("subtotal_min"),
+            subtotal_max=filters.get("subtotal_max"),
+        )
+        for sort, sort_fields in ORDERS_SORT_MAPPING.items():
+            columns = order_list_columns(ORDER_LIST_FIELDS, orders_cursor_columns(sort_fields))
+            page_query = query.order_by(*sort_fields).limit(ORDERS_BENCHMARK_PAGE_SIZE + 1)
+            queries.append((f"list {filter_name} sort={sort}", page_query.values(*columns)))
+
+            anchors = await (
+                query.order_by(*sort_fields)
+                .offset(ORDERS_BENCHMARK_CURSOR_OFFSET)
+                .limit(1)
+                .values(*orders_cursor_columns(sort_fields))
+            )
+            if not anchors:
+                continue
+            cursor_query = apply_orders_cursor(
+                query,
+                sort_fields,
+                encode_orders_cursor(sort_fields, anchors[0]),
+            )
+            queries.append(
+                (
+                    f"list {filter_name} sort={sort} cursor",
+                    cursor_query.order_by(*sort_fields)
+                    .limit(ORDERS_BENCHMARK_PAGE_SIZE + 1)
+                    .values(*columns),
+                )
+            )
+
+    lat_min, lat_max, lon_min, lon_max = orders_tile_bounds(*ORDERS_BENCHMARK_TILE)
+    queries.append(
+        (
+            "tile z={} x={} y={}".format(*ORDERS_BENCHMARK_TILE),
+            Order.filter(
+                latitude__gte=lat_min,
+                latitude__lte=lat_max,
+                longitude__gte=lon_min,
+                longitude__lte=lon_max,
+            ).values("latitude", "longitude", "tax_amount", "total_amount"),
+        )
+    )
+    return queries
+
+
+async def _explain(connection, query, analyze: bool) -> dict[str, Any]:
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    rows = await connection.execute_query_dict(
+        f"EXPLAIN ({options}) {query.sql(params_inline=True)}"
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _iter_plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _iter_plan_nodes(child)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
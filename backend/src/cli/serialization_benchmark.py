@@ -0,0 +1,140 @@
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from src.core.serialization import dumps_json
+from src.schemas.order import OrderListItem, OrdersListResponse
+from src.services.orders import (
+    ORDER_LIST_FIELDS,
+    compute_order_values,
+    order_list_columns,
+    to_order_list_payload,
+)
+from src.services.tax import build_tax_services_from_static
+
+SERIALIZATION_BENCHMARK_DEFAULT_ITEMS = 500
+SERIALIZATION_BENCHMARK_DEFAULT_ROUNDS = 200
+SERIALIZATION_BENCHMARK_BBOX = (40.55, -79.7, 44.95, -73.75)
+SERIALIZATION_BENCHMARK_MAX_ATTEMPTS_PER_ITEM = 20
+
+_orders_list_adapter = TypeAdapter(OrdersListResponse)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli.serialization_benchmark",
+        description="Compare the pydantic and orjson serialization paths of GET /orders.",
+    )
+    parser.add_argument("--items", type=int, default=SERIALIZATION_BENCHMARK_DEFAULT_ITEMS)
+    parser.add_argument("--rounds", type=int, default=SERIALIZATION_BENCHMARK_DEFAULT_ROUNDS)
+    args = parser.parse_args(argv)
+
+    rows = _sample_rows(max(1, args.items))
+    legacy_body = _legacy_page(rows)
+    fast_body = _fast_page(rows)
+    if json.loads(legacy_body) != json.loads(fast_body):
+        print("Serialized bodies differ", file=sys.stderr)
+        return 1
+
+    legacy_ms = _measure(_legacy_page, rows, args.rounds)
+    fast_ms = _measure(_fast_page, rows, args.rounds)
+    print(f"items per page:       {len(rows)}")
+    print(f"response size:        {len(fast_body)} bytes")
+    print(f"pydantic + json:      {legacy_ms:.2f} ms/page")
+    print(f"dicts + orjson:       {fast_ms:.2f} ms/page")
+    print(f"speedup:              {legacy_ms / fast_ms:.1f}x")
+    return 0
+
+
+def _legacy_page(rows: list[dict[str, Any]]) -> bytes:
+    response = OrdersListResponse(
+        total=len(rows),
+        total_estimated=False,
+        limit=len(rows),
+        offset=0,
+        next_cursor=None,
+        items=[
+            OrderListItem(**to_order_list_payload(row, ORDER_LIST_FIELDS)) for row in rows
+        ],
+    )
+    validated = _orders_list_adapter.validate_python(response)
+    content = _orders_list_adapter.dump_python(validated, mode="json", exclude_unset=True)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _fast_page(rows: list[dict[str, Any]]) -> bytes:
+    return dumps_json(
+        {
+            "total": len(rows),
+            "total_estimated": False,
+            "limit": len(rows),
+            "offset": 0,
+            "next_cursor": None,
+            "items": [to_order_list_payload(row, ORDER_LIST_FIELDS) for row in rows],
+        }
+    )
+
+
+def _measure(build: Callable[[list[dict[str, Any]]], bytes], rows, rounds: int) -> float:
+    build(rows)
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        build(rows)
+    return (time.perf_counter() - started_at) * 1000 / max(1, rounds)
+
+
+def _sample_rows(count: int) -> list[dict[str, Any]]:
+    reporting_code_service, tax_rate_service = build_tax_services_from_static()
+    started_at = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    rows = []
+    index = 0
+    while len(rows) < count:
+        if index >= count * SERIALIZATION_BENCHMARK_MAX_ATTEMPTS_PER_ITEM:
+            raise RuntimeError("Too few sample points fall inside New York State coverage.")
+        latitude, longitude = _sample_point(index)
+        index += 1
+        try:
+            computed = compute_order_values(
+                latitude=latitude,
+                longitude=longitude,
+                timestamp=started_at + timedelta(minutes=index),
+                subtotal_raw=Decimal(10 + index % 490) + Decimal("0.45"),
+                reporting_code_service=reporting_code_service,
+                tax_rate_service=tax_rate_service,
+            )
+        except (ValueError, LookupError):
+            continue
+        row: dict[str, Any] = dict.fromkeys(order_list_columns(ORDER_LIST_FIELDS))
+        row.update(computed)
+        order_id = len(rows) + 1
+        row.update(
+            id=order_id,
+            user_id=order_id % 7 or None,
+            user__login=f"user{order_id % 7}" if order_id % 7 else None,
+            created_at=computed["timestamp"] + timedelta(seconds=5),
+        )
+        rows.append(row)
+    return rows
+
+
+def _sample_point(index: int) -> tuple[float, float]:
+    min_lat, min_lon, max_lat, max_lon = SERIALIZATION_BENCHMARK_BBOX
+    return (
+        round(min_lat + (index * 0.6180339887 % 1) * (max_lat - min_lat), 6),
+        round(min_lon + (index * 0.7548776662 % 1) * (max_lon - min_lon), 6),
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
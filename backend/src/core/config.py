@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     postgres_db: str = "app"
     postgres_user: str = "app"
     postgres_password: str = "app"
+    postgres_pool_max_size: int = 20
 
     redis_host: str = "redis"
     redis_port: int = 6379
@@ -39,9 +40,23 @@ class Settings(BaseSettings):
     minio_bucket: str = "order-imports"
     minio_secure: bool = False
     minio_public_base_url: str | None = None
+    minio_region: str = "us-east-1"
+    minio_upload_url_expires_seconds: int = 3600
 
     db_generate_schemas: bool = True
 
+    import_max_concurrent_tasks: int = 2
+    import_small_file_rows: int = 10000
+    import_progress_update_rows: int = 1000
+    import_progress_update_seconds: float = 2.0
+    import_compute_batch_min_rows: int = 200
+    import_compute_batch_max_rows: int = 20000
+    import_compute_batch_target_seconds: float = 0.5
+    import_insert_batch_min_rows: int = 100
+    import_insert_batch_max_rows: int = 5000
+    import_insert_batch_target_seconds: float = 0.25
+    import_buffer_soft_limit_mb: int = 256
+
     bootstrap_admin_login: str | None = None
     bootstrap_admin_password: str | None = None
     bootstrap_admin_full_name: str = "System Admin"
@@ -55,6 +70,7 @@ class Settings(BaseSettings):
         return (
             f"postgres://{user}:{password}@{self.postgres_host}:"
             f"{self.postgres_port}/{self.postgres_db}"
+            f"?maxsize={self.postgres_pool_max_size}"
         )
 
     @property
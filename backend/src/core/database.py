@@ -2,6 +2,51 @@ from tortoise import Tortoise
 
 from src.core.config import settings
 
+SCHEMA_UPGRADE_SQL = """
+ALTER TABLE IF EXISTS "file_tasks"
+    ADD COLUMN IF NOT EXISTS "parent_id" INT,
+    ADD COLUMN IF NOT EXISTS "duplicate_of_id" INT,
+    ADD COLUMN IF NOT EXISTS "content_hash" VARCHAR(64),
+    ADD COLUMN IF NOT EXISTS "is_archive" BOOL NOT NULL DEFAULT False,
+    ADD COLUMN IF NOT EXISTS "archive_members" INT,
+    ADD COLUMN IF NOT EXISTS "duplicate_rows" INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS "skip_duplicates" BOOL NOT NULL DEFAULT False,
+    ADD COLUMN IF NOT EXISTS "force" BOOL NOT NULL DEFAULT False,
+    ADD COLUMN IF NOT EXISTS "ranges" JSONB,
+    ADD COLUMN IF NOT EXISTS "error_counts" JSONB,
+    ADD COLUMN IF NOT EXISTS "error_report_path" VARCHAR(512),
+    ADD COLUMN IF NOT EXISTS "error_message" VARCHAR(512),
+    ADD COLUMN IF NOT EXISTS "output_format" VARCHAR(16),
+    ADD COLUMN IF NOT EXISTS "output_path" VARCHAR(512),
+    ADD COLUMN IF NOT EXISTS "metrics" JSONB;
+ALTER TABLE IF EXISTS "orders"
+    ADD COLUMN IF NOT EXISTS "file_task_id" INT;
+DO $$
+BEGIN
+    IF to_regclass('"file_tasks"') IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'file_tasks_parent_id_fkey'
+    ) THEN
+        ALTER TABLE "file_tasks" ADD CONSTRAINT "file_tasks_parent_id_fkey"
+            FOREIGN KEY ("parent_id") REFERENCES "file_tasks" ("id") ON DELETE CASCADE;
+    END IF;
+    IF to_regclass('"file_tasks"') IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'file_tasks_duplicate_of_id_fkey'
+    ) THEN
+        ALTER TABLE "file_tasks" ADD CONSTRAINT "file_tasks_duplicate_of_id_fkey"
+            FOREIGN KEY ("duplicate_of_id") REFERENCES "file_tasks" ("id") ON DELETE SET NULL;
+    END IF;
+    IF to_regclass('"orders"') IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'orders_file_task_id_fkey'
+    ) THEN
+        ALTER TABLE "orders" ADD CONSTRAINT "orders_file_task_id_fkey"
+            FOREIGN KEY ("file_task_id") REFERENCES "file_tasks" ("id") ON DELETE SET NULL;
+    END IF;
+END $$;
+DROP INDEX IF EXISTS "idx_orders_reporti_98946e";
+DROP INDEX IF EXISTS "idx_orders_reporti_49f46c";
+DROP INDEX IF EXISTS "idx_orders_timesta_1b82ff";
+"""
+
 
 async def init_db() -> None:
     await Tortoise.init(
@@ -17,8 +62,13 @@ async def init_db() -> None:
         },
     )
     if settings.db_generate_schemas:
+        await upgrade_schema()
         await Tortoise.generate_schemas()
 
 
+async def upgrade_schema() -> None:
+    await Tortoise.get_connection("default").execute_script(SCHEMA_UPGRADE_SQL)
+
+
 async def close_db() -> None:
     await Tortoise.close_connections()
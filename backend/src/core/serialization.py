@@ -0,0 +1,24 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import WebSocket
+from pydantic import BaseModel
+
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=JSON_OPTIONS)
+
+
+async def send_websocket_json(websocket: WebSocket, payload: Any) -> None:
+    await websocket.send_text(dumps_json(payload).decode("utf-8"))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
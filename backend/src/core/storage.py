@@ -1,7 +1,10 @@
+from datetime import timedelta
 from io import BytesIO
-from urllib.parse import quote
+from typing import BinaryIO
+from urllib.parse import quote, urlsplit
 
 from minio import Minio
+from minio.error import S3Error
 
 from src.core.config import settings
 
@@ -14,7 +17,18 @@ class MinioStorage:
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_secure,
+            region=settings.minio_region,
         )
+        self._presign_client = self._client
+        if settings.minio_public_base_url:
+            public_url = urlsplit(settings.minio_public_base_url)
+            self._presign_client = Minio(
+                endpoint=public_url.netloc,
+                access_key=settings.minio_access_key,
+                secret_key=settings.minio_secret_key,
+                secure=public_url.scheme == "https",
+                region=settings.minio_region,
+            )
 
     @property
     def bucket(self) -> str:
@@ -41,6 +55,31 @@ class MinioStorage:
         )
         return object_name
 
+    def upload_stream(
+        self,
+        object_name: str,
+        stream: BinaryIO,
+        length: int,
+        content_type: str,
+    ) -> str:
+        self._client.put_object(
+            bucket_name=self._bucket,
+            object_name=object_name,
+            data=stream,
+            length=length,
+            content_type=content_type,
+        )
+        return object_name
+
+    def upload_file(self, object_name: str, file_path: str, content_type: str) -> str:
+        self._client.fput_object(
+            bucket_name=self._bucket,
+            object_name=object_name,
+            file_path=file_path,
+            content_type=content_type,
+        )
+        return object_name
+
     def get_object_bytes(self, object_name: str) -> bytes:
         response = self._client.get_object(self._bucket, object_name)
         try:
@@ -56,6 +95,25 @@ class MinioStorage:
         self._client.fget_object(self._bucket, object_name, file_path)
         return file_path
 
+    def remove_object(self, object_name: str) -> None:
+        self._client.remove_object(self._bucket, object_name)
+
+    def object_size(self, object_name: str) -> int | None:
+        try:
+            stat = self._client.stat_object(self._bucket, object_name)
+        except S3Error as exc:
+            if exc.code in ("NoSuchKey", "NoSuchObject"):
+                return None
+            raise
+        return stat.size
+
+    def presigned_upload_url(self, object_name: str, expires: timedelta) -> str:
+        return self._presign_client.presigned_put_object(
+            bucket_name=self._bucket,
+            object_name=object_name,
+            expires=expires,
+        )
+
     def object_url(self, object_name: str) -> str:
         encoded_segments = [quote(segment, safe="") for segment in object_name.split("/")]
         encoded_object = "/".join(encoded_segments)
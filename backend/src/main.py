@@ -1,5 +1,5 @@
-import asyncio
 from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 
 import redis.asyncio as redis
@@ -13,7 +13,11 @@ from src.core.config import settings
 from src.core.database import close_db, init_db
 from src.core.sessions import SessionManager
 from src.core.storage import MinioStorage
-from src.services.orders import resume_in_progress_import_tasks
+from src.services.orders import (
+    ImportScheduler,
+    resume_in_progress_import_tasks,
+    run_import_task,
+)
 from src.services.tax import build_tax_services_from_database
 
 
@@ -41,22 +45,23 @@ async def lifespan(app: FastAPI):
     ) = await build_tax_services_from_database()
 
     await ensure_bootstrap_admin()
-    app.state.import_workers = await resume_in_progress_import_tasks(
-        storage=app.state.storage,
-        reporting_code_service=app.state.reporting_code_service,
-        tax_rate_service=app.state.tax_rate_service,
-        redis_client=app.state.redis_client,
+    app.state.import_scheduler = ImportScheduler(
+        runner=partial(
+            run_import_task,
+            storage=app.state.storage,
+            reporting_code_service=app.state.reporting_code_service,
+            tax_rate_service=app.state.tax_rate_service,
+            redis_client=app.state.redis_client,
+        ),
+        max_concurrent=settings.import_max_concurrent_tasks,
+        small_file_rows=settings.import_small_file_rows,
     )
+    await resume_in_progress_import_tasks(app.state.import_scheduler)
 
     try:
         yield
     finally:
-        import_workers = getattr(app.state, "import_workers", set())
-        for worker in import_workers:
-            if not worker.done():
-                worker.cancel()
-        if import_workers:
-            await asyncio.gather(*import_workers, return_exceptions=True)
+        await app.state.import_scheduler.shutdown()
         await redis_client.aclose()
         await close_db()
 
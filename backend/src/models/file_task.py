@@ -5,11 +5,37 @@ from tortoise.models import Model
 class FileTask(Model):
     id = fields.IntField(pk=True)
     user = fields.ForeignKeyField("models.User", related_name="file_tasks")
+    parent = fields.ForeignKeyField(
+        "models.FileTask",
+        related_name="children",
+        null=True,
+        on_delete=fields.CASCADE,
+        index=True,
+    )
+    duplicate_of = fields.ForeignKeyField(
+        "models.FileTask",
+        related_name="duplicates",
+        null=True,
+        on_delete=fields.SET_NULL,
+    )
     file_path = fields.CharField(max_length=512)
+    content_hash = fields.CharField(max_length=64, null=True, index=True)
+    is_archive = fields.BooleanField(default=False)
+    archive_members = fields.IntField(null=True)
     total_rows = fields.IntField(default=0)
     successful_rows = fields.IntField(default=0)
     failed_rows = fields.IntField(default=0)
+    duplicate_rows = fields.IntField(default=0)
+    skip_duplicates = fields.BooleanField(default=False)
+    force = fields.BooleanField(default=False)
     status = fields.CharField(max_length=32, index=True)
+    ranges = fields.JSONField(null=True)
+    error_counts = fields.JSONField(null=True)
+    error_report_path = fields.CharField(max_length=512, null=True)
+    error_message = fields.CharField(max_length=512, null=True)
+    output_format = fields.CharField(max_length=16, null=True)
+    output_path = fields.CharField(max_length=512, null=True)
+    metrics = fields.JSONField(null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
@@ -10,13 +10,20 @@ class Order(Model):
         null=True,
         on_delete=fields.SET_NULL,
     )
+    file_task = fields.ForeignKeyField(
+        "models.FileTask",
+        related_name="orders",
+        null=True,
+        on_delete=fields.SET_NULL,
+        index=True,
+    )
 
     latitude = fields.FloatField()
     longitude = fields.FloatField()
     subtotal = fields.DecimalField(max_digits=12, decimal_places=2)
     timestamp = fields.DatetimeField()
 
-    reporting_code = fields.CharField(max_length=32, index=True)
+    reporting_code = fields.CharField(max_length=32)
     jurisdictions = fields.JSONField()
     composite_tax_rate = fields.DecimalField(max_digits=7, decimal_places=5)
     tax_amount = fields.DecimalField(max_digits=12, decimal_places=2)
@@ -32,6 +39,11 @@ class Order(Model):
     class Meta:
         table = "orders"
         indexes = (
-            ("reporting_code", "timestamp"),
-            ("timestamp",),
+            ("timestamp", "id"),
+            ("subtotal", "id"),
+            ("tax_amount", "id"),
+            ("reporting_code", "timestamp", "id"),
+            ("reporting_code", "subtotal", "id"),
+            ("reporting_code", "tax_amount", "id"),
+            ("latitude", "longitude"),
         )
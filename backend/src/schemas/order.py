@@ -1,5 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -54,9 +55,7 @@ class OrderTaxPreviewResponse(BaseModel):
     breakdown: TaxBreakdownResponse
 
 
-class OrderRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class OrderListItem(BaseModel):
     id: int
     author_user_id: int | None
     author_login: str | None
@@ -73,11 +72,49 @@ class OrderRead(BaseModel):
     created_at: datetime
 
 
+class OrderListSparseItem(BaseModel):
+    id: int | None = None
+    author_user_id: int | None = None
+    author_login: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    subtotal: float | None = None
+    timestamp: datetime | None = None
+    reporting_code: str | None = None
+    jurisdictions: dict[str, list[JurisdictionRateItem]] | None = None
+    composite_tax_rate: float | None = None
+    tax_amount: float | None = None
+    total_amount: float | None = None
+    breakdown: TaxBreakdownResponse | None = None
+    created_at: datetime | None = None
+
+
 class OrdersListResponse(BaseModel):
-    total: int
+    total: int | None
+    total_estimated: bool = False
     limit: int
     offset: int
-    items: list[OrderRead]
+    next_cursor: str | None = None
+    items: list[OrderListItem] | list[OrderListSparseItem]
+
+
+class OrdersTileCell(BaseModel):
+    cell_x: int
+    cell_y: int
+    orders: int
+    tax_amount: float
+    total_amount: float
+    latitude: float
+    longitude: float
+
+
+class OrdersTileResponse(BaseModel):
+    z: int
+    x: int
+    y: int
+    grid_size: int
+    total_orders: int
+    cells: list[OrdersTileCell]
 
 
 class OrdersStatsDay(BaseModel):
@@ -103,19 +140,71 @@ class OrdersStatsSummaryResponse(BaseModel):
     average_tax_percent: float
 
 
+class FileTaskMetricsRead(BaseModel):
+    elapsed_seconds: float
+    processed_bytes: int
+    rows_per_second: float
+    bytes_per_second: float
+    stage_seconds: dict[str, float] = Field(default_factory=dict)
+    peak_buffered_rows: int = 0
+    peak_buffer_bytes: int = 0
+    process_rss_bytes: int | None = None
+
+
 class FileTaskRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     user_id: int
+    parent_id: int | None = None
+    duplicate_of_id: int | None = None
     file_path: str
+    is_archive: bool = False
+    archive_members: int | None = None
     total_rows: int
     successful_rows: int
     failed_rows: int
+    duplicate_rows: int = 0
+    skip_duplicates: bool = False
     status: str
+    queue_position: int | None = None
+    error_counts: dict[str, int] = Field(default_factory=dict)
+    error_report_path: str | None = None
+    error_message: str | None = None
+    output_format: str | None = None
+    output_path: str | None = None
+    metrics: FileTaskMetricsRead | None = None
     created_at: datetime
     updated_at: datetime
 
 
 class OrderImportTaskCreateResponse(BaseModel):
     task: FileTaskRead
+    deduplicated: bool = False
+
+
+class OrderImportUploadCreateRequest(BaseModel):
+    filename: str = Field(default="orders.csv", min_length=1, max_length=255)
+
+
+class OrderImportUploadResponse(BaseModel):
+    object_name: str
+    upload_url: str
+    expires_at: datetime
+
+
+class OrderImportUploadRegisterRequest(BaseModel):
+    object_name: str = Field(min_length=1, max_length=1024)
+    skip_duplicates: bool = False
+    force: bool = False
+    output: Literal["csv", "parquet"] | None = None
+
+
+class OrderImportTaskRollbackResponse(BaseModel):
+    task: FileTaskRead
+    deleted_orders: int
+
+
+class OrderImportTaskRerunResponse(BaseModel):
+    task: FileTaskRead
+    deleted_orders: int
@@ -1,14 +1,68 @@
+from src.services.orders.archives import run_import_task
 from src.services.orders.calculator import compute_order_values
+from src.services.orders.compression import (
+    IMPORT_ARCHIVE_CONTENT_TYPE,
+    IMPORT_COMPRESSION_CONTENT_TYPES,
+)
+from src.services.orders.coordinates import (
+    ORDERS_COORDINATES_BINARY_MEDIA_TYPE,
+    negotiate_coordinates_media_type,
+    stream_order_coordinates,
+)
+from src.services.orders.counts import (
+    OrdersCountMode,
+    OrdersQueryFilters,
+    bump_orders_data_version,
+    count_orders,
+    get_orders_data_version,
+)
+from src.services.orders.direct_uploads import (
+    FILE_TASK_STATUS_DEDUPLICATED,
+    ImportUploadTarget,
+    create_import_upload_target,
+    find_identical_import_task,
+    register_import_upload,
+)
+from src.services.orders.duplicates import OrderFingerprintFilter, order_fingerprint
+from src.services.orders.errors import (
+    ImportTaskBusyError,
+    ImportTaskError,
+    ImportTaskNotFoundError,
+    ImportUploadNotFoundError,
+    OrdersCursorError,
+    OrdersTileError,
+)
+from src.services.orders.exports import (
+    OrdersExportCompression,
+    OrdersExportFormat,
+    orders_export_filename,
+    orders_export_media_type,
+    stream_orders_export,
+)
 from src.services.orders.importer import (
     FILE_TASK_STATUS_COMPLETED,
+    FILE_TASK_STATUS_FAILED,
     FILE_TASK_STATUS_IN_PROGRESS,
-    count_csv_rows,
+    FILE_TASK_STATUS_QUEUED,
     process_import_task,
     resume_in_progress_import_tasks,
 )
+from src.services.orders.pagination import (
+    apply_orders_cursor,
+    encode_orders_cursor,
+    orders_cursor_columns,
+)
+from src.services.orders.rollback import (
+    FILE_TASK_STATUS_ROLLED_BACK,
+    rerun_import_task,
+    rollback_import_task,
+)
+from src.services.orders.scheduler import ImportScheduler
 from src.services.orders.serializers import (
     to_file_task_read,
-    to_order_read,
+    ORDER_LIST_FIELDS,
+    order_list_columns,
+    to_order_list_payload,
     to_order_tax_calculation_response,
     to_order_tax_preview_response,
 )
@@ -17,21 +71,73 @@ from src.services.orders.stats import (
     build_orders_stats_response,
     parse_stats_date_param,
 )
+from src.services.orders.streaming import ORDERS_STREAM_CHUNK_SIZE, iter_query_chunks
+from src.services.orders.tiles import build_orders_tile
 from src.services.orders.types import OrderComputedPayload
+from src.services.orders.uploads import (
+    ImportUploadDigest,
+    count_csv_rows,
+    inspect_import_upload,
+)
 
 __all__ = (
     "FILE_TASK_STATUS_COMPLETED",
+    "FILE_TASK_STATUS_DEDUPLICATED",
+    "FILE_TASK_STATUS_FAILED",
     "FILE_TASK_STATUS_IN_PROGRESS",
+    "FILE_TASK_STATUS_QUEUED",
+    "FILE_TASK_STATUS_ROLLED_BACK",
+    "IMPORT_ARCHIVE_CONTENT_TYPE",
+    "IMPORT_COMPRESSION_CONTENT_TYPES",
+    "ImportScheduler",
+    "ImportTaskBusyError",
+    "ImportTaskError",
+    "ImportTaskNotFoundError",
+    "ImportUploadDigest",
+    "ImportUploadNotFoundError",
+    "ImportUploadTarget",
+    "ORDER_LIST_FIELDS",
+    "ORDERS_COORDINATES_BINARY_MEDIA_TYPE",
+    "ORDERS_STREAM_CHUNK_SIZE",
     "OrderComputedPayload",
+    "OrderFingerprintFilter",
+    "OrdersCountMode",
+    "OrdersCursorError",
+    "OrdersExportCompression",
+    "OrdersExportFormat",
+    "OrdersQueryFilters",
+    "OrdersTileError",
+    "apply_orders_cursor",
     "build_datetime_range",
     "build_orders_stats_response",
+    "build_orders_tile",
+    "bump_orders_data_version",
     "compute_order_values",
     "count_csv_rows",
+    "count_orders",
+    "create_import_upload_target",
+    "encode_orders_cursor",
+    "find_identical_import_task",
+    "get_orders_data_version",
+    "inspect_import_upload",
+    "iter_query_chunks",
+    "negotiate_coordinates_media_type",
     "parse_stats_date_param",
+    "order_fingerprint",
+    "order_list_columns",
+    "orders_cursor_columns",
+    "orders_export_filename",
+    "orders_export_media_type",
     "process_import_task",
+    "register_import_upload",
+    "rerun_import_task",
     "resume_in_progress_import_tasks",
+    "run_import_task",
+    "rollback_import_task",
+    "stream_order_coordinates",
+    "stream_orders_export",
     "to_file_task_read",
-    "to_order_read",
+    "to_order_list_payload",
     "to_order_tax_calculation_response",
     "to_order_tax_preview_response",
 )
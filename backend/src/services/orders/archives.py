@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import os
+import tempfile
+import zipfile
+from datetime import datetime
+from pathlib import PurePosixPath
+
+from redis.asyncio import Redis
+
+from src.core.storage import MinioStorage
+from src.models.file_task import FileTask
+from src.services.orders.compression import IMPORT_COMPRESSION_CONTENT_TYPES
+from src.services.orders.direct_uploads import inspect_registered_upload
+from src.services.orders.importer import (
+    FILE_TASK_STATUS_COMPLETED,
+    FILE_TASK_STATUS_FAILED,
+    FILE_TASK_STATUS_IN_PROGRESS,
+    FILE_TASK_STATUS_QUEUED,
+    extract_object_name,
+    process_import_task,
+)
+from src.services.orders.rollback import FILE_TASK_STATUS_ROLLED_BACK
+from src.services.orders.scheduler import ImportScheduler
+from src.services.orders.uploads import ImportUploadDigest, inspect_import_upload
+from src.services.tax import ReportingCodeByCoordinatesService, TaxRateByReportingCodeService
+
+logger = logging.getLogger(__name__)
+
+IMPORT_ARCHIVE_EXPAND_WORKERS = 4
+IMPORT_ARCHIVE_ERROR_MESSAGE_LENGTH = 512
+IMPORT_ARCHIVE_TERMINAL_STATUSES = (
+    FILE_TASK_STATUS_COMPLETED,
+    FILE_TASK_STATUS_FAILED,
+    FILE_TASK_STATUS_ROLLED_BACK,
+)
+
+
+async def run_import_task(
+    task_id: int,
+    storage: MinioStorage,
+    reporting_code_service: ReportingCodeByCoordinatesService,
+    tax_rate_service: TaxRateByReportingCodeService,
+    redis_client: Redis | None = None,
+    scheduler: ImportScheduler | None = None,
+) -> None:
+    task = await FileTask.get_or_none(id=task_id)
+    if task is None:
+        return
+    if task.content_hash is None and not await inspect_registered_upload(task, storage):
+        return
+    if task.is_archive:
+        await expand_import_archive(task=task, storage=storage, scheduler=scheduler)
+        return
+
+    await process_import_task(
+        task_id,
+        storage=storage,
+        reporting_code_service=reporting_code_service,
+        tax_rate_service=tax_rate_service,
+        redis_client=redis_client,
+    )
+    if task.parent_id is not None:
+        await refresh_archive_progress(task.parent_id)
+
+
+async def expand_import_archive(
+    task: FileTask,
+    storage: MinioStorage,
+    scheduler: ImportScheduler | None,
+) -> None:
+    if task.archive_members is not None:
+        await refresh_archive_progress(task.id)
+        return
+    if task.status == FILE_TASK_STATUS_QUEUED:
+        await FileTask.filter(id=task.id).update(status=FILE_TASK_STATUS_IN_PROGRESS)
+
+    object_name = extract_object_name(file_path=task.file_path, bucket=storage.bucket)
+    existing_paths = set(
+        await FileTask.filter(parent_id=task.id).values_list("file_path", flat=True)
+    )
+    temp_file_path: str | None = None
+    members: list[str] = []
+    created_children: list[FileTask] = []
+    member_object_names: list[str] = []
+    try:
+        with tempfile.NamedTemporaryFile(prefix="orders-archive-", delete=False) as tmp_file:
+            temp_file_path = tmp_file.name
+        await asyncio.to_thread(storage.download_object_to_file, object_name, temp_file_path)
+        members = await asyncio.to_thread(_list_archive_members, temp_file_path)
+
+        semaphore = asyncio.Semaphore(IMPORT_ARCHIVE_EXPAND_WORKERS)
+
+        async def expand_member(index: int, member_name: str) -> None:
+            member_object_name = (
+                f"{object_name}.members/{index:04d}_{PurePosixPath(member_name).name}"
+            )
+            member_path = storage.object_url(member_object_name)
+            if member_path in existing_paths:
+                return
+            async with semaphore:
+                member_object_names.append(member_object_name)
+                digest = await asyncio.to_thread(
+                    _upload_archive_member,
+                    temp_file_path,
+                    member_name,
+                    storage,
+                    member_object_name,
+                )
+            child = await FileTask.create(
+                user_id=task.user_id,
+                parent_id=task.id,
+                file_path=member_path,
+                content_hash=digest.content_hash,
+                total_rows=digest.total_rows,
+                successful_rows=0,
+                failed_rows=0,
+                skip_duplicates=task.skip_duplicates,
+                output_format=task.output_format,
+                status=FILE_TASK_STATUS_QUEUED,
+            )
+            created_children.append(child)
+
+        async with asyncio.TaskGroup() as member_tasks:
+            for index, member_name in enumerate(members):
+                member_tasks.create_task(expand_member(index, member_name))
+        logger.info("Import task %s expanded into %s archive members", task.id, len(members))
+    except asyncio.CancelledError:
+        logger.info("Import task %s archive expansion interrupted", task.id)
+        raise
+    except Exception as exc:
+        logger.exception("Import task %s failed to expand archive", task.id)
+        await _fail_archive_expansion(
+            task=task,
+            storage=storage,
+            existing_paths=existing_paths,
+            member_object_names=member_object_names,
+            error=exc,
+        )
+        return
+    finally:
+        if temp_file_path is not None:
+            try:
+                os.remove(temp_file_path)
+            except FileNotFoundError:
+                pass
+
+    await FileTask.filter(id=task.id).update(
+        archive_members=await FileTask.filter(parent_id=task.id).count(),
+    )
+    if scheduler is not None:
+        for child in created_children:
+            scheduler.submit(
+                task_id=child.id,
+                user_id=child.user_id,
+                total_rows=child.total_rows,
+            )
+    await refresh_archive_progress(task.id)
+
+
+async def _fail_archive_expansion(
+    task: FileTask,
+    storage: MinioStorage,
+    existing_paths: set[str],
+    member_object_names: list[str],
+    error: Exception,
+) -> None:
+    while isinstance(error, ExceptionGroup):
+        error = error.exceptions[0]
+    # Children of this attempt were never submitted, so none of them has started.
+    await (
+        FileTask.filter(parent_id=task.id)
+        .exclude(file_path__in=list(existing_paths))
+        .delete()
+    )
+    for member_object_name in member_object_names:
+        try:
+            await asyncio.to_thread(storage.remove_object, member_object_name)
+        except Exception:
+            logger.warning("Failed to remove archive member object %s", member_object_name)
+    await FileTask.filter(id=task.id).update(
+        status=FILE_TASK_STATUS_FAILED,
+        error_message=f"Failed to expand archive: {error}"[:IMPORT_ARCHIVE_ERROR_MESSAGE_LENGTH],
+        updated_at=datetime.utcnow(),
+    )
+
+
+async def refresh_archive_progress(parent_id: int) -> None:
+    parent = await FileTask.get_or_none(id=parent_id)
+    if parent is None:
+        return
+    children = await FileTask.filter(parent_id=parent_id).values(
+        "total_rows",
+        "successful_rows",
+        "failed_rows",
+        "duplicate_rows",
+        "error_counts",
+        "status",
+    )
+    error_counts: dict[str, int] = {}
+    for child in children:
+        for reason, count in (child["error_counts"] or {}).items():
+            error_counts[reason] = error_counts.get(reason, 0) + count
+
+    finished = parent.archive_members is not None and all(
+        child["status"] in IMPORT_ARCHIVE_TERMINAL_STATUSES for child in children
+    )
+    if not finished:
+        status = FILE_TASK_STATUS_IN_PROGRESS
+    elif any(child["status"] == FILE_TASK_STATUS_FAILED for child in children):
+        status = FILE_TASK_STATUS_FAILED
+    else:
+        status = FILE_TASK_STATUS_COMPLETED
+    await FileTask.filter(id=parent_id).update(
+        total_rows=sum(child["total_rows"] for child in children),
+        successful_rows=sum(child["successful_rows"] for child in children),
+        failed_rows=sum(child["failed_rows"] for child in children),
+        duplicate_rows=sum(child["duplicate_rows"] for child in children),
+        error_counts=error_counts,
+        status=status,
+        updated_at=datetime.utcnow(),
+    )
+
+
+def _list_archive_members(archive_path: str) -> list[str]:
+    with zipfile.ZipFile(archive_path) as archive:
+        return [
+            info.filename
+            for info in archive.infolist()
+            if not info.is_dir()
+            and not info.filename.startswith("__MACOSX/")
+            and not PurePosixPath(info.filename).name.startswith(".")
+        ]
+
+
+def _upload_archive_member(
+    archive_path: str,
+    member_name: str,
+    storage: MinioStorage,
+    object_name: str,
+) -> ImportUploadDigest:
+    with zipfile.ZipFile(archive_path) as archive, archive.open(member_name) as member:
+        digest = inspect_import_upload(member)
+        storage.upload_stream(
+            object_name,
+            member,
+            digest.size,
+            IMPORT_COMPRESSION_CONTENT_TYPES.get(digest.compression, "text/csv"),
+        )
+    return digest
@@ -0,0 +1,102 @@
+import os
+from dataclasses import dataclass
+from typing import Callable
+
+from src.core.config import settings
+
+BATCH_SIZER_MAX_GROWTH = 1.5
+BATCH_SIZER_MAX_SHRINK = 0.5
+BATCH_SIZER_SMOOTHING = 0.5
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as stream:
+            resident_pages = int(stream.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * _PAGE_SIZE
+
+
+class AdaptiveBatchSizer:
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_seconds: float,
+        memory_limit_bytes: int | None = None,
+        buffered_bytes: Callable[[], int] | None = None,
+    ) -> None:
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._target_seconds = target_seconds
+        self._memory_limit_bytes = memory_limit_bytes
+        self._buffered_bytes = buffered_bytes
+        self._size = self._clamp(initial)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, rows: int, seconds: float) -> int:
+        if rows <= 0:
+            return self._size
+
+        if (
+            self._memory_limit_bytes is not None
+            and self._buffered_bytes is not None
+            and self._buffered_bytes() >= self._memory_limit_bytes
+        ):
+            self._size = self._clamp(self._size * BATCH_SIZER_MAX_SHRINK)
+            return self._size
+
+        if seconds <= 0:
+            ratio = BATCH_SIZER_MAX_GROWTH
+        else:
+            ratio = self._target_seconds / seconds
+        ratio = min(max(ratio, BATCH_SIZER_MAX_SHRINK), BATCH_SIZER_MAX_GROWTH)
+        proposed = rows * ratio
+        if rows < self._size and proposed < self._size:
+            return self._size
+        self._size = self._clamp(
+            self._size + (proposed - self._size) * BATCH_SIZER_SMOOTHING,
+        )
+        return self._size
+
+    def _clamp(self, value: float) -> int:
+        return int(min(max(round(value), self._minimum), self._maximum))
+
+
+@dataclass(frozen=True)
+class ImportBatchSizers:
+    compute: AdaptiveBatchSizer
+    insert: AdaptiveBatchSizer
+
+
+def create_import_batch_sizers(
+    compute_initial: int,
+    insert_initial: int,
+    buffered_bytes: Callable[[], int] | None = None,
+) -> ImportBatchSizers:
+    memory_limit_bytes = settings.import_buffer_soft_limit_mb * 1024 * 1024
+    return ImportBatchSizers(
+        compute=AdaptiveBatchSizer(
+            initial=compute_initial,
+            minimum=settings.import_compute_batch_min_rows,
+            maximum=settings.import_compute_batch_max_rows,
+            target_seconds=settings.import_compute_batch_target_seconds,
+            memory_limit_bytes=memory_limit_bytes,
+            buffered_bytes=buffered_bytes,
+        ),
+        insert=AdaptiveBatchSizer(
+            initial=insert_initial,
+            minimum=settings.import_insert_batch_min_rows,
+            maximum=settings.import_insert_batch_max_rows,
+            target_seconds=settings.import_insert_batch_target_seconds,
+            memory_limit_bytes=memory_limit_bytes,
+            buffered_bytes=buffered_bytes,
+        ),
+    )
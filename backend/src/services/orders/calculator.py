@@ -13,10 +13,40 @@ def compute_order_values(
     reporting_code_service: ReportingCodeByCoordinatesService,
     tax_rate_service: TaxRateByReportingCodeService,
 ) -> OrderComputedPayload:
+    reporting_code = resolve_reporting_code(
+        latitude=latitude,
+        longitude=longitude,
+        reporting_code_service=reporting_code_service,
+    )
+    return compute_order_values_for_reporting_code(
+        latitude=latitude,
+        longitude=longitude,
+        timestamp=timestamp,
+        subtotal_raw=subtotal_raw,
+        reporting_code=reporting_code,
+        tax_rate_service=tax_rate_service,
+    )
+
+
+def resolve_reporting_code(
+    latitude: float,
+    longitude: float,
+    reporting_code_service: ReportingCodeByCoordinatesService,
+) -> str:
     reporting_code = reporting_code_service.get_reporting_code(lat=latitude, lon=longitude)
     if reporting_code is None:
         raise ValueError("Delivery point is outside New York State coverage.")
+    return reporting_code
 
+
+def compute_order_values_for_reporting_code(
+    latitude: float,
+    longitude: float,
+    timestamp: datetime,
+    subtotal_raw: Decimal,
+    reporting_code: str,
+    tax_rate_service: TaxRateByReportingCodeService,
+) -> OrderComputedPayload:
     rates = tax_rate_service.get_tax_rate_breakdown(reporting_code)
     if rates is None:
         raise LookupError(f"Tax rate not found for reporting code {reporting_code}.")
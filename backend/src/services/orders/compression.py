@@ -0,0 +1,62 @@
+import gzip
+import io
+from typing import BinaryIO
+
+import zstandard
+
+IMPORT_COMPRESSION_GZIP = "gzip"
+IMPORT_COMPRESSION_ZSTD = "zstd"
+IMPORT_COMPRESSION_CONTENT_TYPES = {
+    IMPORT_COMPRESSION_GZIP: "application/gzip",
+    IMPORT_COMPRESSION_ZSTD: "application/zstd",
+}
+IMPORT_ARCHIVE_CONTENT_TYPE = "application/zip"
+IMPORT_DECOMPRESS_READ_BYTES = 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+IMPORT_HEADER_BYTES = max(len(_GZIP_MAGIC), len(_ZSTD_MAGIC), len(_ZIP_MAGIC))
+
+
+def detect_import_compression(stream: BinaryIO) -> str | None:
+    position = stream.tell()
+    header = stream.read(IMPORT_HEADER_BYTES)
+    stream.seek(position)
+    return compression_from_header(header)
+
+
+def compression_from_header(header: bytes) -> str | None:
+    if header.startswith(_GZIP_MAGIC):
+        return IMPORT_COMPRESSION_GZIP
+    if header.startswith(_ZSTD_MAGIC):
+        return IMPORT_COMPRESSION_ZSTD
+    return None
+
+
+def is_import_archive(stream: BinaryIO) -> bool:
+    position = stream.tell()
+    header = stream.read(IMPORT_HEADER_BYTES)
+    stream.seek(position)
+    return is_archive_header(header)
+
+
+def is_archive_header(header: bytes) -> bool:
+    return header.startswith(_ZIP_MAGIC)
+
+
+def open_decompressed_stream(stream: BinaryIO, compression: str | None) -> BinaryIO:
+    if compression is None:
+        return stream
+    if compression == IMPORT_COMPRESSION_GZIP:
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == IMPORT_COMPRESSION_ZSTD:
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            stream,
+            read_size=IMPORT_DECOMPRESS_READ_BYTES,
+            closefd=False,
+        )
+        return io.BufferedReader(reader, buffer_size=IMPORT_DECOMPRESS_READ_BYTES)
+    raise ValueError(f"Unsupported import compression: {compression}")
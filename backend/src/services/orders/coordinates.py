@@ -0,0 +1,57 @@
+import sys
+from array import array
+from typing import AsyncIterator, Callable
+
+from src.core.serialization import dumps_json
+from src.services.orders.streaming import (
+    ORDERS_STREAM_CHUNK_SIZE,
+    DisconnectCheck,
+    iter_query_chunks,
+)
+
+ORDERS_COORDINATES_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ORDERS_COORDINATES_BINARY_MEDIA_TYPE = "application/vnd.ny-taxes.coordinates.f32"
+
+CoordinateRow = tuple[float, float]
+
+
+def negotiate_coordinates_media_type(accept: str | None) -> str:
+    if not accept:
+        return ORDERS_COORDINATES_NDJSON_MEDIA_TYPE
+    offered = {item.split(";", 1)[0].strip().lower() for item in accept.split(",")}
+    if ORDERS_COORDINATES_BINARY_MEDIA_TYPE in offered:
+        return ORDERS_COORDINATES_BINARY_MEDIA_TYPE
+    return ORDERS_COORDINATES_NDJSON_MEDIA_TYPE
+
+
+def encode_coordinates_ndjson(rows: list[CoordinateRow]) -> bytes:
+    return b"".join(
+        dumps_json({"lat": float(lat), "lon": float(lon)}) + b"\n" for lat, lon in rows
+    )
+
+
+def encode_coordinates_binary(rows: list[CoordinateRow]) -> bytes:
+    header = array("I", [len(rows)])
+    points = array("f", [value for lat, lon in rows for value in (lat, lon)])
+    if sys.byteorder != "little":
+        header.byteswap()
+        points.byteswap()
+    return header.tobytes() + points.tobytes()
+
+
+async def stream_order_coordinates(
+    query,
+    media_type: str,
+    is_disconnected: DisconnectCheck | None = None,
+) -> AsyncIterator[bytes]:
+    encode: Callable[[list[CoordinateRow]], bytes] = (
+        encode_coordinates_binary
+        if media_type == ORDERS_COORDINATES_BINARY_MEDIA_TYPE
+        else encode_coordinates_ndjson
+    )
+    async for rows in iter_query_chunks(
+        query.values_list("latitude", "longitude"),
+        chunk_size=ORDERS_STREAM_CHUNK_SIZE,
+        is_disconnected=is_disconnected,
+    ):
+        yield encode(rows)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.reporting_code import normalize_reporting_code
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+ORDERS_DATA_VERSION_KEY = "orders:data-version"
+ORDERS_COUNT_CACHE_KEY_PREFIX = "orders:count"
+ORDERS_COUNT_CACHE_TTL_SECONDS = 60
+
+OrdersCountMode = Literal["exact", "estimate", "none"]
+
+
+@dataclass(frozen=True)
+class OrdersQueryFilters:
+    reporting_code: str | None = None
+    timestamp_from: datetime | None = None
+    timestamp_to: datetime | None = None
+    subtotal_min: Decimal | None = None
+    subtotal_max: Decimal | None = None
+
+    def cache_key(self) -> str:
+        payload = asdict(self)
+        if self.reporting_code is not None:
+            payload["reporting_code"] = normalize_reporting_code(self.reporting_code)
+        for name in ("timestamp_from", "timestamp_to"):
+            if payload[name] is not None:
+                payload[name] = payload[name].isoformat()
+        for name in ("subtotal_min", "subtotal_max"):
+            if payload[name] is not None:
+                payload[name] = str(payload[name].normalize())
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+async def get_orders_data_version(redis_client: Redis | None) -> str | None:
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(ORDERS_DATA_VERSION_KEY) or "0"
+    except RedisError:
+        logger.warning("Failed to read orders data version")
+        return None
+
+
+async def bump_orders_data_version(redis_client: Redis | None) -> None:
+    if redis_client is None:
+        return
+    try:
+        await redis_client.incr(ORDERS_DATA_VERSION_KEY)
+    except RedisError:
+        logger.warning("Failed to bump orders data version")
+
+
+async def count_orders(
+    query,
+    filters: OrdersQueryFilters,
+    mode: OrdersCountMode,
+    redis_client: Redis | None,
+) -> int | None:
+    if mode == "none":
+        return None
+    if mode == "estimate":
+        return await _estimate_orders_count(query)
+
+    cache_key: str | None = None
+    if redis_client is not None:
+        try:
+            version = await redis_client.get(ORDERS_DATA_VERSION_KEY) or "0"
+            cache_key = f"{ORDERS_COUNT_CACHE_KEY_PREFIX}:{version}:{filters.cache_key()}"
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return int(cached)
+        except RedisError:
+            logger.warning("Orders count cache lookup failed")
+            cache_key = None
+
+    total = await query.count()
+    if cache_key is not None:
+        try:
+            await redis_client.set(cache_key, total, ex=ORDERS_COUNT_CACHE_TTL_SECONDS)
+        except RedisError:
+            logger.warning("Failed to store orders count in cache")
+    return total
+
+
+async def _estimate_orders_count(query) -> int:
+    rows = await Order._meta.db.execute_query_dict(
+        f"EXPLAIN (FORMAT JSON) {query.sql(params_inline=True)}"
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
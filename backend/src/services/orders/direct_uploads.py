@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import PurePosixPath
+from uuid import uuid4
+
+from src.core.config import settings
+from src.core.storage import MinioStorage
+from src.models.file_task import FileTask
+from src.services.orders.errors import ImportUploadNotFoundError
+from src.services.orders.importer import (
+    FILE_TASK_STATUS_FAILED,
+    FILE_TASK_STATUS_QUEUED,
+    extract_object_name,
+)
+from src.services.orders.rollback import FILE_TASK_STATUS_ROLLED_BACK
+from src.services.orders.scheduler import ImportScheduler
+from src.services.orders.uploads import (
+    ImportUploadDigest,
+    estimate_import_rows,
+    inspect_import_stream,
+)
+
+logger = logging.getLogger(__name__)
+
+IMPORT_DIRECT_UPLOAD_PREFIX = "uploads"
+FILE_TASK_STATUS_DEDUPLICATED = "deduplicated"
+IMPORT_REUSABLE_TASK_EXCLUDED_STATUSES = (
+    FILE_TASK_STATUS_ROLLED_BACK,
+    FILE_TASK_STATUS_FAILED,
+    FILE_TASK_STATUS_DEDUPLICATED,
+)
+
+
+@dataclass(frozen=True)
+class ImportUploadTarget:
+    object_name: str
+    upload_url: str
+    expires_at: datetime
+
+
+def import_upload_prefix(user_id: int) -> str:
+    return f"{IMPORT_DIRECT_UPLOAD_PREFIX}/{user_id}/"
+
+
+def create_import_upload_target(
+    storage: MinioStorage,
+    user_id: int,
+    filename: str,
+) -> ImportUploadTarget:
+    expires = timedelta(seconds=settings.minio_upload_url_expires_seconds)
+    safe_filename = PurePosixPath(filename).name or "orders.csv"
+    object_name = f"{import_upload_prefix(user_id)}{uuid4().hex}_{safe_filename}"
+    return ImportUploadTarget(
+        object_name=object_name,
+        upload_url=storage.presigned_upload_url(object_name, expires),
+        expires_at=datetime.utcnow() + expires,
+    )
+
+
+async def find_identical_import_task(
+    user_id: int,
+    content_hash: str,
+    exclude_task_id: int | None = None,
+) -> FileTask | None:
+    query = FileTask.filter(user_id=user_id, content_hash=content_hash).exclude(
+        status__in=IMPORT_REUSABLE_TASK_EXCLUDED_STATUSES
+    )
+    if exclude_task_id is not None:
+        query = query.exclude(id=exclude_task_id)
+    return await query.order_by("-id").first()
+
+
+async def register_import_upload(
+    storage: MinioStorage,
+    scheduler: ImportScheduler,
+    user_id: int,
+    object_name: str,
+    skip_duplicates: bool,
+    output_format: str | None = None,
+    force: bool = False,
+) -> tuple[FileTask, bool]:
+    if not object_name.startswith(import_upload_prefix(user_id)) or ".." in object_name:
+        raise ImportUploadNotFoundError(f"Upload {object_name} not found.")
+
+    file_path = storage.object_url(object_name)
+    existing_task = await FileTask.filter(user_id=user_id, file_path=file_path).first()
+    if existing_task is not None:
+        return existing_task, False
+
+    size = await asyncio.to_thread(storage.object_size, object_name)
+    if size is None:
+        raise ImportUploadNotFoundError(f"Upload {object_name} not found.")
+
+    task = await FileTask.create(
+        user_id=user_id,
+        file_path=file_path,
+        total_rows=0,
+        successful_rows=0,
+        failed_rows=0,
+        skip_duplicates=skip_duplicates,
+        force=force,
+        output_format=output_format,
+        status=FILE_TASK_STATUS_QUEUED,
+    )
+    scheduler.submit(task_id=task.id, user_id=user_id, total_rows=estimate_import_rows(size))
+    return task, True
+
+
+async def inspect_registered_upload(task: FileTask, storage: MinioStorage) -> bool:
+    object_name = extract_object_name(file_path=task.file_path, bucket=storage.bucket)
+    try:
+        digest = await asyncio.to_thread(_inspect_object, storage, object_name)
+    except Exception:
+        logger.exception("Import task %s failed to inspect uploaded object", task.id)
+        task.status = FILE_TASK_STATUS_FAILED
+        await task.save(update_fields=["status", "updated_at"])
+        return False
+
+    task.content_hash = digest.content_hash
+    task.total_rows = digest.total_rows
+    task.is_archive = digest.is_archive
+    update_fields = ["content_hash", "total_rows", "is_archive", "updated_at"]
+    existing_task = (
+        None
+        if task.force or task.parent_id is not None
+        else await find_identical_import_task(
+            user_id=task.user_id,
+            content_hash=digest.content_hash,
+            exclude_task_id=task.id,
+        )
+    )
+    if existing_task is not None:
+        logger.info("Import task %s duplicates import task %s", task.id, existing_task.id)
+        task.duplicate_of_id = existing_task.id
+        task.status = FILE_TASK_STATUS_DEDUPLICATED
+        update_fields += ["duplicate_of_id", "status"]
+    await task.save(update_fields=update_fields)
+    return existing_task is None
+
+
+def _inspect_object(storage: MinioStorage, object_name: str) -> ImportUploadDigest:
+    response = storage.get_object_stream(object_name)
+    try:
+        return inspect_import_stream(response)
+    finally:
+        response.close()
+        response.release_conn()
@@ -0,0 +1,267 @@
+import asyncio
+import hashlib
+import logging
+import math
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.models.order import Order
+from src.services.orders.parsing import ImportColumns, ImportTimestampParser, parse_import_rows
+
+logger = logging.getLogger(__name__)
+
+ORDER_FINGERPRINT_FILTER_KEY_PREFIX = "order-fingerprints:v1"
+ORDER_FINGERPRINT_FILTER_INITIAL_CAPACITY = 1_000_000
+ORDER_FINGERPRINT_FILTER_ERROR_RATE = 0.001
+ORDER_FINGERPRINT_FILTER_GROWTH = 2
+ORDER_FINGERPRINT_FILTER_TIGHTENING = 0.5
+ORDER_FINGERPRINT_FILTER_SEED_BATCH_SIZE = 10_000
+ORDER_FINGERPRINT_FILTER_SEED_LOCK_SECONDS = 600
+ORDER_DUPLICATE_CONFIRM_BATCH_SIZE = 1000
+
+OrderFingerprintValues = tuple[float, float, datetime, Decimal]
+
+
+def order_fingerprint(
+    latitude: float,
+    longitude: float,
+    timestamp: datetime,
+    subtotal: Decimal,
+) -> bytes:
+    subtotal = subtotal.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    normalized_timestamp = timestamp.astimezone(timezone.utc).isoformat()
+    raw = f"{latitude!r}|{longitude!r}|{normalized_timestamp}|{subtotal}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+class _BloomLayer:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.capacity = ORDER_FINGERPRINT_FILTER_INITIAL_CAPACITY * (
+            ORDER_FINGERPRINT_FILTER_GROWTH**index
+        )
+        error_rate = ORDER_FINGERPRINT_FILTER_ERROR_RATE * (
+            ORDER_FINGERPRINT_FILTER_TIGHTENING**index
+        )
+        self.bits = math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+
+    def positions(self, fingerprint: bytes) -> list[int]:
+        first = int.from_bytes(fingerprint[:8], "big")
+        second = int.from_bytes(fingerprint[8:], "big") | 1
+        return [(first + idx * second) % self.bits for idx in range(self.hashes)]
+
+
+class OrderFingerprintFilter:
+    def __init__(self, redis_client: Redis, user_id: int) -> None:
+        self._redis = redis_client
+        self._user_id = user_id
+        self._key = f"{ORDER_FINGERPRINT_FILTER_KEY_PREFIX}:{user_id}"
+        self._counts_key = f"{self._key}:counts"
+        self._seeded_key = f"{self._key}:seeded"
+        self._seed_lock_key = f"{self._key}:seeding"
+        self._seeded = False
+
+    async def ensure_seeded(self) -> bool:
+        if self._seeded:
+            return True
+        try:
+            if await self._redis.exists(self._seeded_key):
+                self._seeded = True
+                return True
+            acquired = await self._redis.set(
+                self._seed_lock_key,
+                "1",
+                nx=True,
+                ex=ORDER_FINGERPRINT_FILTER_SEED_LOCK_SECONDS,
+            )
+            if not acquired:
+                return False
+            try:
+                seeded_rows = await self._seed_from_orders()
+                await self._redis.set(self._seeded_key, "1")
+            finally:
+                await self._redis.delete(self._seed_lock_key)
+        except RedisError:
+            logger.warning("Failed to seed order fingerprint filter for user %s", self._user_id)
+            return False
+        logger.info(
+            "Seeded order fingerprint filter for user %s with %s orders",
+            self._user_id,
+            seeded_rows,
+        )
+        self._seeded = True
+        return True
+
+    async def contains_many(self, fingerprints: list[bytes]) -> list[bool]:
+        if not fingerprints:
+            return []
+        if not await self.ensure_seeded():
+            return [True] * len(fingerprints)
+        try:
+            layers = await self._load_layers()
+            found = [False] * len(fingerprints)
+            for layer in layers:
+                pending = [idx for idx, hit in enumerate(found) if not hit]
+                if not pending:
+                    break
+                arguments: list[str | int] = []
+                for idx in pending:
+                    for position in layer.positions(fingerprints[idx]):
+                        arguments.extend(("GET", "u1", position))
+                bits = await self._redis.execute_command(
+                    "BITFIELD",
+                    self._layer_key(layer),
+                    *arguments,
+                )
+                for offset, idx in enumerate(pending):
+                    start = offset * layer.hashes
+                    if all(bits[start : start + layer.hashes]):
+                        found[idx] = True
+            return found
+        except RedisError:
+            logger.warning("Order fingerprint filter lookup failed, confirming every row in the DB")
+            return [True] * len(fingerprints)
+
+    async def add_many(self, fingerprints: list[bytes]) -> None:
+        if not fingerprints:
+            return
+        try:
+            await self._record(fingerprints)
+        except RedisError:
+            logger.warning("Failed to record order fingerprints in redis")
+
+    async def _record(self, fingerprints: list[bytes]) -> None:
+        layers = await self._load_layers()
+        layer = layers[-1]
+        arguments: list[str | int] = []
+        for fingerprint in fingerprints:
+            for position in layer.positions(fingerprint):
+                arguments.extend(("SET", "u1", position, 1))
+        await self._redis.execute_command("BITFIELD", self._layer_key(layer), *arguments)
+        count = await self._redis.hincrby(self._counts_key, str(layer.index), len(fingerprints))
+        if count >= layer.capacity:
+            await self._redis.hsetnx(self._counts_key, str(layer.index + 1), 0)
+
+    async def _seed_from_orders(self) -> int:
+        seeded_rows = 0
+        last_id = 0
+        while True:
+            rows = await (
+                Order.filter(user_id=self._user_id, id__gt=last_id)
+                .order_by("id")
+                .limit(ORDER_FINGERPRINT_FILTER_SEED_BATCH_SIZE)
+                .values_list("id", "latitude", "longitude", "timestamp", "subtotal")
+            )
+            if not rows:
+                return seeded_rows
+            await self._record([order_fingerprint(*row[1:]) for row in rows])
+            seeded_rows += len(rows)
+            last_id = rows[-1][0]
+
+    async def _load_layers(self) -> list[_BloomLayer]:
+        raw_counts = await self._redis.hkeys(self._counts_key)
+        indexes = sorted(int(item) for item in raw_counts)
+        if not indexes:
+            await self._redis.hsetnx(self._counts_key, "0", 0)
+            indexes = [0]
+        return [_BloomLayer(index) for index in indexes]
+
+    def _layer_key(self, layer: _BloomLayer) -> str:
+        return f"{self._key}:{layer.index}"
+
+
+async def find_existing_orders(
+    user_id: int,
+    candidates: list[OrderFingerprintValues],
+) -> set[int]:
+    existing: set[int] = set()
+    db = Order._meta.db
+    for chunk_start in range(0, len(candidates), ORDER_DUPLICATE_CONFIRM_BATCH_SIZE):
+        chunk = candidates[chunk_start : chunk_start + ORDER_DUPLICATE_CONFIRM_BATCH_SIZE]
+        values: list[object] = [user_id]
+        rows_sql: list[str] = []
+        for offset, (latitude, longitude, timestamp, subtotal) in enumerate(chunk):
+            base = len(values)
+            rows_sql.append(
+                f"(${base + 1}::int, ${base + 2}::float8, ${base + 3}::float8, "
+                f"${base + 4}::timestamptz, ${base + 5}::numeric)"
+            )
+            values.extend(
+                (
+                    chunk_start + offset,
+                    latitude,
+                    longitude,
+                    timestamp,
+                    subtotal.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+                )
+            )
+        query = (
+            "SELECT v.idx FROM (VALUES "
+            + ", ".join(rows_sql)
+            + ') AS v(idx, latitude, longitude, ts, subtotal) WHERE EXISTS ('
+            f'SELECT 1 FROM "{Order._meta.db_table}" o WHERE o.user_id = $1 '
+            'AND o."timestamp" = v.ts AND o.latitude = v.latitude '
+            "AND o.longitude = v.longitude AND o.subtotal = v.subtotal)"
+        )
+        rows = await db.execute_query_dict(query, values)
+        existing.update(int(row["idx"]) for row in rows)
+    return existing
+
+
+async def drop_duplicate_import_rows(
+    user_id: int,
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+    fingerprint_filter: OrderFingerprintFilter | None,
+) -> tuple[list[tuple[int, list[str]]], int]:
+    parsed_rows = await asyncio.to_thread(
+        parse_import_rows,
+        indexed_rows,
+        columns,
+        timestamp_parser,
+    )
+    kept_rows: list[tuple[int, list[str]]] = []
+    lookup_rows: list[tuple[int, list[str]]] = []
+    lookup_fingerprints: list[bytes] = []
+    lookup_values: list[OrderFingerprintValues] = []
+    seen: set[bytes] = set()
+    duplicate_count = 0
+
+    for (_, parsed, _), indexed_row in zip(parsed_rows, indexed_rows):
+        if parsed is None:
+            kept_rows.append(indexed_row)
+            continue
+        fingerprint = order_fingerprint(*parsed)
+        if fingerprint in seen:
+            duplicate_count += 1
+            continue
+        seen.add(fingerprint)
+        lookup_rows.append(indexed_row)
+        lookup_fingerprints.append(fingerprint)
+        lookup_values.append(parsed)
+
+    if fingerprint_filter is not None:
+        hits = await fingerprint_filter.contains_many(lookup_fingerprints)
+    else:
+        hits = [True] * len(lookup_fingerprints)
+    candidate_indexes = [idx for idx, hit in enumerate(hits) if hit]
+    existing = await find_existing_orders(
+        user_id=user_id,
+        candidates=[lookup_values[idx] for idx in candidate_indexes],
+    )
+    duplicate_indexes = {candidate_indexes[idx] for idx in existing}
+
+    for idx, indexed_row in enumerate(lookup_rows):
+        if idx in duplicate_indexes:
+            duplicate_count += 1
+        else:
+            kept_rows.append(indexed_row)
+    kept_rows.sort(key=lambda item: item[0])
+    return kept_rows, duplicate_count
@@ -0,0 +1,22 @@
+class ImportTaskError(Exception):
+    pass
+
+
+class ImportTaskNotFoundError(ImportTaskError):
+    pass
+
+
+class ImportTaskBusyError(ImportTaskError):
+    pass
+
+
+class ImportUploadNotFoundError(ImportTaskError):
+    pass
+
+
+class OrdersCursorError(ValueError):
+    pass
+
+
+class OrdersTileError(ValueError):
+    pass
@@ -0,0 +1,234 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Literal
+
+from src.core.serialization import dumps_json
+from src.services.orders.streaming import DisconnectCheck, iter_query_chunks
+
+ORDERS_EXPORT_CHUNK_SIZE = 5000
+ORDERS_EXPORT_GZIP_LEVEL = 6
+ORDERS_EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "file_task_id",
+    "latitude",
+    "longitude",
+    "subtotal",
+    "timestamp",
+    "reporting_code",
+    "composite_tax_rate",
+    "tax_amount",
+    "total_amount",
+    "state_rate",
+    "county_rate",
+    "city_rate",
+    "special_rates",
+    "jurisdictions",
+    "created_at",
+)
+ORDERS_EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+OrdersExportFormat = Literal["csv", "ndjson", "parquet"]
+OrdersExportCompression = Literal["none", "gzip"]
+
+
+def orders_export_filename(export_format: OrdersExportFormat, compression: str) -> str:
+    suffix = ".gz" if compression == "gzip" else ""
+    return f"orders.{export_format}{suffix}"
+
+
+def orders_export_media_type(export_format: OrdersExportFormat, compression: str) -> str:
+    if compression == "gzip":
+        return "application/gzip"
+    return ORDERS_EXPORT_CONTENT_TYPES[export_format]
+
+
+async def stream_orders_export(
+    query,
+    export_format: OrdersExportFormat,
+    compression: OrdersExportCompression,
+    is_disconnected: DisconnectCheck | None = None,
+) -> AsyncIterator[bytes]:
+    encoder = _ORDERS_EXPORT_ENCODERS[export_format]()
+    compressor = (
+        zlib.compressobj(ORDERS_EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+        if compression == "gzip"
+        else None
+    )
+
+    def emit(payload: bytes) -> bytes:
+        return compressor.compress(payload) if compressor is not None else payload
+
+    header = encoder.header()
+    if header:
+        yield emit(header)
+    async for rows in iter_query_chunks(
+        query.order_by("id").values_list(*ORDERS_EXPORT_COLUMNS),
+        chunk_size=ORDERS_EXPORT_CHUNK_SIZE,
+        is_disconnected=is_disconnected,
+    ):
+        payload = emit(encoder.encode(rows))
+        if payload:
+            yield payload
+    tail = emit(encoder.finish())
+    if compressor is not None:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+
+
+class _CsvExportEncoder:
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> bytes:
+        self._writer.writerow(ORDERS_EXPORT_COLUMNS)
+        return self._drain()
+
+    def encode(self, rows: list) -> bytes:
+        self._writer.writerows([_csv_value(value) for value in row] for row in rows)
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return b""
+
+    def _drain(self) -> bytes:
+        payload = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return payload
+
+
+class _NdjsonExportEncoder:
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: list) -> bytes:
+        return b"".join(
+            dumps_json(
+                {
+                    column: _json_value(column, value)
+                    for column, value in zip(ORDERS_EXPORT_COLUMNS, row)
+                }
+            )
+            + b"\n"
+            for row in rows
+        )
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ParquetExportEncoder:
+    def __init__(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._sink = _ChunkSink()
+        self._schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("user_id", pa.int64()),
+                ("file_task_id", pa.int64()),
+                ("latitude", pa.float64()),
+                ("longitude", pa.float64()),
+                ("subtotal", pa.decimal128(12, 2)),
+                ("timestamp", pa.timestamp("us", tz="UTC")),
+                ("reporting_code", pa.string()),
+                ("composite_tax_rate", pa.decimal128(7, 5)),
+                ("tax_amount", pa.decimal128(12, 2)),
+                ("total_amount", pa.decimal128(12, 2)),
+                ("state_rate", pa.decimal128(7, 5)),
+                ("county_rate", pa.decimal128(7, 5)),
+                ("city_rate", pa.decimal128(7, 5)),
+                ("special_rates", pa.decimal128(7, 5)),
+                ("jurisdictions", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+            ]
+        )
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: list) -> bytes:
+        arrays = []
+        for index, field in enumerate(self._schema):
+            column = [row[index] for row in rows]
+            if field.name == "jurisdictions":
+                column = [_json_text(value) for value in column]
+            arrays.append(self._pa.array(column, type=field.type))
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+class _ChunkSink:
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        payload = b"".join(self._parts)
+        self._parts = []
+        return payload
+
+
+_ORDERS_EXPORT_ENCODERS = {
+    "csv": _CsvExportEncoder,
+    "ndjson": _NdjsonExportEncoder,
+    "parquet": _ParquetExportEncoder,
+}
+
+
+def _json_text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return _json_text(value)
+    return value
+
+
+def _json_value(column: str, value: Any) -> Any:
+    if column == "jurisdictions" and isinstance(value, str):
+        return json.loads(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
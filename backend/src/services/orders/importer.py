@@ -3,42 +3,108 @@ import csv
 import io
 import json
 import logging
+import multiprocessing
 import os
+import re
 import threading
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from decimal import Decimal
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import unquote, urlsplit
 
 from redis.asyncio import Redis
+from tortoise import timezone
 
-from src.core.date_rules import ensure_min_supported_datetime
+from src.core.config import settings
 from src.core.reporting_code import normalize_reporting_code
 from src.core.storage import MinioStorage
 from src.models.file_task import FileTask
 from src.models.order import Order
-from src.services.orders.calculator import compute_order_values
+from src.services.orders.batching import (
+    AdaptiveBatchSizer,
+    ImportBatchSizers,
+    create_import_batch_sizers,
+)
+from src.services.orders.calculator import (
+    compute_order_values_for_reporting_code,
+    resolve_reporting_code,
+)
+from src.services.orders.counts import bump_orders_data_version
+from src.services.orders.duplicates import (
+    OrderFingerprintFilter,
+    drop_duplicate_import_rows,
+    order_fingerprint,
+)
+from src.services.orders.compression import (
+    detect_import_compression,
+    open_decompressed_stream,
+)
+from src.services.orders.parsing import (
+    ImportColumns,
+    ImportTimestampParser,
+    ParsedImportRow,
+    parse_import_rows,
+    resolve_import_columns,
+)
+from src.services.orders.outputs import ImportOutputWriter
+from src.services.orders.rows import (
+    IMPORT_ORDER_INSERT_SQL,
+    ImportOrderRow,
+    ImportOrderRowBuilder,
+)
+from src.services.orders.reports import (
+    IMPORT_ERROR_OUTSIDE_COVERAGE,
+    IMPORT_ERROR_PARSE,
+    IMPORT_ERROR_TAX_RATE_NOT_FOUND,
+    IMPORT_ERROR_UNEXPECTED,
+    IMPORT_ERROR_VALIDATION,
+    ImportErrorReport,
+    ImportRowFailure,
+)
+from src.services.orders.scheduler import ImportScheduler
+from src.services.orders.telemetry import (
+    IMPORT_STAGE_COMPUTE,
+    IMPORT_STAGE_DB_INSERT,
+    IMPORT_STAGE_DEDUPE,
+    IMPORT_STAGE_DOWNLOAD,
+    IMPORT_STAGE_GEOLOCATE,
+    IMPORT_STAGE_OUTPUT_WRITE,
+    IMPORT_STAGE_PARSE,
+    IMPORT_STAGE_PROGRESS_WRITE,
+    IMPORT_STAGE_TAX_COMPUTE,
+    ImportTelemetry,
+)
 from src.services.orders.types import OrderComputedPayload
 from src.services.tax import (
     ReportingCodeByCoordinatesService,
     TaxRateBreakdown,
     TaxRateByReportingCodeService,
+    build_tax_services_from_static,
 )
 
 logger = logging.getLogger(__name__)
 
+FILE_TASK_STATUS_QUEUED = "queued"
 FILE_TASK_STATUS_IN_PROGRESS = "in_progress"
 FILE_TASK_STATUS_COMPLETED = "completed"
+FILE_TASK_STATUS_FAILED = "failed"
 PARALLEL_IMPORT_THRESHOLD = 100
 PARALLEL_IMPORT_CHUNKS = 5
-IMPORT_BULK_INSERT_BATCH_SIZE = 500
-IMPORT_COMPUTE_BATCH_SIZE = 1000
-IMPORT_PROGRESS_UPDATE_ROWS = 1000
-IMPORT_PROGRESS_UPDATE_SECONDS = 2.0
+IMPORT_BULK_INSERT_INITIAL_BATCH_SIZE = 500
+IMPORT_COMPUTE_INITIAL_BATCH_SIZE = 1000
+IMPORT_RANGE_MIN_FILE_BYTES = 64 * 1024 * 1024
+IMPORT_RANGE_MIN_BYTES = 16 * 1024 * 1024
+IMPORT_RANGE_MAX_WORKERS = max(1, min(os.cpu_count() or 1, 12))
+IMPORT_NEWLINE_SCAN_BYTES = 8 * 1024 * 1024
+IMPORT_BLANK_LINE_PATTERN = re.compile(rb"^\r?\n", re.MULTILINE)
 TAX_RATE_CACHE_HASH_KEY = "tax-rate-breakdowns:v1"
 
+ImportRowOutcome = tuple[int, OrderComputedPayload | None, ImportRowFailure | None]
+
+_range_worker_state: dict[str, Any] = {}
+
 
 def _build_breakdown_from_jurisdictions(
     reporting_code: str,
@@ -129,42 +195,14 @@ class _RedisBackedTaxRateService:
         await redis_client.hset(TAX_RATE_CACHE_HASH_KEY, mapping=payload)
 
 
-def count_csv_rows(content: bytes) -> int:
-    try:
-        text = content.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        return 0
-
-    reader = csv.reader(io.StringIO(text))
-    total = 0
-    for _ in reader:
-        total += 1
-    if total == 0:
-        return 0
-    return max(total - 1, 0)
-
-
-async def resume_in_progress_import_tasks(
-    storage: MinioStorage,
-    reporting_code_service: ReportingCodeByCoordinatesService,
-    tax_rate_service: TaxRateByReportingCodeService,
-    redis_client: Redis | None = None,
-) -> set[asyncio.Task]:
-    workers: set[asyncio.Task] = set()
-    tasks = await FileTask.filter(status=FILE_TASK_STATUS_IN_PROGRESS).all()
+async def resume_in_progress_import_tasks(scheduler: ImportScheduler) -> int:
+    tasks = await FileTask.filter(
+        status__in=[FILE_TASK_STATUS_IN_PROGRESS, FILE_TASK_STATUS_QUEUED],
+    ).order_by("id")
+    tasks.sort(key=lambda task: task.status != FILE_TASK_STATUS_IN_PROGRESS)
     for task in tasks:
-        worker = asyncio.create_task(
-            process_import_task(
-                task.id,
-                storage,
-                reporting_code_service,
-                tax_rate_service,
-                None,
-                redis_client,
-            )
-        )
-        workers.add(worker)
-    return workers
+        scheduler.submit(task_id=task.id, user_id=task.user_id, total_rows=task.total_rows)
+    return len(tasks)
 
 
 async def process_import_task(
@@ -178,17 +216,48 @@ async def process_import_task(
     task = await FileTask.get_or_none(id=task_id)
     if not task:
         return
+    if task.status == FILE_TASK_STATUS_QUEUED:
+        await FileTask.filter(id=task_id).update(status=FILE_TASK_STATUS_IN_PROGRESS)
 
     successful_rows = task.successful_rows
     failed_rows = task.failed_rows
-    processed_rows = successful_rows + failed_rows
-    pending_orders: list[Order] = []
+    duplicate_rows = task.duplicate_rows
+    processed_rows = successful_rows + failed_rows + duplicate_rows
+    pending_rows: list[ImportOrderRow] = []
+    row_builder = ImportOrderRowBuilder()
     pending_failed_rows = 0
     last_progress_update_at = time.monotonic()
-    object_name = _extract_object_name(file_path=task.file_path, bucket=storage.bucket)
+    object_name = extract_object_name(file_path=task.file_path, bucket=storage.bucket)
+    raw_stream: BinaryIO | None = None
     text_stream: io.TextIOBase | None = None
     cached_tax_rate_service: _RedisBackedTaxRateService | None = None
     temp_file_path: str | None = None
+    range_progress: _RangeImportProgress | None = None
+    error_report = ImportErrorReport(task_id=task_id, error_counts=task.error_counts)
+    telemetry = ImportTelemetry(metrics=task.metrics)
+    batch_sizers = create_import_batch_sizers(
+        compute_initial=IMPORT_COMPUTE_INITIAL_BATCH_SIZE,
+        insert_initial=IMPORT_BULK_INSERT_INITIAL_BATCH_SIZE,
+        buffered_bytes=lambda: telemetry.buffered_bytes,
+    )
+    fingerprint_filter = (
+        OrderFingerprintFilter(redis_client=redis_client, user_id=task.user_id)
+        if redis_client is not None
+        else None
+    )
+    error_report_path: str | None = None
+    output_writer: ImportOutputWriter | None = None
+    output_path: str | None = None
+    if task.output_format is not None:
+        if processed_rows == 0:
+            output_writer = ImportOutputWriter(task_id=task_id, output_format=task.output_format)
+        else:
+            logger.warning(
+                "Import task %s resumed after %s rows, skipping the partial output artifact",
+                task_id,
+                processed_rows,
+            )
+    final_status = FILE_TASK_STATUS_COMPLETED
 
     try:
         if redis_client is not None:
@@ -202,37 +271,84 @@ async def process_import_task(
         )
 
         if source_content is None:
-            with tempfile.NamedTemporaryFile(prefix="orders-import-", suffix=".csv", delete=False) as tmp_file:
+            with tempfile.NamedTemporaryFile(prefix="orders-import-", delete=False) as tmp_file:
                 temp_file_path = tmp_file.name
-            await asyncio.to_thread(
-                storage.download_object_to_file,
-                object_name,
-                temp_file_path,
-            )
-            text_stream = open(temp_file_path, mode="r", encoding="utf-8-sig", newline="")
+            with telemetry.measure(IMPORT_STAGE_DOWNLOAD):
+                await asyncio.to_thread(
+                    storage.download_object_to_file,
+                    object_name,
+                    temp_file_path,
+                )
+            raw_stream = open(temp_file_path, mode="rb")
         else:
-            text_stream = io.StringIO(source_content.decode("utf-8-sig"))
+            raw_stream = io.BytesIO(source_content)
+
+        compression = detect_import_compression(raw_stream)
+        if temp_file_path is not None and compression is None:
+            if task.ranges or (
+                processed_rows == 0
+                and os.path.getsize(temp_file_path) >= IMPORT_RANGE_MIN_FILE_BYTES
+            ):
+                range_progress = await _create_range_import_progress(
+                    task=task,
+                    file_path=temp_file_path,
+                    error_report=error_report,
+                    telemetry=telemetry,
+                )
+                if range_progress is not None:
+                    await _process_import_ranges(
+                        task=task,
+                        file_path=temp_file_path,
+                        progress=range_progress,
+                        error_report=error_report,
+                        telemetry=telemetry,
+                        batch_sizers=batch_sizers,
+                        row_builder=row_builder,
+                        fingerprint_filter=fingerprint_filter,
+                        output_writer=output_writer,
+                        redis_client=redis_client,
+                    )
+                    return
+
+        text_stream = io.TextIOWrapper(
+            open_decompressed_stream(raw_stream, compression),
+            encoding="utf-8-sig",
+            newline="",
+        )
 
-        reader = csv.DictReader(text_stream)
-        columns = _resolve_import_columns(reader.fieldnames)
+        reader = csv.reader(text_stream)
+        fieldnames = next(reader, None)
+        columns = resolve_import_columns(fieldnames)
+        error_report.set_fieldnames(fieldnames)
+        if output_writer is not None:
+            output_writer.set_fieldnames(fieldnames or [])
+        timestamp_parser = ImportTimestampParser()
 
         total_remaining_rows = max(task.total_rows - processed_rows, 0)
         use_parallel = total_remaining_rows > PARALLEL_IMPORT_THRESHOLD
-        indexed_rows_batch: list[tuple[int, dict[str, str]]] = []
+        indexed_rows_batch: list[tuple[int, list[str]]] = []
+        batch_started_at = time.perf_counter()
 
-        for row_number, row in enumerate(reader, start=1):
+        row_number = 0
+        for row in reader:
+            if not row:
+                continue
+            row_number += 1
             if row_number <= processed_rows:
                 continue
 
             indexed_rows_batch.append((row_number, row))
-            if len(indexed_rows_batch) < IMPORT_COMPUTE_BATCH_SIZE:
+            if len(indexed_rows_batch) < batch_sizers.compute.size:
                 continue
+            telemetry.add(IMPORT_STAGE_PARSE, time.perf_counter() - batch_started_at)
+            telemetry.processed_bytes = raw_stream.tell()
 
             (
                 successful_rows,
                 failed_rows,
+                duplicate_rows,
                 processed_rows,
-                pending_orders,
+                pending_rows,
                 pending_failed_rows,
                 last_progress_update_at,
             ) = await _process_indexed_rows_batch(
@@ -240,23 +356,37 @@ async def process_import_task(
                 task_user_id=task.user_id,
                 indexed_rows=indexed_rows_batch,
                 columns=columns,
+                timestamp_parser=timestamp_parser,
                 use_parallel=use_parallel,
                 reporting_code_service=reporting_code_service,
                 tax_rate_service=effective_tax_rate_service,
                 successful_rows=successful_rows,
                 failed_rows=failed_rows,
-                pending_orders=pending_orders,
+                duplicate_rows=duplicate_rows,
+                pending_rows=pending_rows,
                 pending_failed_rows=pending_failed_rows,
                 last_progress_update_at=last_progress_update_at,
+                error_report=error_report,
+                telemetry=telemetry,
+                batch_sizers=batch_sizers,
+                row_builder=row_builder,
+                fingerprint_filter=fingerprint_filter,
+                output_writer=output_writer,
+                skip_duplicates=task.skip_duplicates,
+                redis_client=redis_client,
             )
             indexed_rows_batch = []
+            batch_started_at = time.perf_counter()
 
+        telemetry.processed_bytes = raw_stream.tell()
         if indexed_rows_batch:
+            telemetry.add(IMPORT_STAGE_PARSE, time.perf_counter() - batch_started_at)
             (
                 successful_rows,
                 failed_rows,
+                duplicate_rows,
                 processed_rows,
-                pending_orders,
+                pending_rows,
                 pending_failed_rows,
                 last_progress_update_at,
             ) = await _process_indexed_rows_batch(
@@ -264,20 +394,37 @@ async def process_import_task(
                 task_user_id=task.user_id,
                 indexed_rows=indexed_rows_batch,
                 columns=columns,
+                timestamp_parser=timestamp_parser,
                 use_parallel=use_parallel,
                 reporting_code_service=reporting_code_service,
                 tax_rate_service=effective_tax_rate_service,
                 successful_rows=successful_rows,
                 failed_rows=failed_rows,
-                pending_orders=pending_orders,
+                duplicate_rows=duplicate_rows,
+                pending_rows=pending_rows,
                 pending_failed_rows=pending_failed_rows,
                 last_progress_update_at=last_progress_update_at,
+                error_report=error_report,
+                telemetry=telemetry,
+                batch_sizers=batch_sizers,
+                row_builder=row_builder,
+                fingerprint_filter=fingerprint_filter,
+                output_writer=output_writer,
+                skip_duplicates=task.skip_duplicates,
+                redis_client=redis_client,
             )
+    except asyncio.CancelledError:
+        final_status = FILE_TASK_STATUS_IN_PROGRESS
+        logger.info("Import task %s interrupted, it will be resumed on next start", task_id)
+        raise
     except Exception:
+        final_status = FILE_TASK_STATUS_FAILED
         logger.exception("Import task %s failed with unexpected error", task_id)
     finally:
         if text_stream is not None:
             text_stream.close()
+        if raw_stream is not None:
+            raw_stream.close()
         if temp_file_path is not None:
             try:
                 os.remove(temp_file_path)
@@ -290,157 +437,687 @@ async def process_import_task(
             except Exception:
                 logger.warning("Failed to flush tax-rate cache to redis")
 
-        if pending_orders or pending_failed_rows:
+        if pending_rows or pending_failed_rows:
             inserted_count, flushed_failed = await _flush_pending_import_batch(
-                pending_orders=pending_orders,
+                task_id=task_id,
+                task_user_id=task.user_id,
+                pending_rows=pending_rows,
                 pending_failed_rows=pending_failed_rows,
+                row_bytes=row_builder.row_bytes,
+                telemetry=telemetry,
+                insert_sizer=batch_sizers.insert,
+                fingerprint_filter=fingerprint_filter,
+                redis_client=redis_client,
             )
             successful_rows += inserted_count
             failed_rows += flushed_failed
+        ranges: list[dict[str, int]] | None = None
+        if range_progress is not None:
+            successful_rows = range_progress.successful_rows
+            failed_rows = range_progress.failed_rows
+            duplicate_rows = range_progress.duplicate_rows
+            ranges = range_progress.snapshot()
+
+        try:
+            if final_status == FILE_TASK_STATUS_COMPLETED:
+                error_report_path = await error_report.upload(
+                    storage=storage,
+                    object_name=f"{object_name}.errors.csv",
+                )
+        except Exception:
+            logger.exception("Failed to upload error report for import task %s", task_id)
+        finally:
+            error_report.discard()
+        error_report.log_summary()
+
+        if output_writer is not None:
+            try:
+                if final_status == FILE_TASK_STATUS_COMPLETED:
+                    output_path = await output_writer.upload(
+                        storage=storage,
+                        object_name=f"{object_name}.output.{output_writer.output_format}",
+                    )
+            except Exception:
+                logger.exception("Failed to upload output artifact for import task %s", task_id)
+            finally:
+                output_writer.discard()
+
         await _update_file_task_progress(
             task_id=task_id,
             successful_rows=successful_rows,
             failed_rows=failed_rows,
-            status=FILE_TASK_STATUS_COMPLETED,
+            duplicate_rows=duplicate_rows,
+            status=final_status,
+            ranges=ranges,
+            error_counts=error_report.error_counts,
+            error_report_path=error_report_path,
+            output_path=output_path,
+            telemetry=telemetry,
+        )
+        logger.info(
+            "Import task %s metrics: %s (final batch sizes: compute=%s, insert=%s)",
+            task_id,
+            telemetry.snapshot(processed_rows=successful_rows + failed_rows + duplicate_rows),
+            batch_sizers.compute.size,
+            batch_sizers.insert.size,
         )
 
 
 async def _process_indexed_rows_batch(
     task_id: int,
     task_user_id: int,
-    indexed_rows: list[tuple[int, dict[str, str]]],
-    columns: dict[str, str],
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
     use_parallel: bool,
     reporting_code_service: ReportingCodeByCoordinatesService,
     tax_rate_service: TaxRateByReportingCodeService,
     successful_rows: int,
     failed_rows: int,
-    pending_orders: list[Order],
+    duplicate_rows: int,
+    pending_rows: list[ImportOrderRow],
     pending_failed_rows: int,
     last_progress_update_at: float,
-) -> tuple[int, int, int, list[Order], int, float]:
-    processed_rows = 0
-    if use_parallel and len(indexed_rows) > PARALLEL_IMPORT_THRESHOLD:
-        row_outcomes = await _compute_outcomes_parallel(
-            indexed_rows=indexed_rows,
-            columns=columns,
-            reporting_code_service=reporting_code_service,
-            tax_rate_service=tax_rate_service,
-        )
-    else:
-        row_outcomes = _compute_outcomes_sequential(
-            indexed_rows=indexed_rows,
-            columns=columns,
-            reporting_code_service=reporting_code_service,
-            tax_rate_service=tax_rate_service,
+    error_report: ImportErrorReport,
+    telemetry: ImportTelemetry,
+    batch_sizers: ImportBatchSizers,
+    row_builder: ImportOrderRowBuilder,
+    fingerprint_filter: OrderFingerprintFilter | None,
+    output_writer: ImportOutputWriter | None,
+    skip_duplicates: bool,
+    redis_client: Redis | None,
+) -> tuple[int, int, int, int, list[ImportOrderRow], int, float]:
+    processed_rows = indexed_rows[-1][0]
+    source_rows = indexed_rows
+    if skip_duplicates:
+        with telemetry.measure(IMPORT_STAGE_DEDUPE):
+            indexed_rows, dropped_rows = await drop_duplicate_import_rows(
+                user_id=task_user_id,
+                indexed_rows=indexed_rows,
+                columns=columns,
+                timestamp_parser=timestamp_parser,
+                fingerprint_filter=fingerprint_filter,
+            )
+        duplicate_rows += dropped_rows
+
+    compute_started_at = time.perf_counter()
+    with telemetry.buffered(rows=len(indexed_rows), row_bytes=row_builder.row_bytes):
+        with telemetry.measure(IMPORT_STAGE_COMPUTE):
+            if use_parallel and len(indexed_rows) > PARALLEL_IMPORT_THRESHOLD:
+                row_outcomes = await _compute_outcomes_parallel(
+                    indexed_rows=indexed_rows,
+                    columns=columns,
+                    timestamp_parser=timestamp_parser,
+                    reporting_code_service=reporting_code_service,
+                    tax_rate_service=tax_rate_service,
+                    telemetry=telemetry,
+                )
+            else:
+                row_outcomes = compute_import_row_outcomes(
+                    indexed_rows=indexed_rows,
+                    columns=columns,
+                    timestamp_parser=timestamp_parser,
+                    reporting_code_service=reporting_code_service,
+                    tax_rate_service=tax_rate_service,
+                    telemetry=telemetry,
+                )
+        batch_sizers.compute.observe(
+            rows=len(indexed_rows),
+            seconds=time.perf_counter() - compute_started_at,
         )
+    if output_writer is not None:
+        with telemetry.measure(IMPORT_STAGE_OUTPUT_WRITE):
+            output_writer.add_batch(source_rows, row_outcomes)
 
-    for row_number, success, computed in row_outcomes:
-        processed_rows = row_number
-        if success and computed is not None:
-            pending_orders.append(Order(user_id=task_user_id, **computed))
+    for row_number, computed, failure in row_outcomes:
+        if computed is not None:
+            pending_rows.append(row_builder.build(computed))
         else:
             pending_failed_rows += 1
+            if failure is not None:
+                error_report.add(row_number=row_number, failure=failure)
 
-        if len(pending_orders) >= IMPORT_BULK_INSERT_BATCH_SIZE:
+        if len(pending_rows) >= batch_sizers.insert.size:
             inserted_count, flushed_failed = await _flush_pending_import_batch(
-                pending_orders=pending_orders,
+                task_id=task_id,
+                task_user_id=task_user_id,
+                pending_rows=pending_rows,
                 pending_failed_rows=pending_failed_rows,
+                row_bytes=row_builder.row_bytes,
+                telemetry=telemetry,
+                insert_sizer=batch_sizers.insert,
+                fingerprint_filter=fingerprint_filter,
+                redis_client=redis_client,
             )
             successful_rows += inserted_count
             failed_rows += flushed_failed
-            pending_orders = []
+            pending_rows = []
             pending_failed_rows = 0
 
         now = time.monotonic()
         if (
-            processed_rows % IMPORT_PROGRESS_UPDATE_ROWS == 0
-            and (now - last_progress_update_at) >= IMPORT_PROGRESS_UPDATE_SECONDS
+            row_number % settings.import_progress_update_rows == 0
+            and (now - last_progress_update_at) >= settings.import_progress_update_seconds
         ):
             await _update_file_task_progress(
                 task_id=task_id,
-                successful_rows=successful_rows + len(pending_orders),
+                successful_rows=successful_rows + len(pending_rows),
                 failed_rows=failed_rows + pending_failed_rows,
+                duplicate_rows=duplicate_rows,
                 status=FILE_TASK_STATUS_IN_PROGRESS,
+                error_counts=error_report.error_counts,
+                telemetry=telemetry,
             )
             last_progress_update_at = now
 
+    if skip_duplicates and (pending_rows or pending_failed_rows):
+        inserted_count, flushed_failed = await _flush_pending_import_batch(
+            task_id=task_id,
+            task_user_id=task_user_id,
+            pending_rows=pending_rows,
+            pending_failed_rows=pending_failed_rows,
+            row_bytes=row_builder.row_bytes,
+            telemetry=telemetry,
+            insert_sizer=batch_sizers.insert,
+            fingerprint_filter=fingerprint_filter,
+            redis_client=redis_client,
+        )
+        successful_rows += inserted_count
+        failed_rows += flushed_failed
+        pending_rows = []
+        pending_failed_rows = 0
+
     return (
         successful_rows,
         failed_rows,
+        duplicate_rows,
         processed_rows,
-        pending_orders,
+        pending_rows,
         pending_failed_rows,
         last_progress_update_at,
     )
 
 
-def _resolve_import_columns(fieldnames: list[str] | None) -> dict[str, str]:
-    if not fieldnames:
-        raise ValueError("CSV file is empty or has no header.")
+class _RangeImportProgress:
+    def __init__(
+        self,
+        task_id: int,
+        ranges: list[dict[str, int]],
+        error_report: ImportErrorReport,
+        telemetry: ImportTelemetry,
+    ) -> None:
+        self._task_id = task_id
+        self._ranges = ranges
+        self._error_report = error_report
+        self._telemetry = telemetry
+        self._telemetry.processed_bytes = self.processed_bytes
+        self._lock = asyncio.Lock()
+        self._last_update_at = time.monotonic()
+
+    @property
+    def ranges_count(self) -> int:
+        return len(self._ranges)
+
+    @property
+    def successful_rows(self) -> int:
+        return sum(item["successful_rows"] for item in self._ranges)
+
+    @property
+    def failed_rows(self) -> int:
+        return sum(item["failed_rows"] for item in self._ranges)
+
+    @property
+    def duplicate_rows(self) -> int:
+        return sum(item.get("duplicate_rows", 0) for item in self._ranges)
+
+    @property
+    def processed_bytes(self) -> int:
+        return sum(item["offset"] - item["start"] for item in self._ranges)
+
+    def get(self, range_index: int) -> dict[str, int]:
+        return self._ranges[range_index]
+
+    def snapshot(self) -> list[dict[str, int]]:
+        return [dict(item) for item in self._ranges]
+
+    async def commit(
+        self,
+        range_index: int,
+        offset: int,
+        successful_rows: int,
+        failed_rows: int,
+        duplicate_rows: int,
+    ) -> None:
+        state = self._ranges[range_index]
+        state["offset"] = offset
+        state["successful_rows"] += successful_rows
+        state["failed_rows"] += failed_rows
+        state["duplicate_rows"] = state.get("duplicate_rows", 0) + duplicate_rows
+        self._telemetry.processed_bytes = self.processed_bytes
+
+        now = time.monotonic()
+        if (now - self._last_update_at) < settings.import_progress_update_seconds:
+            return
+        async with self._lock:
+            if (
+                time.monotonic() - self._last_update_at
+            ) < settings.import_progress_update_seconds:
+                return
+            self._last_update_at = time.monotonic()
+            await _update_file_task_progress(
+                task_id=self._task_id,
+                successful_rows=self.successful_rows,
+                failed_rows=self.failed_rows,
+                duplicate_rows=self.duplicate_rows,
+                status=FILE_TASK_STATUS_IN_PROGRESS,
+                ranges=self.snapshot(),
+                error_counts=self._error_report.error_counts,
+                telemetry=self._telemetry,
+            )
+
+
+async def _create_range_import_progress(
+    task: FileTask,
+    file_path: str,
+    error_report: ImportErrorReport,
+    telemetry: ImportTelemetry,
+) -> _RangeImportProgress | None:
+    ranges = task.ranges
+    if not ranges:
+        _, data_start = await asyncio.to_thread(_read_import_header, file_path)
+        ranges = await asyncio.to_thread(
+            _plan_import_ranges,
+            file_path,
+            data_start,
+            IMPORT_RANGE_MAX_WORKERS,
+        )
+        if ranges is None:
+            logger.info(
+                "Import task %s has quoted fields spanning lines, importing sequentially",
+                task.id,
+            )
+            return None
+        await _update_file_task_progress(
+            task_id=task.id,
+            successful_rows=task.successful_rows,
+            failed_rows=task.failed_rows,
+            status=FILE_TASK_STATUS_IN_PROGRESS,
+            ranges=ranges,
+            telemetry=telemetry,
+        )
+    return _RangeImportProgress(
+        task_id=task.id,
+        ranges=ranges,
+        error_report=error_report,
+        telemetry=telemetry,
+    )
+
+
+async def _process_import_ranges(
+    task: FileTask,
+    file_path: str,
+    progress: _RangeImportProgress,
+    error_report: ImportErrorReport,
+    telemetry: ImportTelemetry,
+    batch_sizers: ImportBatchSizers,
+    row_builder: ImportOrderRowBuilder,
+    fingerprint_filter: OrderFingerprintFilter | None,
+    output_writer: ImportOutputWriter | None,
+    redis_client: Redis | None,
+) -> None:
+    fieldnames, _ = await asyncio.to_thread(_read_import_header, file_path)
+    columns = resolve_import_columns(fieldnames)
+    error_report.set_fieldnames(fieldnames)
+    if output_writer is not None:
+        output_writer.set_fieldnames(fieldnames)
+    timestamp_parser = ImportTimestampParser()
+
+    logger.info("Import task %s split into %s byte ranges", task.id, progress.ranges_count)
+    # Workers are spawned, not forked: a fork would copy the running event loop and its connections.
+    executor = ProcessPoolExecutor(
+        max_workers=progress.ranges_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_range_worker,
+        initargs=(columns,),
+    )
+    try:
+        async with asyncio.TaskGroup() as range_tasks:
+            for range_index in range(progress.ranges_count):
+                range_tasks.create_task(
+                    _process_import_range(
+                        task_id=task.id,
+                        task_user_id=task.user_id,
+                        file_path=file_path,
+                        executor=executor,
+                        columns=columns,
+                        timestamp_parser=timestamp_parser,
+                        range_index=range_index,
+                        progress=progress,
+                        error_report=error_report,
+                        telemetry=telemetry,
+                        batch_sizers=batch_sizers,
+                        row_builder=row_builder,
+                        fingerprint_filter=fingerprint_filter,
+                        output_writer=output_writer,
+                        skip_duplicates=task.skip_duplicates,
+                        redis_client=redis_client,
+                    )
+                )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    normalized: dict[str, str] = {}
-    for field in fieldnames:
-        key = field.strip().lower().replace("_", "").replace(" ", "")
-        normalized[key] = field
 
-    required_keys = ("longitude", "latitude", "timestamp", "subtotal")
-    missing = [key for key in required_keys if key not in normalized]
-    if missing:
-        raise ValueError(f"Missing required CSV columns: {', '.join(missing)}")
-    return {key: normalized[key] for key in required_keys}
+async def _process_import_range(
+    task_id: int,
+    task_user_id: int,
+    file_path: str,
+    executor: ProcessPoolExecutor,
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+    range_index: int,
+    progress: _RangeImportProgress,
+    error_report: ImportErrorReport,
+    telemetry: ImportTelemetry,
+    batch_sizers: ImportBatchSizers,
+    row_builder: ImportOrderRowBuilder,
+    fingerprint_filter: OrderFingerprintFilter | None,
+    output_writer: ImportOutputWriter | None,
+    skip_duplicates: bool,
+    redis_client: Redis | None,
+) -> None:
+    loop = asyncio.get_running_loop()
+    state = progress.get(range_index)
+    offset = state["offset"]
+    while offset < state["end"]:
+        compute_started_at = time.perf_counter()
+        batch_size = batch_sizers.compute.size
+        with telemetry.buffered(rows=batch_size, row_bytes=row_builder.row_bytes):
+            with telemetry.measure(IMPORT_STAGE_COMPUTE):
+                indexed_rows, row_outcomes, offset, stage_seconds = await loop.run_in_executor(
+                    executor,
+                    _compute_import_range_batch,
+                    file_path,
+                    offset,
+                    state["end"],
+                    batch_size,
+                    state["first_row"]
+                    + state["successful_rows"]
+                    + state["failed_rows"]
+                    + state.get("duplicate_rows", 0),
+                )
+            telemetry.add_compute_worker_seconds(stage_seconds)
+            batch_sizers.compute.observe(
+                rows=len(indexed_rows),
+                seconds=time.perf_counter() - compute_started_at,
+            )
+        source_rows = indexed_rows
+        dropped_rows = 0
+        if skip_duplicates and indexed_rows:
+            with telemetry.measure(IMPORT_STAGE_DEDUPE):
+                indexed_rows, dropped_rows = await drop_duplicate_import_rows(
+                    user_id=task_user_id,
+                    indexed_rows=indexed_rows,
+                    columns=columns,
+                    timestamp_parser=timestamp_parser,
+                    fingerprint_filter=fingerprint_filter,
+                )
+            if dropped_rows:
+                kept_row_numbers = {row_number for row_number, _ in indexed_rows}
+                row_outcomes = [
+                    outcome for outcome in row_outcomes if outcome[0] in kept_row_numbers
+                ]
+        if output_writer is not None:
+            with telemetry.measure(IMPORT_STAGE_OUTPUT_WRITE):
+                output_writer.add_batch(source_rows, row_outcomes)
+        pending_rows: list[ImportOrderRow] = []
+        for row_number, computed, failure in row_outcomes:
+            if computed is not None:
+                pending_rows.append(row_builder.build(computed))
+            elif failure is not None:
+                error_report.add(row_number=row_number, failure=failure)
+        inserted_count, failed_count = await _flush_pending_import_batch(
+            task_id=task_id,
+            task_user_id=task_user_id,
+            pending_rows=pending_rows,
+            pending_failed_rows=len(row_outcomes) - len(pending_rows),
+            row_bytes=row_builder.row_bytes,
+            telemetry=telemetry,
+            insert_sizer=batch_sizers.insert,
+            fingerprint_filter=fingerprint_filter,
+            redis_client=redis_client,
+        )
+        await progress.commit(
+            range_index=range_index,
+            offset=offset,
+            successful_rows=inserted_count,
+            failed_rows=failed_count,
+            duplicate_rows=dropped_rows,
+        )
+    logger.info("Import task %s finished byte range %s", task_id, range_index)
+
+
+def _init_range_worker(columns: ImportColumns) -> None:
+    reporting_code_service, tax_rate_service = build_tax_services_from_static()
+    _range_worker_state["reporting_code_service"] = reporting_code_service
+    _range_worker_state["tax_rate_service"] = tax_rate_service
+    _range_worker_state["columns"] = columns
+    _range_worker_state["timestamp_parser"] = ImportTimestampParser()
+
+
+def _compute_import_range_batch(
+    file_path: str,
+    offset: int,
+    end: int,
+    batch_size: int,
+    first_row_number: int,
+) -> tuple[list[tuple[int, list[str]]], list[ImportRowOutcome], int, dict[str, float]]:
+    started_at = time.perf_counter()
+    with open(file_path, mode="rb") as stream:
+        stream.seek(offset)
+        indexed_rows, offset = _read_import_range_batch(
+            stream=stream,
+            end=end,
+            batch_size=batch_size,
+            first_row_number=first_row_number,
+        )
+    read_seconds = time.perf_counter() - started_at
+    row_outcomes, stage_seconds = _compute_import_row_outcomes_timed(
+        indexed_rows=indexed_rows,
+        columns=_range_worker_state["columns"],
+        timestamp_parser=_range_worker_state["timestamp_parser"],
+        reporting_code_service=_range_worker_state["reporting_code_service"],
+        tax_rate_service=_range_worker_state["tax_rate_service"],
+    )
+    stage_seconds[IMPORT_STAGE_PARSE] += read_seconds
+    return (
+        indexed_rows,
+        [
+            (
+                row_number,
+                computed,
+                (failure[0], RuntimeError(str(failure[1])), failure[2])
+                if failure is not None
+                else None,
+            )
+            for row_number, computed, failure in row_outcomes
+        ],
+        offset,
+        stage_seconds,
+    )
 
 
-def _parse_import_row(
-    row: dict[str, str],
-    columns: dict[str, str],
-) -> tuple[float, float, datetime, Decimal]:
-    longitude = float(row[columns["longitude"]].strip())
-    latitude = float(row[columns["latitude"]].strip())
-    timestamp = _parse_import_timestamp(row[columns["timestamp"]].strip())
-    subtotal = Decimal(row[columns["subtotal"]].strip())
-    if subtotal < 0:
-        raise ValueError("subtotal must be >= 0")
-    return latitude, longitude, timestamp, subtotal
+def _read_import_header(file_path: str) -> tuple[list[str], int]:
+    with open(file_path, mode="rb") as stream:
+        header_line = stream.readline()
+    header_text = header_line.decode("utf-8-sig")
+    fieldnames = next(csv.reader([header_text]), [])
+    return fieldnames, len(header_line)
+
+
+def _plan_import_ranges(
+    file_path: str,
+    data_start: int,
+    max_ranges: int,
+) -> list[dict[str, int]] | None:
+    file_size = os.path.getsize(file_path)
+    data_size = max(file_size - data_start, 0)
+    ranges_count = max(1, min(max_ranges, data_size // IMPORT_RANGE_MIN_BYTES))
+
+    boundaries = [data_start]
+    with open(file_path, mode="rb") as stream:
+        for idx in range(1, ranges_count):
+            target = data_start + data_size * idx // ranges_count
+            if target <= boundaries[-1]:
+                continue
+            stream.seek(target - 1)
+            stream.readline()
+            aligned = stream.tell()
+            if aligned >= file_size:
+                break
+            if aligned > boundaries[-1]:
+                boundaries.append(aligned)
+        boundaries.append(file_size)
+
+        ranges: list[dict[str, int]] = []
+        first_row = 1
+        for start, end in zip(boundaries, boundaries[1:]):
+            if end <= start:
+                continue
+            records = _count_import_records(stream=stream, start=start, end=end)
+            if records is None:
+                return None
+            ranges.append(
+                {
+                    "start": start,
+                    "end": end,
+                    "offset": start,
+                    "first_row": first_row,
+                    "successful_rows": 0,
+                    "failed_rows": 0,
+                }
+            )
+            first_row += records
+    return ranges
 
 
-def _compute_outcomes_sequential(
-    indexed_rows: list[tuple[int, dict[str, str]]],
-    columns: dict[str, str],
+def _count_import_records(stream: BinaryIO, start: int, end: int) -> int | None:
+    # Counts rows the way csv.reader does in the sequential path: blank lines are skipped,
+    # and a line with an odd number of quotes opens a quoted field that spans lines.
+    stream.seek(start)
+    remaining = end - start
+    total = 0
+    while remaining > 0:
+        chunk = stream.read(min(IMPORT_NEWLINE_SCAN_BYTES, remaining))
+        if not chunk:
+            break
+        if not chunk.endswith(b"\n"):
+            chunk += stream.readline()
+        remaining -= len(chunk)
+        lines = chunk.split(b"\n")
+        if b'"' in chunk and any(line.count(b'"') % 2 for line in lines):
+            return None
+        total += chunk.count(b"\n") - len(IMPORT_BLANK_LINE_PATTERN.findall(chunk))
+        if lines[-1].strip(b"\r"):
+            total += 1
+    return total
+
+
+def _read_import_range_batch(
+    stream: BinaryIO,
+    end: int,
+    batch_size: int,
+    first_row_number: int,
+) -> tuple[list[tuple[int, list[str]]], int]:
+    lines: list[str] = []
+    position = stream.tell()
+    while position < end and len(lines) < batch_size:
+        raw_line = stream.readline()
+        if not raw_line:
+            break
+        position += len(raw_line)
+        lines.append(raw_line.decode("utf-8"))
+
+    rows = [row for row in csv.reader(lines) if row]
+    return list(enumerate(rows, start=first_row_number)), position
+
+
+def compute_import_row_outcomes(
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
     reporting_code_service: ReportingCodeByCoordinatesService,
     tax_rate_service: TaxRateByReportingCodeService,
-) -> list[tuple[int, bool, OrderComputedPayload | None]]:
-    outcomes: list[tuple[int, bool, OrderComputedPayload | None]] = []
-    for row_number, row in indexed_rows:
+    telemetry: ImportTelemetry | None = None,
+) -> list[ImportRowOutcome]:
+    outcomes, stage_seconds = _compute_import_row_outcomes_timed(
+        indexed_rows=indexed_rows,
+        columns=columns,
+        timestamp_parser=timestamp_parser,
+        reporting_code_service=reporting_code_service,
+        tax_rate_service=tax_rate_service,
+    )
+    if telemetry is not None:
+        telemetry.add_compute_worker_seconds(stage_seconds)
+    return outcomes
+
+
+def _compute_import_row_outcomes_timed(
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+    reporting_code_service: ReportingCodeByCoordinatesService,
+    tax_rate_service: TaxRateByReportingCodeService,
+) -> tuple[list[ImportRowOutcome], dict[str, float]]:
+    outcomes: list[ImportRowOutcome] = []
+    started_at = time.perf_counter()
+    parsed_rows = parse_import_rows(
+        indexed_rows=indexed_rows,
+        columns=columns,
+        timestamp_parser=timestamp_parser,
+    )
+    stage_seconds = {
+        IMPORT_STAGE_PARSE: time.perf_counter() - started_at,
+        IMPORT_STAGE_GEOLOCATE: 0.0,
+        IMPORT_STAGE_TAX_COMPUTE: 0.0,
+    }
+    for (row_number, parsed, parse_error), (_, row) in zip(parsed_rows, indexed_rows):
+        if parsed is None:
+            outcomes.append((row_number, None, (IMPORT_ERROR_PARSE, parse_error, row)))
+            continue
         outcomes.append(
             _compute_row_outcome(
                 row_number=row_number,
                 row=row,
-                columns=columns,
+                parsed=parsed,
                 reporting_code_service=reporting_code_service,
                 tax_rate_service=tax_rate_service,
+                stage_seconds=stage_seconds,
             )
         )
-    return outcomes
+    return outcomes, stage_seconds
 
 
 async def _compute_outcomes_parallel(
-    indexed_rows: list[tuple[int, dict[str, str]]],
-    columns: dict[str, str],
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
     reporting_code_service: ReportingCodeByCoordinatesService,
     tax_rate_service: TaxRateByReportingCodeService,
-) -> list[tuple[int, bool, OrderComputedPayload | None]]:
+    telemetry: ImportTelemetry,
+) -> list[ImportRowOutcome]:
     chunks = _split_rows_into_chunks(
         indexed_rows=indexed_rows,
         chunks_count=PARALLEL_IMPORT_CHUNKS,
     )
     chunk_futures = [
         asyncio.to_thread(
-            _compute_outcomes_sequential,
+            compute_import_row_outcomes,
             chunk,
             columns,
+            timestamp_parser,
             reporting_code_service,
             tax_rate_service,
+            telemetry,
         )
         for chunk in chunks
         if chunk
@@ -451,12 +1128,12 @@ async def _compute_outcomes_parallel(
 
 
 def _split_rows_into_chunks(
-    indexed_rows: list[tuple[int, dict[str, str]]],
+    indexed_rows: list[tuple[int, list[str]]],
     chunks_count: int,
-) -> list[list[tuple[int, dict[str, str]]]]:
+) -> list[list[tuple[int, list[str]]]]:
     if not indexed_rows:
         return []
-    chunks: list[list[tuple[int, dict[str, str]]]] = [[] for _ in range(chunks_count)]
+    chunks: list[list[tuple[int, list[str]]]] = [[] for _ in range(chunks_count)]
     for idx, row in enumerate(indexed_rows):
         chunks[idx % chunks_count].append(row)
     return chunks
@@ -464,92 +1141,44 @@ def _split_rows_into_chunks(
 
 def _compute_row_outcome(
     row_number: int,
-    row: dict[str, str],
-    columns: dict[str, str],
+    row: list[str],
+    parsed: ParsedImportRow,
     reporting_code_service: ReportingCodeByCoordinatesService,
     tax_rate_service: TaxRateByReportingCodeService,
-) -> tuple[int, bool, OrderComputedPayload | None]:
+    stage_seconds: dict[str, float],
+) -> ImportRowOutcome:
+    latitude, longitude, timestamp, subtotal = parsed
+    started_at = time.perf_counter()
     try:
-        latitude, longitude, timestamp, subtotal = _parse_import_row(row=row, columns=columns)
-    except Exception as exc:
-        logger.warning(
-            "Import row %s parse error: %s",
-            row_number,
-            exc,
-        )
-        return (row_number, False, None)
-
-    try:
-        computed = compute_order_values(
-            latitude=latitude,
-            longitude=longitude,
-            timestamp=timestamp,
-            subtotal_raw=subtotal,
-            reporting_code_service=reporting_code_service,
-            tax_rate_service=tax_rate_service,
-        )
-        return (row_number, True, computed)
-    except ValueError as exc:
-        if "outside New York State coverage" in str(exc):
-            logger.warning(
-                "Import row %s is outside NY coverage: latitude=%s longitude=%s",
-                row_number,
-                latitude,
-                longitude,
+        try:
+            reporting_code = resolve_reporting_code(
+                latitude=latitude,
+                longitude=longitude,
+                reporting_code_service=reporting_code_service,
             )
-        else:
-            logger.warning(
-                "Import row %s validation error: %s (latitude=%s longitude=%s)",
-                row_number,
-                exc,
-                latitude,
-                longitude,
+        finally:
+            geolocated_at = time.perf_counter()
+            stage_seconds[IMPORT_STAGE_GEOLOCATE] += geolocated_at - started_at
+        try:
+            computed = compute_order_values_for_reporting_code(
+                latitude=latitude,
+                longitude=longitude,
+                timestamp=timestamp,
+                subtotal_raw=subtotal,
+                reporting_code=reporting_code,
+                tax_rate_service=tax_rate_service,
             )
-        return (row_number, False, None)
+        finally:
+            stage_seconds[IMPORT_STAGE_TAX_COMPUTE] += time.perf_counter() - geolocated_at
+        return (row_number, computed, None)
+    except ValueError as exc:
+        if "outside New York State coverage" in str(exc):
+            return (row_number, None, (IMPORT_ERROR_OUTSIDE_COVERAGE, exc, row))
+        return (row_number, None, (IMPORT_ERROR_VALIDATION, exc, row))
     except LookupError as exc:
-        logger.warning(
-            "Import row %s tax lookup error: %s (latitude=%s longitude=%s)",
-            row_number,
-            exc,
-            latitude,
-            longitude,
-        )
-        return (row_number, False, None)
-    except Exception:
-        logger.exception(
-            "Import row %s unexpected processing error (latitude=%s longitude=%s)",
-            row_number,
-            latitude,
-            longitude,
-        )
-        return (row_number, False, None)
-
-
-def _parse_import_timestamp(raw_timestamp: str) -> datetime:
-    clean = raw_timestamp.strip()
-    if not clean:
-        raise ValueError("timestamp is empty")
-
-    if "." not in clean:
-        parsed = datetime.fromisoformat(clean)
-        ensure_min_supported_datetime(parsed, "timestamp")
-        return parsed
-
-    base, rest = clean.split(".", 1)
-    tz_start = len(rest)
-    for marker in ("+", "-", "Z", "z"):
-        pos = rest.find(marker)
-        if pos != -1:
-            tz_start = min(tz_start, pos)
-    frac = rest[:tz_start]
-    tz = rest[tz_start:]
-    frac = (frac + "000000")[:6]
-    normalized = f"{base}.{frac}{tz}"
-    if normalized.endswith("Z") or normalized.endswith("z"):
-        normalized = f"{normalized[:-1]}+00:00"
-    parsed = datetime.fromisoformat(normalized)
-    ensure_min_supported_datetime(parsed, "timestamp")
-    return parsed
+        return (row_number, None, (IMPORT_ERROR_TAX_RATE_NOT_FOUND, exc, row))
+    except Exception as exc:
+        return (row_number, None, (IMPORT_ERROR_UNEXPECTED, exc, row))
 
 
 async def _update_file_task_progress(
@@ -557,30 +1186,80 @@ async def _update_file_task_progress(
     successful_rows: int,
     failed_rows: int,
     status: str,
+    duplicate_rows: int | None = None,
+    ranges: list[dict[str, int]] | None = None,
+    error_counts: dict[str, int] | None = None,
+    error_report_path: str | None = None,
+    output_path: str | None = None,
+    telemetry: ImportTelemetry | None = None,
 ) -> None:
-    await FileTask.filter(id=task_id).update(
-        successful_rows=successful_rows,
-        failed_rows=failed_rows,
-        status=status,
-        updated_at=datetime.utcnow(),
-    )
+    fields: dict[str, Any] = {
+        "successful_rows": successful_rows,
+        "failed_rows": failed_rows,
+        "status": status,
+        "updated_at": datetime.utcnow(),
+    }
+    if duplicate_rows is not None:
+        fields["duplicate_rows"] = duplicate_rows
+    if ranges is not None:
+        fields["ranges"] = ranges
+    if error_counts is not None:
+        fields["error_counts"] = error_counts
+    if error_report_path is not None:
+        fields["error_report_path"] = error_report_path
+    if output_path is not None:
+        fields["output_path"] = output_path
+    if telemetry is None:
+        await FileTask.filter(id=task_id).update(**fields)
+    else:
+        fields["metrics"] = telemetry.snapshot(
+            processed_rows=successful_rows + failed_rows + (duplicate_rows or 0),
+        )
+        with telemetry.measure(IMPORT_STAGE_PROGRESS_WRITE):
+            await FileTask.filter(id=task_id).update(**fields)
 
 
 async def _flush_pending_import_batch(
-    pending_orders: list[Order],
+    task_id: int,
+    task_user_id: int,
+    pending_rows: list[ImportOrderRow],
     pending_failed_rows: int,
+    row_bytes: int,
+    telemetry: ImportTelemetry,
+    insert_sizer: AdaptiveBatchSizer,
+    fingerprint_filter: OrderFingerprintFilter | None,
+    redis_client: Redis | None,
 ) -> tuple[int, int]:
     inserted_count = 0
-    if pending_orders:
-        await Order.bulk_create(
-            pending_orders,
-            batch_size=IMPORT_BULK_INSERT_BATCH_SIZE,
-        )
-        inserted_count = len(pending_orders)
+    if not pending_rows:
+        return inserted_count, pending_failed_rows
+
+    db = Order._meta.db
+    with telemetry.buffered(rows=len(pending_rows), row_bytes=row_bytes):
+        while inserted_count < len(pending_rows):
+            batch = pending_rows[inserted_count : inserted_count + insert_sizer.size]
+            created_at = timezone.now()
+            values = [row.insert_values(task_user_id, task_id, created_at) for row in batch]
+            started_at = time.perf_counter()
+            with telemetry.measure(IMPORT_STAGE_DB_INSERT):
+                await db.execute_many(IMPORT_ORDER_INSERT_SQL, values)
+            seconds = time.perf_counter() - started_at
+            insert_sizer.observe(rows=len(batch), seconds=seconds)
+            inserted_count += len(batch)
+    await bump_orders_data_version(redis_client)
+
+    if fingerprint_filter is not None:
+        with telemetry.measure(IMPORT_STAGE_DEDUPE):
+            await fingerprint_filter.add_many(
+                [
+                    order_fingerprint(row.latitude, row.longitude, row.timestamp, row.subtotal)
+                    for row in pending_rows
+                ]
+            )
     return inserted_count, pending_failed_rows
 
 
-def _extract_object_name(file_path: str, bucket: str) -> str:
+def extract_object_name(file_path: str, bucket: str) -> str:
     prefix = f"{bucket}/"
     if file_path.startswith(prefix):
         return file_path[len(prefix) :]
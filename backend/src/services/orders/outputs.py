@@ -0,0 +1,201 @@
+import asyncio
+import csv
+import logging
+import os
+import tempfile
+from decimal import Decimal
+from typing import Any, TextIO
+
+from src.core.storage import MinioStorage
+from src.services.orders.types import OrderComputedPayload
+
+logger = logging.getLogger(__name__)
+
+IMPORT_OUTPUT_FORMAT_CSV = "csv"
+IMPORT_OUTPUT_FORMAT_PARQUET = "parquet"
+IMPORT_OUTPUT_FORMATS = (IMPORT_OUTPUT_FORMAT_CSV, IMPORT_OUTPUT_FORMAT_PARQUET)
+IMPORT_OUTPUT_CONTENT_TYPES = {
+    IMPORT_OUTPUT_FORMAT_CSV: "text/csv",
+    IMPORT_OUTPUT_FORMAT_PARQUET: "application/vnd.apache.parquet",
+}
+IMPORT_OUTPUT_STATUS_IMPORTED = "imported"
+IMPORT_OUTPUT_STATUS_DUPLICATE = "duplicate"
+IMPORT_OUTPUT_COMPUTED_COLUMNS = (
+    "reporting_code",
+    "composite_tax_rate",
+    "tax_amount",
+    "total_amount",
+    "status",
+)
+
+ImportRowOutcome = tuple[int, OrderComputedPayload | None, Any]
+
+
+class ImportOutputWriter:
+    def __init__(
+        self,
+        task_id: int | None,
+        output_format: str,
+        file_path: str | None = None,
+    ) -> None:
+        if output_format not in IMPORT_OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported import output format: {output_format}")
+        self._task_id = task_id
+        self._format = output_format
+        self._fieldnames: list[str] = []
+        self._target_path = file_path
+        self._file_path: str | None = None
+        self._file: TextIO | None = None
+        self._csv_writer = None
+        self._parquet_writer = None
+        self._rows_written = 0
+
+    @property
+    def output_format(self) -> str:
+        return self._format
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    def set_fieldnames(self, fieldnames: list[str]) -> None:
+        self._fieldnames = list(fieldnames)
+
+    def add_batch(
+        self,
+        indexed_rows: list[tuple[int, list[str]]],
+        row_outcomes: list[ImportRowOutcome],
+    ) -> None:
+        if not indexed_rows:
+            return
+        if self._file_path is None:
+            self._open()
+        outcomes = {
+            row_number: (computed, failure) for row_number, computed, failure in row_outcomes
+        }
+        records: list[list[Any]] = []
+        for row_number, raw_values in indexed_rows:
+            values = _align_values(raw_values, len(self._fieldnames))
+            outcome = outcomes.get(row_number)
+            if outcome is None:
+                records.append(
+                    [row_number, *values, None, None, None, None, IMPORT_OUTPUT_STATUS_DUPLICATE]
+                )
+                continue
+            computed, failure = outcome
+            if computed is None:
+                reason = failure[0] if failure is not None else None
+                records.append([row_number, *values, None, None, None, None, reason])
+                continue
+            records.append(
+                [
+                    row_number,
+                    *values,
+                    str(computed["reporting_code"]),
+                    computed["composite_tax_rate"],
+                    computed["tax_amount"],
+                    computed["total_amount"],
+                    IMPORT_OUTPUT_STATUS_IMPORTED,
+                ]
+            )
+
+        if self._format == IMPORT_OUTPUT_FORMAT_CSV:
+            self._csv_writer.writerows(records)
+        else:
+            self._write_parquet(records)
+        self._rows_written += len(records)
+
+    async def upload(self, storage: MinioStorage, object_name: str) -> str | None:
+        if self._file_path is None:
+            return None
+        self.close()
+        if self._rows_written == 0:
+            return None
+        await asyncio.to_thread(
+            storage.upload_file,
+            object_name,
+            self._file_path,
+            IMPORT_OUTPUT_CONTENT_TYPES[self._format],
+        )
+        logger.info(
+            "Import task %s wrote %s rows to output artifact %s",
+            self._task_id,
+            self._rows_written,
+            object_name,
+        )
+        return storage.object_url(object_name)
+
+    def close(self) -> None:
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def discard(self) -> None:
+        self.close()
+        if self._file_path is not None:
+            try:
+                os.remove(self._file_path)
+            except FileNotFoundError:
+                pass
+            self._file_path = None
+
+    def _open(self) -> None:
+        if self._target_path is not None:
+            self._file_path = self._target_path
+        else:
+            with tempfile.NamedTemporaryFile(
+                prefix="orders-import-output-",
+                suffix=f".{self._format}",
+                delete=False,
+            ) as tmp_file:
+                self._file_path = tmp_file.name
+        if self._format == IMPORT_OUTPUT_FORMAT_CSV:
+            self._file = open(self._file_path, mode="w", encoding="utf-8", newline="")
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(
+                ["row_number", *self._fieldnames, *IMPORT_OUTPUT_COMPUTED_COLUMNS]
+            )
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [
+                ("row_number", pa.int64()),
+                *((name, pa.string()) for name in self._fieldnames),
+                ("reporting_code", pa.string()),
+                ("composite_tax_rate", pa.decimal128(7, 5)),
+                ("tax_amount", pa.decimal128(12, 2)),
+                ("total_amount", pa.decimal128(12, 2)),
+                ("status", pa.string()),
+            ]
+        )
+        self._parquet_writer = pq.ParquetWriter(self._file_path, schema, compression="zstd")
+
+    def _write_parquet(self, records: list[list[Any]]) -> None:
+        import pyarrow as pa
+
+        schema = self._parquet_writer.schema
+        arrays = []
+        for field, column in zip(schema, zip(*records)):
+            if pa.types.is_decimal(field.type):
+                column = [_quantize(value, field.type.scale) for value in column]
+            arrays.append(pa.array(column, type=field.type))
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+
+def _align_values(raw_values: list[str], width: int) -> list[str | None]:
+    if len(raw_values) == width:
+        return list(raw_values)
+    if len(raw_values) > width:
+        return list(raw_values[:width])
+    return [*raw_values, *([None] * (width - len(raw_values)))]
+
+
+def _quantize(value: Decimal | None, scale: int) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(value).quantize(Decimal(1).scaleb(-scale))
@@ -0,0 +1,69 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Mapping
+
+from tortoise.expressions import Q
+
+from src.services.orders.errors import OrdersCursorError
+
+ORDERS_CURSOR_VERSION = 1
+
+
+def orders_cursor_columns(sort_fields: tuple[str, ...]) -> tuple[str, ...]:
+    return ("id", sort_fields[0].lstrip("-"))
+
+
+def encode_orders_cursor(sort_fields: tuple[str, ...], row: Mapping[str, Any]) -> str:
+    sort_field = sort_fields[0]
+    value = row[sort_field.lstrip("-")]
+    payload = {
+        "v": ORDERS_CURSOR_VERSION,
+        "s": sort_field,
+        "k": value.isoformat() if isinstance(value, datetime) else str(value),
+        "id": row["id"],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def apply_orders_cursor(query, sort_fields: tuple[str, ...], cursor: str):
+    sort_field = sort_fields[0]
+    field_name = sort_field.lstrip("-")
+    key, last_id = _decode_orders_cursor(cursor=cursor, sort_field=sort_field)
+    if sort_field.startswith("-"):
+        return query.filter(
+            Q(**{f"{field_name}__lt": key}) | Q(**{field_name: key, "id__lt": last_id}),
+            **{f"{field_name}__lte": key},
+        )
+    return query.filter(
+        Q(**{f"{field_name}__gt": key}) | Q(**{field_name: key, "id__gt": last_id}),
+        **{f"{field_name}__gte": key},
+    )
+
+
+def _decode_orders_cursor(cursor: str, sort_field: str) -> tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["v"] != ORDERS_CURSOR_VERSION:
+            raise OrdersCursorError("Cursor version is not supported.")
+        if payload["s"] != sort_field:
+            raise OrdersCursorError("Cursor does not match the requested sort.")
+        last_id = int(payload["id"])
+        if sort_field.lstrip("-") == "timestamp":
+            return datetime.fromisoformat(payload["k"]), last_id
+        return Decimal(payload["k"]), last_id
+    except OrdersCursorError:
+        raise
+    except (
+        binascii.Error,
+        InvalidOperation,
+        KeyError,
+        TypeError,
+        UnicodeDecodeError,
+        ValueError,
+    ) as exc:
+        raise OrdersCursorError("Cursor is malformed.") from exc
@@ -0,0 +1,137 @@
+from datetime import datetime
+from decimal import Decimal
+
+import numpy
+
+from src.core.date_rules import ensure_min_supported_datetime
+
+IMPORT_REQUIRED_COLUMNS = ("longitude", "latitude", "timestamp", "subtotal")
+
+ImportColumns = dict[str, int]
+ParsedImportRow = tuple[float, float, datetime, Decimal]
+
+
+def resolve_import_columns(fieldnames: list[str] | None) -> ImportColumns:
+    if not fieldnames:
+        raise ValueError("CSV file is empty or has no header.")
+
+    normalized: dict[str, int] = {}
+    for idx, field in enumerate(fieldnames):
+        key = field.strip().lower().replace("_", "").replace(" ", "")
+        normalized.setdefault(key, idx)
+
+    missing = [key for key in IMPORT_REQUIRED_COLUMNS if key not in normalized]
+    if missing:
+        raise ValueError(f"Missing required CSV columns: {', '.join(missing)}")
+    return {key: normalized[key] for key in IMPORT_REQUIRED_COLUMNS}
+
+
+class ImportTimestampParser:
+    def __init__(self) -> None:
+        self._use_isoformat: bool | None = None
+
+    def parse(self, raw_timestamp: str) -> datetime:
+        if self._use_isoformat is False:
+            return parse_import_timestamp(raw_timestamp)
+
+        try:
+            parsed = datetime.fromisoformat(raw_timestamp)
+        except ValueError:
+            if self._use_isoformat is None:
+                self._use_isoformat = False
+            return parse_import_timestamp(raw_timestamp)
+
+        self._use_isoformat = True
+        ensure_min_supported_datetime(parsed, "timestamp")
+        return parsed
+
+
+def parse_import_timestamp(raw_timestamp: str) -> datetime:
+    clean = raw_timestamp.strip()
+    if not clean:
+        raise ValueError("timestamp is empty")
+
+    if "." not in clean:
+        parsed = datetime.fromisoformat(clean)
+        ensure_min_supported_datetime(parsed, "timestamp")
+        return parsed
+
+    base, rest = clean.split(".", 1)
+    tz_start = len(rest)
+    for marker in ("+", "-", "Z", "z"):
+        pos = rest.find(marker)
+        if pos != -1:
+            tz_start = min(tz_start, pos)
+    frac = rest[:tz_start]
+    tz = rest[tz_start:]
+    frac = (frac + "000000")[:6]
+    normalized = f"{base}.{frac}{tz}"
+    if normalized.endswith("Z") or normalized.endswith("z"):
+        normalized = f"{normalized[:-1]}+00:00"
+    parsed = datetime.fromisoformat(normalized)
+    ensure_min_supported_datetime(parsed, "timestamp")
+    return parsed
+
+
+def parse_import_row(
+    row: list[str],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+) -> ParsedImportRow:
+    longitude = float(row[columns["longitude"]])
+    latitude = float(row[columns["latitude"]])
+    timestamp = timestamp_parser.parse(row[columns["timestamp"]])
+    subtotal = Decimal(row[columns["subtotal"]])
+    if subtotal < 0:
+        raise ValueError("subtotal must be >= 0")
+    return latitude, longitude, timestamp, subtotal
+
+
+def parse_import_rows(
+    indexed_rows: list[tuple[int, list[str]]],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+) -> list[tuple[int, ParsedImportRow | None, Exception | None]]:
+    try:
+        longitudes = _parse_float_column(indexed_rows, columns["longitude"])
+        latitudes = _parse_float_column(indexed_rows, columns["latitude"])
+    except (ValueError, IndexError):
+        return [
+            _parse_import_row_safe(row_number, row, columns, timestamp_parser)
+            for row_number, row in indexed_rows
+        ]
+
+    timestamp_idx = columns["timestamp"]
+    subtotal_idx = columns["subtotal"]
+    parsed_rows: list[tuple[int, ParsedImportRow | None, Exception | None]] = []
+    for (row_number, row), longitude, latitude in zip(indexed_rows, longitudes, latitudes):
+        try:
+            timestamp = timestamp_parser.parse(row[timestamp_idx])
+            subtotal = Decimal(row[subtotal_idx])
+            if subtotal < 0:
+                raise ValueError("subtotal must be >= 0")
+        except Exception as exc:
+            parsed_rows.append((row_number, None, exc))
+            continue
+        parsed_rows.append((row_number, (latitude, longitude, timestamp, subtotal), None))
+    return parsed_rows
+
+
+def _parse_float_column(
+    indexed_rows: list[tuple[int, list[str]]],
+    column_idx: int,
+) -> list[float]:
+    raw_values = [row[column_idx] for _, row in indexed_rows]
+    return numpy.array(raw_values, dtype=numpy.float64).tolist()
+
+
+def _parse_import_row_safe(
+    row_number: int,
+    row: list[str],
+    columns: ImportColumns,
+    timestamp_parser: ImportTimestampParser,
+) -> tuple[int, ParsedImportRow | None, Exception | None]:
+    try:
+        return (row_number, parse_import_row(row, columns, timestamp_parser), None)
+    except Exception as exc:
+        return (row_number, None, exc)
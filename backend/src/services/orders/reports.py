@@ -0,0 +1,113 @@
+import asyncio
+import csv
+import logging
+import os
+import tempfile
+from typing import TextIO
+
+from src.core.storage import MinioStorage
+
+logger = logging.getLogger(__name__)
+
+IMPORT_ERROR_PARSE = "parse_error"
+IMPORT_ERROR_OUTSIDE_COVERAGE = "outside_coverage"
+IMPORT_ERROR_VALIDATION = "validation_error"
+IMPORT_ERROR_TAX_RATE_NOT_FOUND = "tax_rate_not_found"
+IMPORT_ERROR_UNEXPECTED = "unexpected_error"
+IMPORT_ERROR_LOG_SAMPLE_SIZE = 5
+IMPORT_ERROR_REPORT_HEADER = ("row_number", "reason", "detail")
+
+ImportRowFailure = tuple[str, Exception, list[str]]
+
+
+class ImportErrorReport:
+    def __init__(self, task_id: int, error_counts: dict[str, int] | None = None) -> None:
+        self._task_id = task_id
+        self._error_counts: dict[str, int] = dict(error_counts or {})
+        self._logged_counts: dict[str, int] = {}
+        self._fieldnames: list[str] = []
+        self._file: TextIO | None = None
+        self._writer = None
+        self._file_path: str | None = None
+        self._rows_written = 0
+
+    @property
+    def error_counts(self) -> dict[str, int]:
+        return dict(self._error_counts)
+
+    def set_fieldnames(self, fieldnames: list[str]) -> None:
+        self._fieldnames = list(fieldnames)
+
+    def add(self, row_number: int, failure: ImportRowFailure) -> None:
+        reason, error, raw_values = failure
+        self._error_counts[reason] = self._error_counts.get(reason, 0) + 1
+        self._log_sampled(row_number=row_number, reason=reason, error=error)
+
+        if self._writer is None:
+            self._open()
+        self._writer.writerow([row_number, reason, str(error), *raw_values])
+        self._rows_written += 1
+
+    async def upload(self, storage: MinioStorage, object_name: str) -> str | None:
+        if self._file is None:
+            return None
+        self._file.close()
+        if self._rows_written == 0:
+            return None
+        await asyncio.to_thread(
+            storage.upload_file,
+            object_name,
+            self._file_path,
+            "text/csv",
+        )
+        return storage.object_url(object_name)
+
+    def discard(self) -> None:
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self._file_path is not None:
+            try:
+                os.remove(self._file_path)
+            except FileNotFoundError:
+                pass
+            self._file_path = None
+
+    def log_summary(self) -> None:
+        if self._error_counts:
+            logger.info(
+                "Import task %s failed rows by reason: %s",
+                self._task_id,
+                self._error_counts,
+            )
+
+    def _open(self) -> None:
+        with tempfile.NamedTemporaryFile(
+            prefix="orders-import-errors-",
+            suffix=".csv",
+            delete=False,
+        ) as tmp_file:
+            self._file_path = tmp_file.name
+        self._file = open(self._file_path, mode="w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([*IMPORT_ERROR_REPORT_HEADER, *self._fieldnames])
+
+    def _log_sampled(self, row_number: int, reason: str, error: Exception) -> None:
+        logged = self._logged_counts.get(reason, 0)
+        if logged > IMPORT_ERROR_LOG_SAMPLE_SIZE:
+            return
+        self._logged_counts[reason] = logged + 1
+        if logged == IMPORT_ERROR_LOG_SAMPLE_SIZE:
+            logger.warning(
+                "Import task %s: further '%s' rows are only counted and written to the error report",
+                self._task_id,
+                reason,
+            )
+            return
+        logger.warning(
+            "Import task %s row %s failed (%s): %s",
+            self._task_id,
+            row_number,
+            reason,
+            error,
+            exc_info=error if reason == IMPORT_ERROR_UNEXPECTED and logged == 0 else None,
+        )
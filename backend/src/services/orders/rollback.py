@@ -0,0 +1,103 @@
+from src.models.file_task import FileTask
+from src.models.order import Order
+from src.services.orders.errors import ImportTaskBusyError, ImportTaskNotFoundError
+from src.services.orders.importer import (
+    FILE_TASK_STATUS_IN_PROGRESS,
+    FILE_TASK_STATUS_QUEUED,
+)
+from src.services.orders.scheduler import ImportScheduler
+
+FILE_TASK_STATUS_ROLLED_BACK = "rolled_back"
+IMPORT_ROLLBACK_BATCH_SIZE = 5000
+
+
+async def rollback_import_task(task_id: int) -> tuple[FileTask, int]:
+    task = await _get_idle_import_task(task_id)
+    deleted_orders = 0
+    for child in await FileTask.filter(parent_id=task.id):
+        deleted_orders += await delete_import_task_orders(child.id)
+        child.status = FILE_TASK_STATUS_ROLLED_BACK
+        await child.save(update_fields=["status", "updated_at"])
+    deleted_orders += await delete_import_task_orders(task.id)
+    task.status = FILE_TASK_STATUS_ROLLED_BACK
+    await task.save(update_fields=["status", "updated_at"])
+    return task, deleted_orders
+
+
+async def rerun_import_task(task_id: int, scheduler: ImportScheduler) -> tuple[FileTask, int]:
+    task = await _get_idle_import_task(task_id)
+    children = await FileTask.filter(parent_id=task.id)
+    deleted_orders = 0
+    for child in children:
+        deleted_orders += await _reset_import_task(child, FILE_TASK_STATUS_QUEUED)
+    deleted_orders += await _reset_import_task(
+        task,
+        FILE_TASK_STATUS_IN_PROGRESS if children else FILE_TASK_STATUS_QUEUED,
+    )
+    for child in children:
+        scheduler.submit(task_id=child.id, user_id=child.user_id, total_rows=child.total_rows)
+    if not children:
+        if task.is_archive:
+            task.archive_members = None
+            await task.save(update_fields=["archive_members"])
+        scheduler.submit(task_id=task.id, user_id=task.user_id, total_rows=task.total_rows)
+    return task, deleted_orders
+
+
+async def _reset_import_task(task: FileTask, status: str) -> int:
+    deleted_orders = await delete_import_task_orders(task.id)
+    task.successful_rows = 0
+    task.failed_rows = 0
+    task.duplicate_rows = 0
+    task.status = status
+    task.duplicate_of_id = None
+    task.ranges = None
+    task.error_counts = None
+    task.error_report_path = None
+    task.error_message = None
+    task.output_path = None
+    task.metrics = None
+    await task.save(
+        update_fields=[
+            "successful_rows",
+            "failed_rows",
+            "duplicate_rows",
+            "status",
+            "duplicate_of_id",
+            "ranges",
+            "error_counts",
+            "error_report_path",
+            "error_message",
+            "output_path",
+            "metrics",
+            "updated_at",
+        ]
+    )
+    return deleted_orders
+
+
+async def delete_import_task_orders(task_id: int) -> int:
+    deleted_total = 0
+    while True:
+        order_ids = await (
+            Order.filter(file_task_id=task_id)
+            .order_by("id")
+            .limit(IMPORT_ROLLBACK_BATCH_SIZE)
+            .values_list("id", flat=True)
+        )
+        if not order_ids:
+            return deleted_total
+        deleted_total += await Order.filter(id__in=order_ids).delete()
+
+
+async def _get_idle_import_task(task_id: int) -> FileTask:
+    task = await FileTask.get_or_none(id=task_id)
+    if task is None:
+        raise ImportTaskNotFoundError(f"Import task {task_id} not found.")
+    if task.status in (FILE_TASK_STATUS_QUEUED, FILE_TASK_STATUS_IN_PROGRESS):
+        raise ImportTaskBusyError(f"Import task {task_id} is {task.status}.")
+    if task.parent_id is not None:
+        raise ImportTaskBusyError(
+            f"Import task {task_id} is part of archive task {task.parent_id}."
+        )
+    return task
@@ -0,0 +1,131 @@
+import json
+import sys
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from src.models.order import Order
+from src.services.orders.types import OrderComputedPayload
+
+
+class ImportOrderRow:
+    __slots__ = (
+        "latitude",
+        "longitude",
+        "subtotal",
+        "timestamp",
+        "reporting_code",
+        "jurisdictions",
+        "composite_tax_rate",
+        "tax_amount",
+        "total_amount",
+        "state_rate",
+        "county_rate",
+        "city_rate",
+        "special_rates",
+    )
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        subtotal: Decimal,
+        timestamp: datetime,
+        reporting_code: str,
+        jurisdictions: str,
+        composite_tax_rate: Decimal,
+        tax_amount: Decimal,
+        total_amount: Decimal,
+        state_rate: Decimal,
+        county_rate: Decimal,
+        city_rate: Decimal,
+        special_rates: Decimal,
+    ) -> None:
+        self.latitude = latitude
+        self.longitude = longitude
+        self.subtotal = subtotal
+        self.timestamp = timestamp
+        self.reporting_code = reporting_code
+        self.jurisdictions = jurisdictions
+        self.composite_tax_rate = composite_tax_rate
+        self.tax_amount = tax_amount
+        self.total_amount = total_amount
+        self.state_rate = state_rate
+        self.county_rate = county_rate
+        self.city_rate = city_rate
+        self.special_rates = special_rates
+
+    def insert_values(
+        self,
+        user_id: int,
+        file_task_id: int,
+        created_at: datetime,
+    ) -> tuple[Any, ...]:
+        return (
+            user_id,
+            file_task_id,
+            self.latitude,
+            self.longitude,
+            self.subtotal,
+            self.timestamp,
+            self.reporting_code,
+            self.jurisdictions,
+            self.composite_tax_rate,
+            self.tax_amount,
+            self.total_amount,
+            self.state_rate,
+            self.county_rate,
+            self.city_rate,
+            self.special_rates,
+            created_at,
+        )
+
+
+class ImportOrderRowBuilder:
+    def __init__(self) -> None:
+        self._jurisdictions_json: dict[str, str] = {}
+        self.row_bytes = 0
+
+    def build(self, computed: OrderComputedPayload) -> ImportOrderRow:
+        reporting_code = str(computed["reporting_code"])
+        jurisdictions = self._jurisdictions_json.get(reporting_code)
+        if jurisdictions is None:
+            jurisdictions = json.dumps(computed["jurisdictions"], separators=(",", ":"))
+            self._jurisdictions_json[reporting_code] = jurisdictions
+        row = ImportOrderRow(
+            latitude=computed["latitude"],
+            longitude=computed["longitude"],
+            subtotal=computed["subtotal"],
+            timestamp=computed["timestamp"],
+            reporting_code=reporting_code,
+            jurisdictions=jurisdictions,
+            composite_tax_rate=computed["composite_tax_rate"],
+            tax_amount=computed["tax_amount"],
+            total_amount=computed["total_amount"],
+            state_rate=computed["state_rate"],
+            county_rate=computed["county_rate"],
+            city_rate=computed["city_rate"],
+            special_rates=computed["special_rates"],
+        )
+        if not self.row_bytes:
+            self.row_bytes = _estimate_row_bytes(row)
+        return row
+
+
+def _order_insert_sql() -> str:
+    columns = ("user_id", "file_task_id", *ImportOrderRow.__slots__, "created_at")
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    placeholders = ", ".join(f"${idx}" for idx in range(1, len(columns) + 1))
+    return f'INSERT INTO "{Order._meta.db_table}" ({column_list}) VALUES ({placeholders})'
+
+
+IMPORT_ORDER_INSERT_SQL = _order_insert_sql()
+
+
+def _estimate_row_bytes(row: ImportOrderRow) -> int:
+    total = sys.getsizeof(row)
+    for name in ImportOrderRow.__slots__:
+        if name in ("jurisdictions", "reporting_code"):
+            continue
+        total += sys.getsizeof(getattr(row, name))
+    return total
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+IMPORT_SCHEDULER_PRIORITY_BURST = 4
+
+ImportLane = OrderedDict[int, deque[int]]
+
+
+class ImportScheduler:
+    def __init__(
+        self,
+        runner: Callable[..., Awaitable[None]],
+        max_concurrent: int,
+        small_file_rows: int,
+    ) -> None:
+        self._runner = runner
+        self._max_concurrent = max(1, max_concurrent)
+        self._small_file_rows = small_file_rows
+        self._priority_lane: ImportLane = OrderedDict()
+        self._regular_lane: ImportLane = OrderedDict()
+        self._priority_streak = 0
+        self._running: dict[int, asyncio.Task] = {}
+        self._closed = False
+
+    @property
+    def running_task_ids(self) -> set[int]:
+        return set(self._running)
+
+    def submit(self, task_id: int, user_id: int, total_rows: int) -> None:
+        if task_id in self._running or task_id in self.queue_positions():
+            return
+        lane = (
+            self._priority_lane
+            if total_rows <= self._small_file_rows
+            else self._regular_lane
+        )
+        lane.setdefault(user_id, deque()).append(task_id)
+        self._dispatch()
+
+    def queue_positions(self) -> dict[int, int]:
+        priority_lane = OrderedDict(
+            (user_id, deque(queue)) for user_id, queue in self._priority_lane.items()
+        )
+        regular_lane = OrderedDict(
+            (user_id, deque(queue)) for user_id, queue in self._regular_lane.items()
+        )
+        priority_streak = self._priority_streak
+        positions: dict[int, int] = {}
+        while True:
+            task_id, priority_streak = _pop_next(priority_lane, regular_lane, priority_streak)
+            if task_id is None:
+                return positions
+            positions[task_id] = len(positions) + 1
+
+    async def shutdown(self) -> None:
+        self._closed = True
+        workers = list(self._running.values())
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        while not self._closed and len(self._running) < self._max_concurrent:
+            task_id, self._priority_streak = _pop_next(
+                self._priority_lane,
+                self._regular_lane,
+                self._priority_streak,
+            )
+            if task_id is None:
+                return
+            self._running[task_id] = asyncio.create_task(self._run(task_id))
+
+    async def _run(self, task_id: int) -> None:
+        try:
+            await self._runner(task_id, scheduler=self)
+        except Exception:
+            logger.exception("Import task %s worker crashed", task_id)
+        finally:
+            self._running.pop(task_id, None)
+            self._dispatch()
+
+
+def _pop_next(
+    priority_lane: ImportLane,
+    regular_lane: ImportLane,
+    priority_streak: int,
+) -> tuple[int | None, int]:
+    if priority_lane and (
+        not regular_lane or priority_streak < IMPORT_SCHEDULER_PRIORITY_BURST
+    ):
+        return _pop_round_robin(priority_lane), priority_streak + 1
+    if regular_lane:
+        return _pop_round_robin(regular_lane), 0
+    return None, priority_streak
+
+
+def _pop_round_robin(lane: ImportLane) -> int:
+    user_id, queue = next(iter(lane.items()))
+    task_id = queue.popleft()
+    if queue:
+        lane.move_to_end(user_id)
+    else:
+        del lane[user_id]
+    return task_id
@@ -1,8 +1,10 @@
+from typing import Any
+
 from src.models.file_task import FileTask
 from src.models.order import Order
 from src.schemas.order import (
+    FileTaskMetricsRead,
     FileTaskRead,
-    OrderRead,
     OrderTaxCalculationResponse,
     OrderTaxPreviewResponse,
     TaxBreakdownResponse,
@@ -10,42 +12,78 @@ from src.schemas.order import (
 from src.services.orders.types import JurisdictionsPayload, OrderComputedPayload
 
 
-def to_order_read(order: Order) -> OrderRead:
-    author_login = None
-    if getattr(order, "user", None) is not None:
-        author_login = order.user.login
-    return OrderRead(
-        id=order.id,
-        author_user_id=order.user_id,
-        author_login=author_login,
-        latitude=order.latitude,
-        longitude=order.longitude,
-        subtotal=float(order.subtotal),
-        timestamp=order.timestamp,
-        reporting_code=order.reporting_code,
-        jurisdictions=order.jurisdictions or {},
-        composite_tax_rate=float(order.composite_tax_rate),
-        tax_amount=float(order.tax_amount),
-        total_amount=float(order.total_amount),
-        breakdown=TaxBreakdownResponse(
-            state_rate=float(order.state_rate),
-            county_rate=float(order.county_rate),
-            city_rate=float(order.city_rate),
-            special_rates=float(order.special_rates),
-        ),
-        created_at=order.created_at,
-    )
+ORDER_LIST_FIELD_COLUMNS: dict[str, tuple[str, ...]] = {
+    "id": ("id",),
+    "author_user_id": ("user_id",),
+    "author_login": ("user__login",),
+    "latitude": ("latitude",),
+    "longitude": ("longitude",),
+    "subtotal": ("subtotal",),
+    "timestamp": ("timestamp",),
+    "reporting_code": ("reporting_code",),
+    "jurisdictions": ("jurisdictions",),
+    "composite_tax_rate": ("composite_tax_rate",),
+    "tax_amount": ("tax_amount",),
+    "total_amount": ("total_amount",),
+    "breakdown": ("state_rate", "county_rate", "city_rate", "special_rates"),
+    "created_at": ("created_at",),
+}
+ORDER_LIST_FIELDS = tuple(ORDER_LIST_FIELD_COLUMNS)
+ORDER_LIST_FLOAT_FIELDS = ("subtotal", "composite_tax_rate", "tax_amount", "total_amount")
+
+
+def order_list_columns(fields: tuple[str, ...], extra_columns: tuple[str, ...] = ()) -> list[str]:
+    columns = dict.fromkeys(extra_columns)
+    for field in fields:
+        columns.update(dict.fromkeys(ORDER_LIST_FIELD_COLUMNS[field]))
+    return list(columns)
+
+
+def to_order_list_payload(row: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for field in fields:
+        if field == "author_user_id":
+            values[field] = row["user_id"]
+        elif field == "author_login":
+            values[field] = row["user__login"]
+        elif field == "jurisdictions":
+            values[field] = row["jurisdictions"] or {}
+        elif field == "breakdown":
+            values[field] = {
+                "state_rate": float(row["state_rate"]),
+                "county_rate": float(row["county_rate"]),
+                "city_rate": float(row["city_rate"]),
+                "special_rates": float(row["special_rates"]),
+            }
+        elif field in ORDER_LIST_FLOAT_FIELDS:
+            values[field] = float(row[field])
+        else:
+            values[field] = row[field]
+    return values
 
 
-def to_file_task_read(task: FileTask) -> FileTaskRead:
+def to_file_task_read(task: FileTask, queue_position: int | None = None) -> FileTaskRead:
     return FileTaskRead(
         id=task.id,
         user_id=task.user_id,
+        parent_id=task.parent_id,
+        duplicate_of_id=task.duplicate_of_id,
         file_path=task.file_path,
+        is_archive=task.is_archive,
+        archive_members=task.archive_members,
         total_rows=task.total_rows,
         successful_rows=task.successful_rows,
         failed_rows=task.failed_rows,
+        duplicate_rows=task.duplicate_rows,
+        skip_duplicates=task.skip_duplicates,
         status=task.status,
+        queue_position=queue_position,
+        error_counts=task.error_counts or {},
+        error_report_path=task.error_report_path,
+        error_message=task.error_message,
+        output_format=task.output_format,
+        output_path=task.output_path,
+        metrics=FileTaskMetricsRead.model_validate(task.metrics) if task.metrics else None,
         created_at=task.created_at,
         updated_at=task.updated_at,
     )
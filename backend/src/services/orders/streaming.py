@@ -0,0 +1,38 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import AsyncIterator, Awaitable, Callable
+
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+ORDERS_STREAM_CHUNK_SIZE = 1000
+
+DisconnectCheck = Callable[[], Awaitable[bool]]
+
+
+async def iter_query_chunks(
+    query,
+    chunk_size: int = ORDERS_STREAM_CHUNK_SIZE,
+    is_disconnected: DisconnectCheck | None = None,
+) -> AsyncIterator[list]:
+    sql = query.sql(params_inline=True)
+    async with Order._meta.db.acquire_connection() as connection:
+        async with connection.transaction(isolation="repeatable_read", readonly=True):
+            cursor = await connection.cursor(sql)
+            pending = asyncio.ensure_future(cursor.fetch(chunk_size))
+            try:
+                while True:
+                    rows = await pending
+                    if not rows:
+                        return
+                    if is_disconnected is not None and await is_disconnected():
+                        logger.info("Orders stream client disconnected, closing cursor")
+                        return
+                    pending = asyncio.ensure_future(cursor.fetch(chunk_size))
+                    yield rows
+            finally:
+                if not pending.done():
+                    with suppress(Exception, asyncio.CancelledError):
+                        await pending
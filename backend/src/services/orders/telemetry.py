@@ -0,0 +1,135 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from src.services.orders.batching import current_rss_bytes
+
+IMPORT_STAGE_DOWNLOAD = "download"
+IMPORT_STAGE_PARSE = "parse"
+IMPORT_STAGE_DEDUPE = "dedupe"
+IMPORT_STAGE_GEOLOCATE = "geolocate"
+IMPORT_STAGE_TAX_COMPUTE = "tax_compute"
+IMPORT_STAGE_DB_INSERT = "db_insert"
+IMPORT_STAGE_OUTPUT_WRITE = "output_write"
+IMPORT_STAGE_PROGRESS_WRITE = "progress_write"
+IMPORT_STAGE_COMPUTE = "compute"
+IMPORT_STAGES = (
+    IMPORT_STAGE_DOWNLOAD,
+    IMPORT_STAGE_PARSE,
+    IMPORT_STAGE_DEDUPE,
+    IMPORT_STAGE_GEOLOCATE,
+    IMPORT_STAGE_TAX_COMPUTE,
+    IMPORT_STAGE_DB_INSERT,
+    IMPORT_STAGE_OUTPUT_WRITE,
+    IMPORT_STAGE_PROGRESS_WRITE,
+)
+IMPORT_COMPUTE_STAGES = (
+    IMPORT_STAGE_PARSE,
+    IMPORT_STAGE_GEOLOCATE,
+    IMPORT_STAGE_TAX_COMPUTE,
+)
+
+
+class ImportTelemetry:
+    def __init__(self, metrics: dict[str, Any] | None = None) -> None:
+        previous = metrics or {}
+        previous_stages = previous.get("stage_seconds") or {}
+        self._stage_seconds = {
+            stage: float(previous_stages.get(stage, 0.0)) for stage in IMPORT_STAGES
+        }
+        self._compute_seconds = 0.0
+        self._compute_worker_seconds = dict.fromkeys(IMPORT_COMPUTE_STAGES, 0.0)
+        self._active_counts: dict[str, int] = {}
+        self._active_since: dict[str, float] = {}
+        self._elapsed_before = float(previous.get("elapsed_seconds", 0.0))
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.processed_bytes = 0
+        self._buffered_rows = 0
+        self._buffered_bytes = 0
+        self._peak_buffered_rows = int(previous.get("peak_buffered_rows", 0))
+        self._peak_buffer_bytes = int(previous.get("peak_buffer_bytes", 0))
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._add_locked(stage, seconds)
+
+    def add_compute_worker_seconds(self, stage_seconds: dict[str, float]) -> None:
+        with self._lock:
+            for stage, seconds in stage_seconds.items():
+                self._compute_worker_seconds[stage] += seconds
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        # Overlapping workers in the same stage count once: wall-clock while any is active.
+        with self._lock:
+            count = self._active_counts.get(stage, 0)
+            if count == 0:
+                self._active_since[stage] = time.perf_counter()
+            self._active_counts[stage] = count + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active_counts[stage] -= 1
+                if self._active_counts[stage] == 0:
+                    started_at = self._active_since.pop(stage)
+                    self._add_locked(stage, time.perf_counter() - started_at)
+
+    def _add_locked(self, stage: str, seconds: float) -> None:
+        if stage == IMPORT_STAGE_COMPUTE:
+            self._compute_seconds += seconds
+        else:
+            self._stage_seconds[stage] += seconds
+
+    @property
+    def buffered_bytes(self) -> int:
+        with self._lock:
+            return self._buffered_bytes
+
+    @contextmanager
+    def buffered(self, rows: int, row_bytes: int) -> Iterator[None]:
+        buffer_bytes = rows * row_bytes
+        with self._lock:
+            self._buffered_rows += rows
+            self._buffered_bytes += buffer_bytes
+            self._peak_buffered_rows = max(self._peak_buffered_rows, self._buffered_rows)
+            self._peak_buffer_bytes = max(self._peak_buffer_bytes, self._buffered_bytes)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._buffered_rows -= rows
+                self._buffered_bytes -= buffer_bytes
+
+    def snapshot(self, processed_rows: int) -> dict[str, Any]:
+        elapsed = self._elapsed_before + (time.monotonic() - self._started_at)
+        with self._lock:
+            now = time.perf_counter()
+            stage_seconds = dict(self._stage_seconds)
+            compute_seconds = self._compute_seconds
+            for stage, started_at in self._active_since.items():
+                if stage == IMPORT_STAGE_COMPUTE:
+                    compute_seconds += now - started_at
+                else:
+                    stage_seconds[stage] += now - started_at
+            worker_seconds = sum(self._compute_worker_seconds.values())
+            if worker_seconds > 0:
+                for stage, seconds in self._compute_worker_seconds.items():
+                    stage_seconds[stage] += compute_seconds * seconds / worker_seconds
+            peak_buffered_rows = self._peak_buffered_rows
+            peak_buffer_bytes = self._peak_buffer_bytes
+        processed_bytes = self.processed_bytes
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "processed_bytes": processed_bytes,
+            "rows_per_second": round(processed_rows / elapsed, 1) if elapsed > 0 else 0.0,
+            "bytes_per_second": round(processed_bytes / elapsed, 1) if elapsed > 0 else 0.0,
+            "stage_seconds": {
+                stage: round(seconds, 3) for stage, seconds in stage_seconds.items()
+            },
+            "peak_buffered_rows": peak_buffered_rows,
+            "peak_buffer_bytes": peak_buffer_bytes,
+            "process_rss_bytes": current_rss_bytes(),
+        }
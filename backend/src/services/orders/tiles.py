@@ -0,0 +1,134 @@
+import logging
+import math
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.models.order import Order
+from src.schemas.order import OrdersTileCell, OrdersTileResponse
+from src.services.orders.counts import ORDERS_DATA_VERSION_KEY, OrdersQueryFilters
+from src.services.orders.errors import OrdersTileError
+
+logger = logging.getLogger(__name__)
+
+ORDERS_TILE_GRID_SIZE = 16
+ORDERS_TILE_MAX_ZOOM = 20
+ORDERS_TILE_CACHE_KEY_PREFIX = "orders:tile"
+ORDERS_TILE_CACHE_TTL_SECONDS = 300
+
+ORDERS_TILE_SQL = """
+SELECT
+    cell_x,
+    cell_y,
+    COUNT(*) AS orders,
+    COALESCE(SUM(tax_amount), 0) AS tax_amount,
+    COALESCE(SUM(total_amount), 0) AS total_amount,
+    AVG(latitude) AS latitude,
+    AVG(longitude) AS longitude
+FROM (
+    SELECT
+        LEAST(GREATEST(FLOOR(
+            ((o.longitude + 180.0) / 360.0 * {scale} - {x}) * {grid}
+        ), 0), {grid} - 1)::int AS cell_x,
+        LEAST(GREATEST(FLOOR(
+            ((1.0 - LN(TAN(RADIANS(o.latitude)) + 1.0 / COS(RADIANS(o.latitude))) / PI())
+            / 2.0 * {scale} - {y}) * {grid}
+        ), 0), {grid} - 1)::int AS cell_y,
+        o.tax_amount,
+        o.total_amount,
+        o.latitude,
+        o.longitude
+    FROM ({inner}) AS o
+) AS cells
+GROUP BY cell_x, cell_y
+ORDER BY cell_y, cell_x
+"""
+
+
+def orders_tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    if not 0 <= z <= ORDERS_TILE_MAX_ZOOM:
+        raise OrdersTileError(f"z must be between 0 and {ORDERS_TILE_MAX_ZOOM}")
+    scale = 1 << z
+    if not (0 <= x < scale and 0 <= y < scale):
+        raise OrdersTileError(f"x and y must be between 0 and {scale - 1} at zoom {z}")
+    lon_min = x / scale * 360.0 - 180.0
+    lon_max = (x + 1) / scale * 360.0 - 180.0
+    lat_max = _tile_latitude(y, scale)
+    lat_min = _tile_latitude(y + 1, scale)
+    return lat_min, lat_max, lon_min, lon_max
+
+
+async def build_orders_tile(
+    query,
+    filters: OrdersQueryFilters,
+    z: int,
+    x: int,
+    y: int,
+    redis_client: Redis | None,
+) -> OrdersTileResponse:
+    lat_min, lat_max, lon_min, lon_max = orders_tile_bounds(z, x, y)
+
+    cache_key: str | None = None
+    if redis_client is not None:
+        try:
+            version = await redis_client.get(ORDERS_DATA_VERSION_KEY) or "0"
+            cache_key = (
+                f"{ORDERS_TILE_CACHE_KEY_PREFIX}:{version}:{filters.cache_key()}:{z}/{x}/{y}"
+            )
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return OrdersTileResponse.model_validate_json(cached)
+        except RedisError:
+            logger.warning("Orders tile cache lookup failed")
+            cache_key = None
+
+    inner = query.filter(
+        latitude__gte=lat_min,
+        latitude__lte=lat_max,
+        longitude__gte=lon_min,
+        longitude__lte=lon_max,
+    ).values("latitude", "longitude", "tax_amount", "total_amount")
+    rows = await Order._meta.db.execute_query_dict(
+        ORDERS_TILE_SQL.format(
+            scale=1 << z,
+            x=x,
+            y=y,
+            grid=ORDERS_TILE_GRID_SIZE,
+            inner=inner.sql(params_inline=True),
+        )
+    )
+    cells = [
+        OrdersTileCell(
+            cell_x=row["cell_x"],
+            cell_y=row["cell_y"],
+            orders=row["orders"],
+            tax_amount=float(row["tax_amount"]),
+            total_amount=float(row["total_amount"]),
+            latitude=float(row["latitude"]),
+            longitude=float(row["longitude"]),
+        )
+        for row in rows
+    ]
+    response = OrdersTileResponse(
+        z=z,
+        x=x,
+        y=y,
+        grid_size=ORDERS_TILE_GRID_SIZE,
+        total_orders=sum(cell.orders for cell in cells),
+        cells=cells,
+    )
+
+    if cache_key is not None:
+        try:
+            await redis_client.set(
+                cache_key,
+                response.model_dump_json(),
+                ex=ORDERS_TILE_CACHE_TTL_SECONDS,
+            )
+        except RedisError:
+            logger.warning("Failed to store orders tile in cache")
+    return response
+
+
+def _tile_latitude(y: int, scale: int) -> float:
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / scale))))
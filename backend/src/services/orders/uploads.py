@@ -0,0 +1,102 @@
+import csv
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import BinaryIO
+
+import zstandard
+
+from src.services.orders.compression import (
+    IMPORT_HEADER_BYTES,
+    compression_from_header,
+    is_archive_header,
+    open_decompressed_stream,
+)
+
+IMPORT_UPLOAD_READ_BYTES = 1024 * 1024
+IMPORT_UPLOAD_ESTIMATED_ROW_BYTES = 64
+
+
+def count_csv_rows(stream: BinaryIO) -> int:
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    total = 0
+    try:
+        for _ in csv.reader(text_stream):
+            total += 1
+    except UnicodeDecodeError:
+        return 0
+    finally:
+        text_stream.detach()
+    if total == 0:
+        return 0
+    return max(total - 1, 0)
+
+
+@dataclass(frozen=True)
+class ImportUploadDigest:
+    content_hash: str
+    size: int
+    total_rows: int
+    compression: str | None
+    is_archive: bool = False
+
+
+class _HashingReader(io.RawIOBase):
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._stream.read(len(buffer))
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._digest.update(chunk)
+        self.size += size
+        return size
+
+    def drain(self) -> None:
+        buffer = bytearray(IMPORT_UPLOAD_READ_BYTES)
+        while self.readinto(buffer):
+            pass
+
+
+def inspect_import_upload(stream: BinaryIO) -> ImportUploadDigest:
+    stream.seek(0)
+    digest = inspect_import_stream(stream)
+    stream.seek(0)
+    return digest
+
+
+def inspect_import_stream(stream: BinaryIO) -> ImportUploadDigest:
+    reader = _HashingReader(stream)
+    buffered = io.BufferedReader(reader, buffer_size=IMPORT_UPLOAD_READ_BYTES)
+    header = buffered.peek(IMPORT_HEADER_BYTES)[:IMPORT_HEADER_BYTES]
+    is_archive = is_archive_header(header)
+    compression = None if is_archive else compression_from_header(header)
+    total_rows = 0
+    if not is_archive:
+        try:
+            total_rows = count_csv_rows(open_decompressed_stream(buffered, compression))
+        except (OSError, EOFError, zstandard.ZstdError):
+            total_rows = 0
+    buffered.detach()
+    reader.drain()
+    return ImportUploadDigest(
+        content_hash=reader.hexdigest,
+        size=reader.size,
+        total_rows=total_rows,
+        compression=compression,
+        is_archive=is_archive,
+    )
+
+
+def estimate_import_rows(size: int) -> int:
+    return size // IMPORT_UPLOAD_ESTIMATED_ROW_BYTES
@@ -1,4 +1,7 @@
-from src.services.tax.bootstrap import build_tax_services_from_database
+from src.services.tax.bootstrap import (
+    build_tax_services_from_database,
+    build_tax_services_from_static,
+)
 from src.services.tax.reporting_code import ReportingCodeByCoordinatesService
 from src.services.tax.tax_rate import TaxRateBreakdown, TaxRateByReportingCodeService
 
@@ -7,4 +10,5 @@ __all__ = (
     "TaxRateByReportingCodeService",
     "ReportingCodeByCoordinatesService",
     "build_tax_services_from_database",
+    "build_tax_services_from_static",
 )
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 import shapefile
 
@@ -12,6 +12,7 @@ from src.services.tax.tax_rate import TaxRateByReportingCodeService
 
 CITY_REGION_TYPE = "city"
 COUNTY_REGION_TYPE = "county"
+STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
 
 
 def _chunked(items: list, size: int) -> Iterable[list]:
@@ -23,7 +24,13 @@ def _load_tax_regions_from_shp(
     shp_path: Path,
     region_type: str,
 ) -> list[TaxRegion]:
-    regions: list[TaxRegion] = []
+    return [
+        TaxRegion(region_type=region_type, **row) for row in _read_tax_region_rows(shp_path)
+    ]
+
+
+def _read_tax_region_rows(shp_path: Path) -> list[dict[str, Any]]:
+    regions: list[dict[str, Any]] = []
     reader = shapefile.Reader(str(shp_path))
     try:
         for shape_record in reader.iterShapeRecords():
@@ -36,16 +43,15 @@ def _load_tax_regions_from_shp(
                 continue
             bbox = shape.bbox
             regions.append(
-                TaxRegion(
-                    region_type=region_type,
-                    reporting_code=reporting_code,
-                    bbox_min_lon=float(bbox[0]),
-                    bbox_min_lat=float(bbox[1]),
-                    bbox_max_lon=float(bbox[2]),
-                    bbox_max_lat=float(bbox[3]),
-                    points=[[float(x), float(y)] for x, y in shape.points],
-                    parts=[int(part) for part in shape.parts],
-                )
+                {
+                    "reporting_code": reporting_code,
+                    "bbox_min_lon": float(bbox[0]),
+                    "bbox_min_lat": float(bbox[1]),
+                    "bbox_max_lon": float(bbox[2]),
+                    "bbox_max_lat": float(bbox[3]),
+                    "points": [[float(x), float(y)] for x, y in shape.points],
+                    "parts": [int(part) for part in shape.parts],
+                }
             )
     finally:
         reader.close()
@@ -84,32 +90,44 @@ async def _seed_tax_rates_if_needed(static_dir: Path) -> None:
     if existing_count > 0:
         return
 
+    to_insert = [TaxRate(**row) for row in _read_tax_rate_rows(static_dir)]
+    for chunk in _chunked(to_insert, 500):
+        await TaxRate.bulk_create(chunk)
+
+
+def _read_tax_rate_rows(static_dir: Path) -> list[dict[str, Any]]:
     raw = json.loads((static_dir / "ny_tax_rates.json").read_text(encoding="utf-8"))
     if not isinstance(raw, dict):
         raise ValueError("Tax rates JSON root must be an object.")
 
-    to_insert: list[TaxRate] = []
+    rows: list[dict[str, Any]] = []
     for raw_code, raw_payload in raw.items():
         reporting_code = normalize_reporting_code(str(raw_code))
         jurisdictions = TaxRateByReportingCodeService.parse_rate_payload(
             raw_payload=raw_payload,
             code=reporting_code,
         )
-        to_insert.append(
-            TaxRate(
-                reporting_code=reporting_code,
-                jurisdictions=jurisdictions,
-            )
-        )
+        rows.append({"reporting_code": reporting_code, "jurisdictions": jurisdictions})
+    return rows
 
-    for chunk in _chunked(to_insert, 500):
-        await TaxRate.bulk_create(chunk)
+
+def build_tax_services_from_static(
+    static_dir: Path = STATIC_DIR,
+) -> tuple[ReportingCodeByCoordinatesService, TaxRateByReportingCodeService]:
+    reporting_code_service = ReportingCodeByCoordinatesService.from_rows(
+        city_rows=_read_tax_region_rows(static_dir / "shapefiles" / "Cities.shp"),
+        county_rows=_read_tax_region_rows(static_dir / "shapefiles" / "Counties.shp"),
+    )
+    tax_rate_service = TaxRateByReportingCodeService.from_rows(
+        rows=_read_tax_rate_rows(static_dir),
+    )
+    return reporting_code_service, tax_rate_service
 
 
 async def build_tax_services_from_database() -> tuple[
     ReportingCodeByCoordinatesService, TaxRateByReportingCodeService
 ]:
-    static_dir = Path(__file__).resolve().parents[2] / "static"
+    static_dir = STATIC_DIR
 
     await _seed_tax_regions_if_needed(static_dir=static_dir)
     await _seed_tax_rates_if_needed(static_dir=static_dir)
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+from tortoise import Tortoise
+from tortoise.models import MetaInfo
+
+from src.core.config import settings
+from src.core.database import init_db
+from tests.fakes import FakeOrdersDb, FakeRedis
+
+
+@pytest.fixture
+def redis_client() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def orders_db(monkeypatch) -> FakeOrdersDb:
+    db = FakeOrdersDb()
+    monkeypatch.setattr(MetaInfo, "db", property(lambda meta: db))
+    return db
+
+
+@pytest.fixture
+def orders_sql(monkeypatch) -> FakeOrdersDb:
+    # Tortoise compiles Postgres SQL without opening a connection.
+    monkeypatch.setattr(settings, "db_generate_schemas", False)
+    asyncio.run(init_db())
+    db = FakeOrdersDb()
+    db.sql_client = Tortoise.get_connection("default")
+    monkeypatch.setattr(MetaInfo, "db", property(lambda meta: db))
+    yield db
+    Tortoise._reset_apps()
+    Tortoise._inited = False
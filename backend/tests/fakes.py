@@ -0,0 +1,161 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from tortoise import Tortoise
+
+from src.services.orders.batching import create_import_batch_sizers
+from src.services.orders.importer import _flush_pending_import_batch
+from src.services.orders.rows import ImportOrderRow
+from src.services.orders.telemetry import ImportTelemetry
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value, ex: int | None = None, nx: bool = False) -> bool | None:
+        if nx and key in self.values:
+            return None
+        self.values[key] = str(value)
+        return True
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.values)
+
+    async def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.values.get(key, "0")) + 1
+        self.values[key] = str(value)
+        return value
+
+
+class FakeCursor:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.fetches = 0
+
+    async def fetch(self, size: int) -> list:
+        chunk = self.rows[self.fetches * size : (self.fetches + 1) * size]
+        self.fetches += 1
+        return chunk
+
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor) -> None:
+        self._cursor = cursor
+
+    @asynccontextmanager
+    async def transaction(self, **_):
+        yield
+
+    async def cursor(self, sql: str) -> FakeCursor:
+        return self._cursor
+
+
+class FakeOrdersDb:
+    def __init__(self) -> None:
+        self.inserted: list[tuple] = []
+        self.cursor = FakeCursor([])
+        self.sql_client = None
+
+    def __getattr__(self, name: str):
+        if self.sql_client is None:
+            raise AttributeError(name)
+        return getattr(self.sql_client, name)
+
+    async def execute_many(self, sql: str, values: list[tuple]) -> None:
+        self.inserted.extend(values)
+
+    @asynccontextmanager
+    async def acquire_connection(self):
+        yield FakeConnection(self.cursor)
+
+
+def import_order_row() -> ImportOrderRow:
+    return ImportOrderRow(
+        latitude=40.7,
+        longitude=-73.9,
+        subtotal=Decimal("100.00"),
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        reporting_code="8081",
+        jurisdictions="{}",
+        composite_tax_rate=Decimal("0.08875"),
+        tax_amount=Decimal("8.88"),
+        total_amount=Decimal("108.88"),
+        state_rate=Decimal("0.04000"),
+        county_rate=Decimal("0.04500"),
+        city_rate=Decimal("0.00000"),
+        special_rates=Decimal("0.00375"),
+    )
+
+
+async def flush_import_rows(redis_client, rows: list[ImportOrderRow]) -> int:
+    inserted_count, _ = await _flush_pending_import_batch(
+        task_id=1,
+        task_user_id=1,
+        pending_rows=rows,
+        pending_failed_rows=0,
+        row_bytes=0,
+        telemetry=ImportTelemetry(),
+        insert_sizer=create_import_batch_sizers(
+            compute_initial=1000,
+            insert_initial=500,
+        ).insert,
+        fingerprint_filter=None,
+        redis_client=redis_client,
+    )
+    return inserted_count
+
+
+@asynccontextmanager
+async def sqlite_database():
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={
+            "models": [
+                "src.models.user",
+                "src.models.order",
+                "src.models.file_task",
+                "src.models.tax_region",
+                "src.models.tax_rate",
+            ]
+        },
+    )
+    await Tortoise.generate_schemas()
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
+        Tortoise._reset_apps()
+        Tortoise._inited = False
+
+
+class FakeStorage:
+    bucket = "orders"
+
+    def __init__(self, objects: dict[str, bytes], fail_uploads: set[str] = frozenset()) -> None:
+        self.objects = dict(objects)
+        self.fail_uploads = fail_uploads
+
+    def object_url(self, object_name: str) -> str:
+        return f"http://minio/{self.bucket}/{object_name}"
+
+    def download_object_to_file(self, object_name: str, file_path: str) -> str:
+        with open(file_path, "wb") as file:
+            file.write(self.objects[object_name])
+        return file_path
+
+    def upload_stream(self, object_name: str, stream, length: int, content_type: str) -> str:
+        if any(object_name.endswith(name) for name in self.fail_uploads):
+            raise OSError(f"upload of {object_name} failed")
+        self.objects[object_name] = stream.read()
+        return object_name
+
+    def remove_object(self, object_name: str) -> None:
+        self.objects.pop(object_name, None)
@@ -0,0 +1,93 @@
+import asyncio
+import io
+import zipfile
+
+from src.models.file_task import FileTask
+from src.models.user import User
+from src.services.orders import FILE_TASK_STATUS_FAILED, FILE_TASK_STATUS_IN_PROGRESS
+from src.services.orders.archives import expand_import_archive
+from tests.fakes import FakeStorage, sqlite_database
+
+CSV_BODY = b"latitude,longitude,timestamp,subtotal\n40.7,-73.9,2025-03-01T00:00:00Z,10.00\n"
+
+
+class RecordingScheduler:
+    def __init__(self) -> None:
+        self.submitted: list[int] = []
+
+    def submit(self, task_id: int, user_id: int, total_rows: int) -> None:
+        self.submitted.append(task_id)
+
+
+def _zip_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+async def _expand(storage: FakeStorage, scheduler: RecordingScheduler) -> FileTask:
+    user = await User.create(login="importer", password_hash="x")
+    task = await FileTask.create(
+        user_id=user.id,
+        file_path="http://minio/orders/imports/orders.zip",
+        is_archive=True,
+        status=FILE_TASK_STATUS_IN_PROGRESS,
+    )
+    await expand_import_archive(task=task, storage=storage, scheduler=scheduler)
+    return await FileTask.get(id=task.id)
+
+
+def test_corrupt_archive_fails_parent():
+    async def scenario() -> None:
+        async with sqlite_database():
+            scheduler = RecordingScheduler()
+            storage = FakeStorage({"imports/orders.zip": b"PK\x03\x04 not a zip"})
+
+            parent = await _expand(storage, scheduler)
+
+            assert parent.status == FILE_TASK_STATUS_FAILED
+            assert parent.error_message.startswith("Failed to expand archive:")
+            assert parent.archive_members is None
+            assert await FileTask.filter(parent_id=parent.id).count() == 0
+            assert scheduler.submitted == []
+
+    asyncio.run(scenario())
+
+
+def test_failed_member_upload_removes_created_children():
+    async def scenario() -> None:
+        async with sqlite_database():
+            scheduler = RecordingScheduler()
+            storage = FakeStorage(
+                {"imports/orders.zip": _zip_bytes({"a.csv": CSV_BODY, "b.csv": CSV_BODY})},
+                fail_uploads={"b.csv"},
+            )
+
+            parent = await _expand(storage, scheduler)
+
+            assert parent.status == FILE_TASK_STATUS_FAILED
+            assert "upload of" in parent.error_message
+            assert await FileTask.filter(parent_id=parent.id).count() == 0
+            assert list(storage.objects) == ["imports/orders.zip"]
+            assert scheduler.submitted == []
+
+    asyncio.run(scenario())
+
+
+def test_expanded_children_are_submitted_after_every_member_uploads():
+    async def scenario() -> None:
+        async with sqlite_database():
+            scheduler = RecordingScheduler()
+            storage = FakeStorage(
+                {"imports/orders.zip": _zip_bytes({"a.csv": CSV_BODY, "b.csv": CSV_BODY})}
+            )
+
+            parent = await _expand(storage, scheduler)
+
+            children = await FileTask.filter(parent_id=parent.id).values_list("id", flat=True)
+            assert parent.archive_members == 2
+            assert sorted(scheduler.submitted) == sorted(children)
+
+    asyncio.run(scenario())
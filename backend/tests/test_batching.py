@@ -0,0 +1,36 @@
+from src.services.orders import batching
+from src.services.orders.batching import AdaptiveBatchSizer, create_import_batch_sizers
+from src.services.orders.telemetry import ImportTelemetry
+
+
+def _sizer(buffered_bytes) -> AdaptiveBatchSizer:
+    return AdaptiveBatchSizer(
+        initial=1000,
+        minimum=100,
+        maximum=10000,
+        target_seconds=1.0,
+        memory_limit_bytes=1024 * 1024,
+        buffered_bytes=buffered_bytes,
+    )
+
+
+def test_large_process_rss_does_not_pin_batches_to_minimum(monkeypatch):
+    monkeypatch.setattr(batching, "current_rss_bytes", lambda: 8 * 1024**3)
+    sizer = _sizer(lambda: 0)
+
+    assert sizer.observe(rows=1000, seconds=0.5) > 1000
+
+
+def test_import_buffer_over_limit_halves_batches():
+    telemetry = ImportTelemetry()
+    sizers = create_import_batch_sizers(
+        compute_initial=4000,
+        insert_initial=2000,
+        buffered_bytes=lambda: telemetry.buffered_bytes,
+    )
+    row_bytes = 512 * 1024 * 1024
+
+    with telemetry.buffered(rows=1, row_bytes=row_bytes):
+        assert sizers.compute.observe(rows=4000, seconds=0.01) == 2000
+        assert sizers.insert.observe(rows=2000, seconds=0.01) == 1000
+    assert sizers.compute.observe(rows=2000, seconds=0.01) > 2000
@@ -0,0 +1,84 @@
+import asyncio
+import struct
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from src.api.deps import get_current_user
+from src.core.authorities import READ_ORDERS
+from src.main import app
+from src.services.orders import ORDERS_COORDINATES_BINARY_MEDIA_TYPE
+from src.services.orders.streaming import iter_query_chunks
+from tests.fakes import FakeCursor
+
+httpx = pytest.importorskip("httpx")
+
+POINTS = [(40.5, -74.25), (42.75, -73.5), (44.0, -75.125)]
+
+
+def _get_coordinates(accept: str | None) -> "httpx.Response":
+    async def request() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = {"Accept": accept} if accept else {}
+            return await client.get(
+                "/orders/stream/coordinates",
+                params={"reporting_code": "8081"},
+                headers=headers,
+            )
+
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        authorities=[READ_ORDERS],
+        is_active=True,
+    )
+    try:
+        return asyncio.run(request())
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_coordinates_route_streams_binary_frames(orders_sql):
+    orders_sql.cursor = FakeCursor(POINTS)
+
+    response = _get_coordinates(f"{ORDERS_COORDINATES_BINARY_MEDIA_TYPE}, application/x-ndjson;q=0.5")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ORDERS_COORDINATES_BINARY_MEDIA_TYPE
+    body = response.content
+    (count,) = struct.unpack_from("<I", body)
+    assert count == len(POINTS)
+    assert list(struct.iter_unpack("<ff", body[4:])) == POINTS
+
+
+def test_coordinates_route_falls_back_to_ndjson(orders_sql):
+    orders_sql.cursor = FakeCursor(POINTS)
+
+    response = _get_coordinates(None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert lines == [{"lat": lat, "lon": lon} for lat, lon in POINTS]
+
+
+def test_query_chunks_stop_fetching_after_disconnect(orders_db):
+    orders_db.cursor = FakeCursor([(40.0 + idx, -74.0) for idx in range(10)])
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    async def consume() -> list[list]:
+        nonlocal disconnected
+        chunks = []
+        query = SimpleNamespace(sql=lambda params_inline: "SELECT latitude, longitude")
+        async for rows in iter_query_chunks(query, chunk_size=2, is_disconnected=is_disconnected):
+            chunks.append(rows)
+            disconnected = True
+        return chunks
+
+    chunks = asyncio.run(consume())
+
+    assert chunks == [[(40.0, -74.0), (41.0, -74.0)]]
+    assert orders_db.cursor.fetches == 2
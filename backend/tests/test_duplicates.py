@@ -0,0 +1,32 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.services.orders.duplicates import OrderFingerprintFilter, order_fingerprint
+
+
+def test_naive_timestamp_is_fingerprinted_as_utc():
+    naive = datetime(2025, 1, 1, 12, 30)
+    assert order_fingerprint(40.7, -73.9, naive, Decimal("10")) == order_fingerprint(
+        40.7,
+        -73.9,
+        naive.replace(tzinfo=timezone.utc),
+        Decimal("10.00"),
+    )
+    assert order_fingerprint(40.7, -73.9, naive, Decimal("10")) == order_fingerprint(
+        40.7,
+        -73.9,
+        datetime(2025, 1, 1, 7, 30, tzinfo=timezone(timedelta(hours=-5))),
+        Decimal("10"),
+    )
+
+
+def test_unseeded_filter_confirms_every_row_in_the_db(redis_client):
+    async def scenario() -> None:
+        fingerprint_filter = OrderFingerprintFilter(redis_client=redis_client, user_id=1)
+        await redis_client.set("order-fingerprints:v1:1:seeding", "1")
+        fingerprints = [order_fingerprint(40.7, -73.9, datetime(2025, 1, 1), Decimal("1"))]
+        assert await fingerprint_filter.contains_many(fingerprints) == [True]
+        assert not await redis_client.exists("order-fingerprints:v1:1:seeded")
+
+    asyncio.run(scenario())
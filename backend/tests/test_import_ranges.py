@@ -0,0 +1,139 @@
+import asyncio
+import csv
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.orders import importer
+from src.services.orders.parsing import resolve_import_columns
+from src.services.orders.reports import IMPORT_ERROR_PARSE, ImportErrorReport
+from src.services.orders.telemetry import ImportTelemetry
+
+
+def test_failed_range_cancels_sibling_ranges(tmp_path, monkeypatch):
+    file_path = tmp_path / "orders.csv"
+    file_path.write_text("latitude,longitude,timestamp,subtotal\n")
+    cancelled: list[int] = []
+
+    async def fake_process_import_range(range_index: int, **_) -> None:
+        if range_index == 0:
+            await asyncio.sleep(0)
+            raise RuntimeError("insert failed")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(range_index)
+            raise
+
+    monkeypatch.setattr(importer, "_process_import_range", fake_process_import_range)
+
+    async def scenario() -> None:
+        await importer._process_import_ranges(
+            task=SimpleNamespace(id=1, user_id=1, skip_duplicates=False),
+            file_path=str(file_path),
+            progress=SimpleNamespace(ranges_count=3),
+            error_report=ImportErrorReport(task_id=1),
+            telemetry=ImportTelemetry(),
+            batch_sizers=None,
+            row_builder=None,
+            fingerprint_filter=None,
+            output_writer=None,
+            redis_client=None,
+        )
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert exc_info.group_contains(RuntimeError)
+    assert sorted(cancelled) == [1, 2]
+
+
+def _range_rows(file_path: str, ranges: list[dict[str, int]]) -> list[tuple[int, list[str]]]:
+    indexed_rows: list[tuple[int, list[str]]] = []
+    with open(file_path, mode="rb") as stream:
+        for state in ranges:
+            stream.seek(state["start"])
+            batch, offset = importer._read_import_range_batch(
+                stream=stream,
+                end=state["end"],
+                batch_size=10_000,
+                first_row_number=state["first_row"],
+            )
+            assert offset == state["end"]
+            indexed_rows.extend(batch)
+    return indexed_rows
+
+
+def test_range_row_numbers_skip_blank_lines_like_sequential_import(tmp_path, monkeypatch):
+    monkeypatch.setattr(importer, "IMPORT_RANGE_MIN_BYTES", 64)
+    monkeypatch.setattr(importer, "IMPORT_NEWLINE_SCAN_BYTES", 50)
+    lines = ["latitude,longitude,timestamp,subtotal"]
+    for idx in range(60):
+        lines.append(f"40.7{idx:02d},-74.0,2025-01-01 00:00:00,{idx}.00")
+        if idx % 7 == 0:
+            lines.append("")
+        if idx % 11 == 0:
+            lines.append("\r")
+    file_path = tmp_path / "orders.csv"
+    file_path.write_bytes(("\n".join(lines)).encode("utf-8"))
+
+    with open(file_path, newline="") as text_stream:
+        reader = csv.reader(text_stream)
+        next(reader)
+        expected = list(enumerate((row for row in reader if row), start=1))
+
+    _, data_start = importer._read_import_header(str(file_path))
+    ranges = importer._plan_import_ranges(str(file_path), data_start, max_ranges=8)
+
+    assert len(ranges) > 1
+    assert _range_rows(str(file_path), ranges) == expected
+
+
+def test_quoted_newlines_fall_back_to_sequential_import(tmp_path, monkeypatch):
+    monkeypatch.setattr(importer, "IMPORT_RANGE_MIN_BYTES", 64)
+    lines = ["latitude,longitude,timestamp,subtotal,note"]
+    for idx in range(40):
+        lines.append(f'40.7,-74.0,2025-01-01 00:00:00,{idx}.00,"say ""hi"""')
+    lines.insert(30, '40.7,-74.0,2025-01-01 00:00:00,1.00,"two\nlines"')
+    file_path = tmp_path / "orders.csv"
+    file_path.write_text("\n".join(lines) + "\n")
+
+    _, data_start = importer._read_import_header(str(file_path))
+
+    assert importer._plan_import_ranges(str(file_path), data_start, max_ranges=4) is None
+
+
+def test_range_batch_is_computed_in_worker_process(tmp_path):
+    file_path = tmp_path / "orders.csv"
+    file_path.write_text(
+        "id,longitude,latitude,timestamp,subtotal\n"
+        "1,-73.9857,40.7484,2025-11-04 10:17:04.915257248,50.00\n"
+        "\n"
+        "2,-73.9857,40.7484,2025-11-04 10:17:04,not-a-number\n"
+    )
+    fieldnames, data_start = importer._read_import_header(str(file_path))
+
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=importer._init_range_worker,
+        initargs=(resolve_import_columns(fieldnames),),
+    ) as executor:
+        indexed_rows, row_outcomes, offset, stage_seconds = executor.submit(
+            importer._compute_import_range_batch,
+            str(file_path),
+            data_start,
+            file_path.stat().st_size,
+            100,
+            7,
+        ).result(timeout=60)
+
+    assert offset == file_path.stat().st_size
+    assert [row_number for row_number, _ in indexed_rows] == [7, 8]
+    (first_number, computed, first_failure), (second_number, missing, failure) = row_outcomes
+    assert (first_number, first_failure) == (7, None)
+    assert computed["tax_amount"] > 0
+    assert (second_number, missing) == (8, None)
+    assert failure[0] == IMPORT_ERROR_PARSE
+    assert set(stage_seconds) == {"parse", "geolocate", "tax_compute"}
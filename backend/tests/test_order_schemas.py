@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from src.schemas.order import OrderListItem, OrderListSparseItem, OrdersListResponse
+from src.services.orders import ORDER_LIST_FIELDS, to_order_list_payload
+
+
+def _order_row() -> dict:
+    created_at = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    return {
+        "id": 1,
+        "user_id": 7,
+        "user__login": "admin",
+        "latitude": 40.7,
+        "longitude": -73.9,
+        "subtotal": "100.00",
+        "timestamp": created_at,
+        "reporting_code": "8081",
+        "jurisdictions": {"state_rate": [{"name": "New York State", "rate": 0.04}]},
+        "composite_tax_rate": "0.08875",
+        "tax_amount": "8.88",
+        "total_amount": "108.88",
+        "state_rate": "0.04",
+        "county_rate": "0.045",
+        "city_rate": "0",
+        "special_rates": "0.00375",
+        "created_at": created_at,
+    }
+
+
+def test_full_order_list_item_requires_every_field():
+    item = OrderListItem(**to_order_list_payload(_order_row(), ORDER_LIST_FIELDS))
+    assert item.breakdown.county_rate == 0.045
+
+    with pytest.raises(ValidationError):
+        OrderListItem(**to_order_list_payload(_order_row(), ("id", "latitude", "longitude")))
+
+
+def test_sparse_fields_validate_against_sparse_item():
+    payload = to_order_list_payload(_order_row(), ("id", "latitude", "longitude"))
+    response = OrdersListResponse(total=1, limit=1, offset=0, items=[payload])
+
+    assert isinstance(response.items[0], OrderListSparseItem)
+    assert response.model_dump(exclude_unset=True)["items"] == [payload]
@@ -0,0 +1,40 @@
+import asyncio
+
+from src.services.orders.counts import OrdersQueryFilters, count_orders
+from tests.fakes import flush_import_rows, import_order_row
+
+
+class FakeCountQuery:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.calls = 0
+
+    async def count(self) -> int:
+        self.calls += 1
+        return self.total
+
+
+def test_exact_count_is_cached_between_inserts(redis_client):
+    async def scenario() -> None:
+        query = FakeCountQuery(total=10)
+        filters = OrdersQueryFilters(reporting_code="8081")
+        assert await count_orders(query, filters, "exact", redis_client) == 10
+        query.total = 11
+        assert await count_orders(query, filters, "exact", redis_client) == 10
+        assert query.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_import_insert_flush_invalidates_cached_count(redis_client, orders_db):
+    async def scenario() -> None:
+        query = FakeCountQuery(total=10)
+        filters = OrdersQueryFilters()
+        assert await count_orders(query, filters, "exact", redis_client) == 10
+
+        query.total = 11
+        await flush_import_rows(redis_client, [import_order_row()])
+        assert await count_orders(query, filters, "exact", redis_client) == 11
+        assert query.calls == 2
+
+    asyncio.run(scenario())
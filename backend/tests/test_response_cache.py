@@ -0,0 +1,99 @@
+import asyncio
+
+from starlette.requests import Request
+
+from src.api.caching import lookup_cached_response
+from src.services.orders import importer
+from src.services.orders.telemetry import ImportTelemetry
+from tests.fakes import flush_import_rows, import_order_row
+
+
+def _request(query: str = "", etag: str | None = None) -> Request:
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/orders",
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+async def _list_orders_etag(redis_client, query: str = "limit=50") -> str:
+    cached = await lookup_cached_response(_request(query), redis_client, "orders:list")
+    response = await cached.respond({"items": []})
+    return response.headers["etag"]
+
+
+def test_etag_is_stable_without_inserts(redis_client):
+    async def scenario() -> None:
+        assert await _list_orders_etag(redis_client) == await _list_orders_etag(redis_client)
+
+    asyncio.run(scenario())
+
+
+def test_import_insert_flush_changes_etag(redis_client, orders_db):
+    async def scenario() -> None:
+        before = await _list_orders_etag(redis_client)
+        assert await flush_import_rows(redis_client, [import_order_row(), import_order_row()]) == 2
+        assert len(orders_db.inserted) == 2
+        assert await _list_orders_etag(redis_client) != before
+
+    asyncio.run(scenario())
+
+
+def test_stale_etag_is_not_revalidated_after_insert(redis_client, orders_db):
+    async def scenario() -> None:
+        etag = await _list_orders_etag(redis_client)
+        revalidated = await lookup_cached_response(
+            _request("limit=50", etag=etag), redis_client, "orders:list"
+        )
+        assert revalidated.hit is not None
+        assert revalidated.hit.status_code == 304
+
+        await flush_import_rows(redis_client, [import_order_row()])
+        stale = await lookup_cached_response(
+            _request("limit=50", etag=etag), redis_client, "orders:list"
+        )
+        assert stale.hit is None
+
+    asyncio.run(scenario())
+
+
+def test_empty_flush_keeps_etag(redis_client, orders_db):
+    async def scenario() -> None:
+        before = await _list_orders_etag(redis_client)
+        assert await flush_import_rows(redis_client, []) == 0
+        assert await _list_orders_etag(redis_client) == before
+
+    asyncio.run(scenario())
+
+
+def test_progress_write_keeps_etag(redis_client, monkeypatch):
+    updates: list[dict] = []
+
+    class FakeFileTaskQuery:
+        async def update(self, **fields) -> None:
+            updates.append(fields)
+
+    monkeypatch.setattr(
+        importer.FileTask,
+        "filter",
+        classmethod(lambda cls, **_: FakeFileTaskQuery()),
+    )
+
+    async def scenario() -> None:
+        before = await _list_orders_etag(redis_client)
+        await importer._update_file_task_progress(
+            task_id=1,
+            successful_rows=10,
+            failed_rows=0,
+            status=importer.FILE_TASK_STATUS_IN_PROGRESS,
+            telemetry=ImportTelemetry(),
+        )
+        assert len(updates) == 1
+        assert await _list_orders_etag(redis_client) == before
+
+    asyncio.run(scenario())
@@ -0,0 +1,44 @@
+import threading
+import time
+
+from src.services.orders.telemetry import (
+    IMPORT_STAGE_COMPUTE,
+    IMPORT_STAGE_DB_INSERT,
+    IMPORT_STAGE_GEOLOCATE,
+    IMPORT_STAGE_TAX_COMPUTE,
+    ImportTelemetry,
+)
+
+
+def test_overlapping_workers_count_stage_wall_clock_once():
+    telemetry = ImportTelemetry()
+    barrier = threading.Barrier(4)
+
+    def insert() -> None:
+        with telemetry.measure(IMPORT_STAGE_DB_INSERT):
+            barrier.wait()
+            time.sleep(0.05)
+
+    workers = [threading.Thread(target=insert) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    stage_seconds = telemetry.snapshot(processed_rows=0)["stage_seconds"]
+    assert 0.05 <= stage_seconds[IMPORT_STAGE_DB_INSERT] < 0.15
+
+
+def test_compute_wall_clock_is_split_by_worker_share():
+    telemetry = ImportTelemetry()
+    with telemetry.measure(IMPORT_STAGE_COMPUTE):
+        for _ in range(4):
+            telemetry.add_compute_worker_seconds(
+                {IMPORT_STAGE_GEOLOCATE: 0.3, IMPORT_STAGE_TAX_COMPUTE: 0.1}
+            )
+        time.sleep(0.04)
+
+    stage_seconds = telemetry.snapshot(processed_rows=0)["stage_seconds"]
+    compute_seconds = stage_seconds[IMPORT_STAGE_GEOLOCATE] + stage_seconds[IMPORT_STAGE_TAX_COMPUTE]
+    assert 0.04 <= compute_seconds < 0.2
+    assert abs(stage_seconds[IMPORT_STAGE_GEOLOCATE] - compute_seconds * 0.75) <= 0.002
@@ -15,6 +15,8 @@ import type {
   UserUpdateRequest,
 } from '@/types'
 
+export const COORDINATES_BINARY_MEDIA_TYPE = 'application/vnd.ny-taxes.coordinates.f32'
+
 export const authApi = {
   login: (data: LoginRequest) => api.post<User>('/auth/login', data),
   register: (data: RegisterRequest) => api.post<User>('/auth/register', data),
@@ -47,6 +49,7 @@ export const ordersApi = {
   streamCoordinates: (params?: CoordinateStreamParams) =>
     fetch(`${BASE_URL}/orders/stream/coordinates${buildQueryString({ ...params })}`, {
       credentials: 'include',
+      headers: { Accept: `${COORDINATES_BINARY_MEDIA_TYPE}, application/x-ndjson;q=0.5` },
     }),
 
   importCsv: (file: File) =>
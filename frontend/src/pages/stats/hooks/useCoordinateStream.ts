@@ -1,5 +1,5 @@
 import { useEffect, useMemo, useRef, useState } from 'react'
-import { ordersApi } from '@/lib/endpoints'
+import { COORDINATES_BINARY_MEDIA_TYPE, ordersApi } from '@/lib/endpoints'
 import type { CoordinateStreamParams, OrderCoordinatePoint } from '@/types'
 
 interface UseCoordinateStreamResult {
@@ -63,25 +63,34 @@ export function useCoordinateStream(
         const reader = response.body?.getReader()
         if (!reader) throw new Error('No response body')
 
+        const isBinary = (response.headers.get('Content-Type') ?? '').startsWith(
+          COORDINATES_BINARY_MEDIA_TYPE,
+        )
         const decoder = new TextDecoder()
         let buffer = ''
+        let pending: Uint8Array = new Uint8Array(0)
 
         while (true) {
           const { done, value } = await reader.read()
           if (done) break
 
-          buffer += decoder.decode(value, { stream: true })
-          const lines = buffer.split('\n')
-          buffer = lines.pop() ?? ''
-
-          for (const line of lines) {
-            const trimmed = line.trim()
-            if (!trimmed) continue
-            try {
-              const point = JSON.parse(trimmed) as OrderCoordinatePoint
-              batch.push(point)
-            } catch {
-              // skip malformed lines
+          if (isBinary) {
+            pending = concatBytes(pending, value)
+            pending = readCoordinateFrames(pending, batch)
+          } else {
+            buffer += decoder.decode(value, { stream: true })
+            const lines = buffer.split('\n')
+            buffer = lines.pop() ?? ''
+
+            for (const line of lines) {
+              const trimmed = line.trim()
+              if (!trimmed) continue
+              try {
+                const point = JSON.parse(trimmed) as OrderCoordinatePoint
+                batch.push(point)
+              } catch {
+                // skip malformed lines
+              }
             }
           }
 
@@ -124,3 +133,30 @@ export function useCoordinateStream(
 
   return { points, isStreaming, error }
 }
+
+function concatBytes(head: Uint8Array, tail: Uint8Array): Uint8Array {
+  if (head.length === 0) return tail
+  const merged = new Uint8Array(head.length + tail.length)
+  merged.set(head)
+  merged.set(tail, head.length)
+  return merged
+}
+
+// Frame: uint32 LE point count, then count x (float32 LE lat, float32 LE lon)
+function readCoordinateFrames(bytes: Uint8Array, out: OrderCoordinatePoint[]): Uint8Array {
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+  let offset = 0
+  while (offset + 4 <= bytes.length) {
+    const count = view.getUint32(offset, true)
+    const frameEnd = offset + 4 + count * 8
+    if (frameEnd > bytes.length) break
+    for (let position = offset + 4; position < frameEnd; position += 8) {
+      out.push({
+        lat: view.getFloat32(position, true),
+        lon: view.getFloat32(position + 4, true),
+      })
+    }
+    offset = frameEnd
+  }
+  return bytes.slice(offset)
+}